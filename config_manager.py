@@ -76,7 +76,10 @@ class ConfigManager:
             "theme_mode": "Light",  # 默认白色
             "is_first_run": True,
             "agreement_version": "",
-            "sights_path": ""
+            "sights_path": "",
+            "manifest_backend": "json",
+            "import_filter": "voice",
+            "import_allow_patterns": []
         }
         self.load_config()
 
@@ -442,3 +445,72 @@ class ConfigManager:
         """
         self.config["agreement_version"] = version
         self.save_config()
+
+    def get_manifest_backend(self):
+        """
+        功能定位:
+        - 读取安装清单的存储后端配置。
+
+        输入输出:
+        - 参数: 无
+        - 返回: str，"json" 或 "sqlite"；非法值按 "json" 处理。
+        - 外部资源/依赖: self.config
+
+        实现逻辑:
+        - 从 self.config 读取 manifest_backend 并做取值校验；该项仅在 settings.json 中手动配置
+          （切换到 SQLite 时自动迁移 JSON 清单，迁移为单向，不提供界面切换）。
+
+        业务关联:
+        - 上游: main.py 初始化 CoreService 时读取。
+        - 下游: 决定 ManifestManager 使用 JSON 日志还是 SQLite 数据库。
+        """
+        backend = str(self.config.get("manifest_backend", "json") or "json").lower()
+        return backend if backend in ("json", "sqlite") else "json"
+
+    def get_import_filter(self):
+        """
+        功能定位:
+        - 读取语音包导入筛选方案与额外保留的文件名通配符。
+
+        输入输出:
+        - 参数: 无
+        - 返回: tuple[str, list[str]]，("voice" 或 "all", 通配符列表)；非法值按 "voice" 与空列表处理。
+        - 外部资源/依赖: self.config
+
+        实现逻辑:
+        - 读取 import_filter 与 import_allow_patterns 并做取值校验。
+
+        业务关联:
+        - 上游: main.py 初始化时读取。
+        - 下游: LibraryManager 导入时只解压 .bank、info/cover 与允许列表匹配的文件（voice），或全部解压（all）。
+        """
+        mode = str(self.config.get("import_filter", "voice") or "voice").lower()
+        patterns = self.config.get("import_allow_patterns") or []
+        if not isinstance(patterns, list):
+            patterns = []
+        return (mode if mode in ("voice", "all") else "voice"), [str(p) for p in patterns if str(p).strip()]
+
+    def set_import_filter(self, mode, patterns=None):
+        """
+        功能定位:
+        - 更新语音包导入筛选方案与允许列表并写入 settings.json。
+
+        输入输出:
+        - 参数:
+          - mode: str，"voice" 或 "all"。
+          - patterns: list[str] | None，额外保留的文件名通配符（如 "*.txt"）；None 表示保持不变。
+        - 返回: None
+        - 外部资源/依赖: CONFIG_FILE（写入）
+
+        实现逻辑:
+        - 非法方案按 "voice" 写入，空白通配符被丢弃，随后保存。
+
+        业务关联:
+        - 上游: 设置界面或手动配置。
+        - 下游: 下一次导入使用新的筛选方案。
+        """
+        mode = str(mode or "voice").lower()
+        self.config["import_filter"] = mode if mode in ("voice", "all") else "voice"
+        if patterns is not None:
+            self.config["import_allow_patterns"] = [str(p).strip() for p in patterns if str(p).strip()]
+        self.save_config()
@@ -3,7 +3,8 @@
 核心逻辑模块：游戏目录校验、自动定位、语音包安装与还原。
 
 功能定位:
-- 提供与 War Thunder 安装目录相关的核心操作，包括：校验游戏根目录、自动搜索路径、将语音包文件复制到 sound/mod、更新 config.blk 的 enable_mod 字段、还原纯净状态。
+- 提供与 War Thunder 安装目录相关的核心操作，包括：校验游戏根目录、自动搜索路径、将语音包文件复制到 sound/mod
+  （来自语音包库，或从 ZIP 直接流式写入）、更新 config.blk 的 enable_mod 字段、还原纯净状态。
 
 输入输出:
 - 输入: 游戏路径字符串、语音包库目录路径、安装文件夹选择列表、前端进度回调。
@@ -11,13 +12,14 @@
 - 外部资源/依赖:
   - 文件/目录: <game_root>/config.blk（读写）、<game_root>/config.blk.backup（写）、<game_root>/sound/mod（读写/清空）
   - 系统能力: Windows 注册表（SteamPath）、文件系统复制/删除、线程
-  - 其他模块: ManifestManager（安装清单读写与冲突追踪）
+  - 其他模块: ManifestManager（安装清单读写与冲突追踪）、TrashReclaimer（回收目录后台清理）、ZipExtractor（压缩包直接安装）
 
 实现逻辑:
 - 1) 校验或定位 game_root。
 - 2) 根据安装选择构建待复制文件清单并复制到 sound/mod。
 - 3) 更新 config.blk 中 enable_mod 开关，必要时进行备份与回滚。
-- 4) 还原时清空 sound/mod 子项并关闭 enable_mod，同时清空安装清单。
+- 4) 还原时将 sound/mod 子项重命名到同卷回收目录（用户可见的清空瞬间完成），关闭 enable_mod 并清空安装清单，
+     随后由 TrashReclaimer 在后台并行删除回收目录。
 
 业务关联:
 - 上游: 由 main.py 的桥接层 API 调用，触发来源为前端页面操作（路径选择、自动搜索、安装、还原）。
@@ -28,14 +30,22 @@ import shutil
 import threading
 import winreg
 import re
-import stat
+import zipfile
 from pathlib import Path
 from datetime import datetime
 from typing import List
-import json
 
 # 引入安装清单管理器
 from manifest_manager import ManifestManager
+from trash_reclaimer import TRASH_DIR_NAME, TrashReclaimer, remove_path
+from zip_extractor import (
+    ArchivePasswordIncorrect,
+    ArchivePasswordRequired,
+    ZipExtractor,
+    allocated_size,
+    check_disk_space,
+    is_junk_member,
+)
 
 
 class CoreService:
@@ -61,6 +71,12 @@ class CoreService:
         self.logger_callback = None
         # 安装清单管理器在 validate_game_path 校验通过后初始化
         self.manifest_mgr = None
+        # 安装清单存储后端："json"（默认）或 "sqlite"，由桥接层按配置设置
+        self.manifest_backend = "json"
+        # 回收目录后台清理器（还原时先重命名再回收）
+        self._trash = TrashReclaimer(self.log)
+        # 压缩包直接安装使用的解压引擎（成员名解码规则与语音包库导入一致）
+        self._zip_extractor = ZipExtractor(self.log)
 
     def validate_game_path(self, path_str):
         """
@@ -80,7 +96,8 @@ class CoreService:
         - 1) 检查 path_str 非空。
         - 2) 转换为 Path 并检查目录存在。
         - 3) 检查根目录下是否存在 config.blk。
-        - 4) 设置 game_root，并初始化 manifest_mgr。
+        - 4) 设置 game_root；同一目录与后端的 manifest_mgr 直接复用（避免每次操作前重新读取清单），否则重新创建。
+        - 5) 新建 manifest_mgr 时，比对 sound/mod 与清单并修复偏差；若回收目录中残留上次未清理完的内容，则在后台继续回收。
 
         业务关联:
         - 上游: 前端路径选择、自动搜索完成后写入配置前调用；安装/还原前调用。
@@ -91,10 +108,47 @@ class CoreService:
         if not path.exists(): return False, "路径不存在"
         if not (path / "config.blk").exists(): return False, "缺少 config.blk"
         self.game_root = path
+        mgr = self.manifest_mgr
+        if mgr and mgr.game_root == path and mgr.backend == self.manifest_backend:
+            return True, "校验通过"
+        if mgr:
+            mgr.close()
         # 初始化安装清单管理器（用于记录本次安装文件与冲突检测）
-        self.manifest_mgr = ManifestManager(self.game_root)
+        self.manifest_mgr = ManifestManager(self.game_root, backend=self.manifest_backend)
+        self._reconcile_manifest()
+        self._trash.resume(self._trash_root())
         return True, "校验通过"
 
+    def _reconcile_manifest(self):
+        """
+        功能定位:
+        - 加载清单后比对 sound/mod 实际文件，修复被外部工具或游戏改动造成的清单偏差。
+
+        输入输出:
+        - 参数: 无
+        - 返回: dict | None，ManifestManager.reconcile 的结果；失败时返回 None。
+        - 外部资源/依赖: ManifestManager.reconcile
+
+        实现逻辑:
+        - 调用 reconcile（仅比对 size/mtime，毫秒级），存在偏差时输出汇总日志。
+
+        业务关联:
+        - 上游: validate_game_path 新建清单管理器时（启动/切换游戏目录）。
+        - 下游: 已安装列表与冲突检测基于修复后的清单。
+        """
+        try:
+            report = self.manifest_mgr.reconcile()
+        except Exception as e:
+            self.log(f"清单校对失败: {e}", "WARN")
+            return None
+        if report["orphaned"] or report["missing"] or report["modified"]:
+            self.log(
+                f"sound/mod 与安装清单不一致（已修复清单）: 未登记 {len(report['orphaned'])} 个，"
+                f"缺失 {len(report['missing'])} 个，被修改 {len(report['modified'])} 个",
+                "WARN",
+            )
+        return report
+
     def set_callbacks(self, log_cb):
         """
         功能定位:
@@ -285,56 +339,45 @@ class CoreService:
         - 参数:
           - path_obj: str | Path，目标路径。
         - 返回: None
-        - 外部资源/依赖: 文件系统、stat（处理只读属性）
+        - 外部资源/依赖: trash_reclaimer.remove_path
 
         实现逻辑:
-        - 1) 若为文件/符号链接，优先 unlink；PermissionError 时尝试 chmod 可写后再删。
-        - 2) 若为目录，使用 shutil.rmtree；onerror 回调中尝试 chmod 可写后重试。
-        - 3) 删除失败时抛出异常给调用方处理。
+        - 委托 remove_path 执行删除；删除失败时抛出异常给调用方处理。
 
         业务关联:
-        - 上游: restore_game。
+        - 上游: restore_game（无法重命名到回收目录的条目就地删除）。
         - 下游: 实际移除游戏 mod 文件。
         """
-        p = Path(path_obj)
-        try:
-            if p.is_file() or p.is_symlink():
-                try:
-                    p.unlink()
-                    return
-                except PermissionError:
-                    try:
-                        os.chmod(p, stat.S_IWRITE)
-                    except Exception:
-                        pass
-                    p.unlink()
-                    return
-            if p.is_dir():
-                def _onerror(func, path, exc_info):
-                    try:
-                        os.chmod(path, stat.S_IWRITE)
-                    except Exception:
-                        pass
-                    func(path)
+        remove_path(path_obj)
 
-                shutil.rmtree(p, onerror=_onerror)
-        except Exception as e:
-            raise e
+    def _trash_root(self):
+        """返回与 sound/mod 位于同一卷的回收目录路径（<game_root>/sound/.aimerwt_trash）。"""
+        return self.game_root / "sound" / TRASH_DIR_NAME
 
     def get_installed_mods(self) -> List[str]:
+        """
+        功能定位:
+        - 返回安装清单中已安装的语音包名称列表。
+
+        输入输出:
+        - 参数: 无
+        - 返回: list[str]；清单未初始化或读取失败时返回空列表。
+        - 外部资源/依赖: ManifestManager.snapshot（缓存快照）
+
+        实现逻辑:
+        - 读取 manifest_mgr 的快照；清单未变化时不访问磁盘。
+
+        业务关联:
+        - 上游: main.py 的 init_app_state 等前端状态查询。
+        - 下游: 前端已安装标记。
+        """
+        if not self.manifest_mgr:
+            return []
         try:
-            with open(self.manifest_mgr.manifest_file, "r", encoding="utf-8") as f:
-                _mods = json.loads(f.read())
-                _installed_mods = _mods.get("installed_mods", {})
-                if not _installed_mods:
-                    return []
-                else:
-                    self.log(f"已读取 {len(_installed_mods)} 个mods", "INFO")
-                    return [mod_id for mod_id in _installed_mods.keys()]
-        except FileNotFoundError:
-            self.log(f"读取已安装mods失败，文件不存在：{self.manifest_mgr.manifest_file}", "ERROR")
-        except json.decoder.JSONDecodeError:
-            self.log(f"读取已安装mods失败，文件解析错误：{self.manifest_mgr.manifest_file}", "ERROR")
+            return list(self.manifest_mgr.snapshot()["installed_mods"])
+        except Exception as e:
+            self.log(f"读取已安装mods失败: {e}", "WARN")
+            return []
 
     # --- 核心：安装逻辑 (V2.2 - 文件夹直拷) ---
     def install_from_library(self, source_mod_path, install_list=None, progress_callback=None):
@@ -428,8 +471,9 @@ class CoreService:
                 progress_callback(15, f"共 {total_files_to_copy} 个文件待安装")
 
             total_files = 0
-            # 收集本次安装的目标文件名，用于写入安装清单
+            # 收集本次安装的目标文件名与文件明细，用于写入安装清单
             installed_files_record = []
+            installed_files_details = {}
             folder_files_count = {}  # 用于统计每个文件夹的文件数
 
             # 进度计算：10% 预检，15-95% 复制文件，95-100% 更新配置
@@ -442,6 +486,13 @@ class CoreService:
                     shutil.copy2(src_file, dest_file)
                     total_files += 1
                     installed_files_record.append(dest_file.name)
+                    try:
+                        st = dest_file.stat()
+                        installed_files_details[dest_file.name] = {
+                            "size": st.st_size, "mtime": st.st_mtime, "method": "copy"
+                        }
+                    except OSError:
+                        pass
 
                     # 统计每个文件夹的文件数
                     if folder_rel_path not in folder_files_count:
@@ -467,30 +518,217 @@ class CoreService:
             for folder_path, count in folder_files_count.items():
                 self.log(f"[OK] 已合并导入 [{folder_path}] ({count} 个文件)", "INFO")
 
-            # 写入安装清单记录（mod -> 文件名列表）
-            if self.manifest_mgr and total_files > 0:
-                try:
-                    self.manifest_mgr.record_installation(source_mod_path.name, installed_files_record)
-                    self.log("已更新安装清单记录", "INFO")
-                except Exception as e:
-                    self.log(f"更新清单失败: {e}", "WARN")
+            # 3. 写入安装清单并更新配置
+            self._finish_install(source_mod_path.name, installed_files_record, installed_files_details, progress_callback)
+
+        except Exception as e:
+            self.log(f"[ERROR] 安装过程严重错误: {e}", "ERROR")
+            if progress_callback:
+                progress_callback(100, "安装失败")
+            # 不向上抛出异常；由日志与回调向调用方传达失败信息
+
+    def _finish_install(self, mod_name, installed_files, file_details, progress_callback=None):
+        """
+        功能定位:
+        - 安装收尾：写入安装清单记录并启用 config.blk 中的 mod 开关。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，写入清单的语音包名称。
+          - installed_files: list[str]，本次写入 sound/mod 的目标文件名。
+          - file_details: dict[str, dict]，文件名 -> {size, mtime, method}。
+          - progress_callback: Callable[[int, str], None] | None，进度回调（95 -> 100）。
+        - 返回: None
+        - 外部资源/依赖: ManifestManager.record_installation、_update_config_blk
+
+        实现逻辑:
+        - 1) 有写入文件时记录清单；清单写入失败只写 WARN，不影响安装结果。
+        - 2) 更新 config.blk 并输出完成日志。
+
+        业务关联:
+        - 上游: install_from_library、install_from_archive。
+        - 下游: 冲突检测与还原清理依据清单记录；游戏按 enable_mod 加载 sound/mod。
+        """
+        if self.manifest_mgr and installed_files:
+            try:
+                self.manifest_mgr.record_installation(mod_name, installed_files, file_details)
+                self.log("已更新安装清单记录", "INFO")
+            except Exception as e:
+                self.log(f"更新清单失败: {e}", "WARN")
+
+        if progress_callback:
+            progress_callback(95, "更新游戏配置...")
+
+        self._update_config_blk()
+
+        if progress_callback:
+            progress_callback(100, "安装完成")
+
+        self.log(f"[DONE] 安装完成！本次覆盖/新增 {len(installed_files)} 个文件。", "SUCCESS")
+
+    def install_from_archive(self, archive_path, install_list=None, progress_callback=None, password_provider=None, mod_name=None):
+        """
+        功能定位:
+        - 不经过语音包库，直接把 ZIP 中选中文件夹的成员流式写入 <game_root>/sound/mod（用于临时试用语音包）。
+
+        输入输出:
+        - 参数:
+          - archive_path: str | Path，ZIP 压缩包路径；语音包名称取文件名（不含扩展名）。
+          - install_list: list[str] | None，压缩包内的相对文件夹列表（与 LibraryManager.inspect_archive 的 folders[].path 一致）；
+            特殊值 "根目录" 表示整个压缩包。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - password_provider: Callable[[Path, str], str | None] | None，密码提供器；reason 取值 required/incorrect。
+          - mod_name: str | None，写入安装清单的语音包名称；None 时取压缩包文件名（冷存储归档传入语音包名）。
+        - 返回: None
+        - 外部资源/依赖:
+          - 文件: ZIP 压缩包（只读）、<game_root>/sound/mod（写入）、config.blk、安装清单
+          - 模块: ZipExtractor.extract_to
+
+        实现逻辑:
+        - 1) 读取中央目录，按 install_list 选出文件成员（与 install_from_library 的 os.walk 语义一致：包含子目录），
+             目标为 sound/mod/<文件名>；同名文件以后出现者为准，与复制覆盖顺序一致。
+        - 2) 按未压缩大小做磁盘空间预检（扣除将被覆盖的同名文件）。
+        - 3) extract_to 将成员解压后直接写入目标文件，不产生库目录中的中间副本（读写量约为先导入再安装的一半）。
+        - 4) 需要密码时通过 password_provider 重试；用户取消时终止安装。
+        - 5) 写入中途失败时，已完整写入的文件（大小一致且在本次开始后修改）仍写入清单，保证还原时可被清理。
+        - 6) 与 install_from_library 相同的收尾：安装清单记录（method 为 archive）与 config.blk 更新。
 
+        业务关联:
+        - 上游: main.py 的 install_archive 桥接接口；install_mod 安装冷存储中的语音包。
+        - 下游: 游戏 sound/mod 内容与 config.blk 开关；清单记录供冲突检测与还原使用。
+        """
+        import time
+        archive_path = Path(archive_path)
+        mod_name = mod_name or archive_path.stem
+        try:
+            self.log(f"准备从压缩包直接安装: {archive_path.name}", "INSTALL")
             if progress_callback:
-                progress_callback(95, "更新游戏配置...")
+                progress_callback(5, f"准备安装: {mod_name}")
 
-            # 3. 更新配置
-            self._update_config_blk()
+            if not self.game_root:
+                raise Exception("未设置游戏路径")
+            if archive_path.suffix.lower() != ".zip":
+                raise Exception("直接安装仅支持 ZIP 压缩包，其他格式请先导入语音包库")
+            if not archive_path.is_file():
+                raise Exception(f"文件不存在: {archive_path}")
+            if not install_list:
+                self.log("未选择任何文件夹，跳过安装。", "WARN")
+                if progress_callback:
+                    progress_callback(100, "未选择文件")
+                return
 
+            game_mod_dir = self.game_root / "sound" / "mod"
+            game_mod_dir.mkdir(parents=True, exist_ok=True)
             if progress_callback:
-                progress_callback(100, "安装完成")
+                progress_callback(10, "读取压缩包目录...")
 
-            self.log(f"[DONE] 安装完成！本次覆盖/新增 {total_files} 个文件。", "SUCCESS")
+            with zipfile.ZipFile(archive_path, "r") as zf:
+                entries = [
+                    (name, int(m.file_size or 0))
+                    for m, name in zip(zf.infolist(), self._zip_extractor.member_names(zf))
+                    if not m.is_dir() and not is_junk_member(name)
+                ]
+
+            # 目标文件名 -> (成员名, 大小, 来源文件夹)
+            selected = {}
+            for folder_rel_path in install_list:
+                prefix = "" if folder_rel_path == "根目录" else str(folder_rel_path).strip("/") + "/"
+                matched = 0
+                for name, size in entries:
+                    if not name.startswith(prefix):
+                        continue
+                    base = name.rsplit("/", 1)[-1]
+                    if base in ("", ".", ".."):
+                        continue
+                    selected[base] = (name, size, folder_rel_path)
+                    matched += 1
+                if not matched:
+                    self.log(f"[WARN] 找不到源文件夹: {folder_rel_path}", "WARN")
+
+            if not selected:
+                self.log("未找到任何可安装的文件。", "WARN")
+                if progress_callback:
+                    progress_callback(100, "没有文件")
+                return
+
+            overwritten = []
+            for base in selected:
+                try:
+                    overwritten.append((game_mod_dir / base).stat().st_size)
+                except OSError:
+                    pass
+            check_disk_space(
+                game_mod_dir,
+                allocated_size(size for _name, size, _folder in selected.values()),
+                freed=allocated_size(overwritten),
+            )
+
+            if progress_callback:
+                progress_callback(15, f"共 {len(selected)} 个文件待安装")
+            targets = {name: game_mod_dir / base for base, (name, _size, _folder) in selected.items()}
+
+            started = time.time()
+            password = None
+            canceled = False
+            error = None
+            try:
+                while True:
+                    try:
+                        self._zip_extractor.extract_to(
+                            archive_path, targets, progress_callback, 15, 80, password=password, label="安装"
+                        )
+                        break
+                    except ArchivePasswordRequired:
+                        if not password_provider:
+                            raise
+                        password = password_provider(archive_path, "required")
+                    except ArchivePasswordIncorrect:
+                        self.log("密码错误，请重试", "WARN")
+                        if not password_provider:
+                            raise
+                        password = password_provider(archive_path, "incorrect")
+                    if password is None:
+                        canceled = True
+                        break
+            except Exception as e:
+                error = e
+
+            # 只统计本次完整写入的文件（大小一致且在开始后修改），失败或取消时也写入清单以便还原清理
+            installed_files_record = []
+            installed_files_details = {}
+            folder_files_count = {}
+            for base, (_name, size, folder_rel_path) in selected.items():
+                try:
+                    st = (game_mod_dir / base).stat()
+                except OSError:
+                    continue
+                if st.st_size != size or st.st_mtime < started - 2:
+                    continue
+                installed_files_record.append(base)
+                installed_files_details[base] = {"size": st.st_size, "mtime": st.st_mtime, "method": "archive"}
+                folder_files_count[folder_rel_path] = folder_files_count.get(folder_rel_path, 0) + 1
+
+            if error is not None or canceled:
+                if self.manifest_mgr and installed_files_record:
+                    try:
+                        self.manifest_mgr.record_installation(mod_name, installed_files_record, installed_files_details)
+                    except Exception as e:
+                        self.log(f"更新清单失败: {e}", "WARN")
+                if error is not None:
+                    raise error
+                self.log("[WARN] 已取消输入密码，安装已终止", "WARN")
+                if progress_callback:
+                    progress_callback(100, "已取消")
+                return
+
+            for folder_path, count in folder_files_count.items():
+                self.log(f"[OK] 已从压缩包安装 [{folder_path}] ({count} 个文件)", "INFO")
+            self._finish_install(mod_name, installed_files_record, installed_files_details, progress_callback)
 
         except Exception as e:
             self.log(f"[ERROR] 安装过程严重错误: {e}", "ERROR")
             if progress_callback:
                 progress_callback(100, "安装失败")
-            # 不向上抛出异常；由日志与回调向调用方传达失败信息
 
     def restore_game(self):
         """
@@ -501,14 +739,15 @@ class CoreService:
         - 参数: 无
         - 返回: None
         - 外部资源/依赖:
-          - 目录: <game_root>/sound/mod（遍历并删除子项）
+          - 目录: <game_root>/sound/mod（遍历并移出子项）、<game_root>/sound/.aimerwt_trash（回收目录）
           - 文件: <game_root>/config.blk（写入 enable_mod:b=no）、.manifest.json（删除或重置）
 
         实现逻辑:
         - 1) 校验 game_root 已设置。
-        - 2) 遍历 mod_dir 的子项，对每个子项执行删除边界校验并删除。
-        - 3) 清空安装清单记录。
-        - 4) 调用 _disable_config_mod 将 enable_mod 置为 no。
+        - 2) 遍历 mod_dir 的子项，执行删除边界校验后重命名到回收目录（同卷 rename，近似瞬时）。
+        - 3) 重命名失败的子项（如被占用）回退为就地删除。
+        - 4) 清空安装清单记录，并调用 _disable_config_mod 将 enable_mod 置为 no。
+        - 5) 启动后台回收，实际删除回收目录中的文件；中途退出时下次校验路径会继续回收。
 
         业务关联:
         - 上游: 前端“还原纯净”操作触发。
@@ -521,14 +760,24 @@ class CoreService:
             mod_dir = self.game_root / "sound" / "mod"
             if mod_dir.exists():
                 self.log("正在清空 mod 文件夹内容...", "CLEAN")
-                # 遍历并删除文件夹内的所有内容，但不删除文件夹本身
+                # 收集文件夹内的所有内容（不包含文件夹本身），删除前进行边界校验
+                # 清单自身的存储文件（如 SQLite 数据库）由 clear_manifest 处理，不移入回收目录
+                keep = set()
+                if self.manifest_mgr:
+                    keep = {p.name for p in self.manifest_mgr.storage_files()}
+                items = []
                 for item in mod_dir.iterdir():
+                    if item.name in keep:
+                        continue
+                    if not self._is_safe_deletion_path(item):
+                        self.log(f"🚫 [安全拦截] 拒绝删除保护文件: {item}", "WARN")
+                        continue
+                    items.append(item)
+
+                # 先整体重命名到回收目录，用户可见的清空立即完成
+                _moved, failed = self._trash.move_to_trash(items, self._trash_root())
+                for item in failed:
                     try:
-                        # 删除前进行边界校验，确保删除目标位于 sound/mod 目录内部
-                        if not self._is_safe_deletion_path(item):
-                            self.log(f"🚫 [安全拦截] 拒绝删除保护文件: {item}", "WARN")
-                            continue
-
                         self._remove_path(item)
                     except Exception as e:
                         self.log(f"无法删除 {item.name}: {e}", "WARN")
@@ -538,6 +787,8 @@ class CoreService:
                 self.manifest_mgr.clear_manifest()
 
             self._disable_config_mod()
+            # 后台回收已移出的文件，不阻塞还原流程
+            self._trash.reclaim_async(self._trash_root())
             self.log("还原成功！所有 Mod 已清空，配置文件已重置。", "SUCCESS")
         except Exception as e:
             self.log(f"还原失败: {e}", "ERROR")
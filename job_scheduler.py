@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+后台任务调度模块：为桥接层提供任务队列、任务状态与按资源粒度的互斥控制。
+
+功能定位:
+- 替代桥接层中单一的忙碌状态位：每个任务声明其占用的资源（语音包库、游戏 sound/mod、UserSkins、UserSights），
+  资源不冲突的任务并发执行，资源冲突的任务进入队列按提交顺序等待，而不是直接拒绝。
+- 为每个任务分配 job_id，并维护状态、进度与结果，供前端查询或订阅。
+
+输入输出:
+- 输入: 任务名称、资源集合、任务函数（接收 Job 对象作为第一个参数）。
+- 输出: job_id、任务状态字典；通过 on_update 回调推送任务状态变更。
+- 外部资源/依赖: threading（每个运行中的任务使用独立的守护线程）
+
+实现逻辑:
+- 1) submit 将任务加入队列并立即尝试调度。
+- 2) 调度时按 FIFO 顺序遍历队列：若任务资源与运行中任务、以及排在其前面的排队任务均不冲突，则启动该任务。
+- 3) 资源键支持层级：键相等，或一方是另一方以 "/" 分隔的前缀时视为冲突（例如 "library" 与 "library/xxx"）。
+- 4) 任务结束后释放资源并再次调度，唤醒等待者。
+
+业务关联:
+- 上游: main.py 的 AppApi 在导入/安装/还原/删除等操作中提交任务。
+- 下游: 任务函数调用 LibraryManager/CoreService/SkinsManager/SightsManager 执行实际读写。
+"""
+import itertools
+import threading
+import time
+from collections import deque
+
+# 资源键：语音包库、游戏 sound/mod、UserSkins、UserSights
+RES_LIBRARY = "library"
+RES_GAME_MOD = "game_mod"
+RES_USERSKINS = "userskins"
+RES_USERSIGHTS = "usersights"
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+def library_resource(mod_name):
+    """返回语音包库中单个语音包目录对应的子资源键（与 RES_LIBRARY 互斥）。"""
+    return f"{RES_LIBRARY}/{mod_name}"
+
+
+def _resources_conflict(a, b):
+    """
+    功能定位:
+    - 判断两个资源键是否互斥。
+
+    输入输出:
+    - 参数:
+      - a/b: str，资源键。
+    - 返回:
+      - bool，相等或存在层级包含关系时返回 True。
+    - 外部资源/依赖: 无
+
+    实现逻辑:
+    - 比较字符串相等，或一方以 "<另一方>/" 开头。
+
+    业务关联:
+    - 上游: JobScheduler._can_start。
+    - 下游: 决定任务能否与其他任务并发。
+    """
+    if a == b:
+        return True
+    return a.startswith(b + "/") or b.startswith(a + "/")
+
+
+class Job:
+    """
+    功能定位:
+    - 表示一个后台任务及其运行状态。
+
+    输入输出:
+    - 输入: job_id、名称、资源集合、任务函数与参数。
+    - 输出: to_dict 生成的状态快照。
+    - 外部资源/依赖: 无
+
+    实现逻辑:
+    - 任务函数通过 set_progress 更新进度；调度器负责维护 status/result/error 与时间戳。
+
+    业务关联:
+    - 上游: JobScheduler.submit 创建。
+    - 下游: 任务函数内部使用 set_progress 推送进度。
+    """
+
+    def __init__(self, job_id, name, resources, func, args, kwargs):
+        self.id = job_id
+        self.name = name
+        self.resources = frozenset(resources or ())
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.status = JOB_QUEUED
+        self.progress = 0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.done_event = threading.Event()
+        self._exc = None
+        self._scheduler = None
+
+    def set_progress(self, progress, message=""):
+        """
+        功能定位:
+        - 更新任务进度与提示文本，并通知调度器推送状态。
+
+        输入输出:
+        - 参数:
+          - progress: int|float，进度百分比（0-100）。
+          - message: str，提示文本。
+        - 返回: None
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 裁剪进度到 0-100 后写入，并调用调度器的状态通知。
+
+        业务关联:
+        - 上游: 任务函数内部的 progress_callback。
+        - 下游: 前端任务列表展示单个任务的进度。
+        """
+        try:
+            self.progress = max(0, min(100, int(progress)))
+        except Exception:
+            pass
+        self.message = str(message or "")
+        if self._scheduler:
+            self._scheduler._notify(self)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "resources": sorted(self.resources),
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobScheduler:
+    """
+    功能定位:
+    - 维护任务队列与资源占用表，按资源冲突关系调度任务并发执行。
+
+    输入输出:
+    - 输入: on_update 回调（接收 Job 状态字典）、历史任务保留数量。
+    - 输出: submit/wait/get_job/list_jobs/is_busy 等接口。
+    - 外部资源/依赖: threading
+
+    实现逻辑:
+    - _queue 保存排队任务；_running 保存运行中任务；_history 保存最近结束的任务。
+    - 所有状态变更在 _lock 内完成；任务函数在锁外的独立线程中执行。
+
+    业务关联:
+    - 上游: main.py 的 AppApi。
+    - 下游: 各业务管理器的耗时操作在调度器分配的线程中执行。
+    """
+
+    def __init__(self, on_update=None, history_limit=50):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._queue = deque()
+        self._running = {}
+        self._jobs = {}
+        self._history = deque()
+        self._history_limit = max(1, int(history_limit))
+        self._on_update = on_update
+
+    def submit(self, name, resources, func, *args, **kwargs):
+        """
+        功能定位:
+        - 提交一个任务到队列，资源空闲时立即开始执行。
+
+        输入输出:
+        - 参数:
+          - name: str，任务名称（用于日志与前端展示）。
+          - resources: Iterable[str]，任务占用的资源键集合。
+          - func: Callable[[Job, ...], Any]，任务函数，第一个参数为 Job。
+          - args/kwargs: 透传给任务函数的参数。
+        - 返回:
+          - int，job_id。
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 创建 Job 并入队，随后触发一次调度。
+
+        业务关联:
+        - 上游: AppApi 的导入/安装/还原等接口。
+        - 下游: 由 _dispatch 决定任务何时在后台线程中运行。
+        """
+        with self._lock:
+            job = Job(next(self._ids), name, resources, func, args, kwargs)
+            job._scheduler = self
+            self._jobs[job.id] = job
+            self._queue.append(job)
+        self._notify(job)
+        self._dispatch()
+        return job.id
+
+    def wait(self, job_id, timeout=None):
+        """
+        功能定位:
+        - 阻塞等待指定任务结束并返回其状态快照。
+
+        输入输出:
+        - 参数:
+          - job_id: int，任务 ID。
+          - timeout: float | None，最长等待秒数。
+        - 返回:
+          - Job | None，任务对象；ID 不存在时返回 None。
+        - 外部资源/依赖: threading.Event
+
+        实现逻辑:
+        - 等待任务的 done_event 被置位。
+
+        业务关联:
+        - 上游: 需要同步返回结果的桥接层接口（如删除语音包、更新封面）。
+        - 下游: 调用方读取 job.status/job.result/job.error。
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job.done_event.wait(timeout)
+        return job
+
+    def run(self, name, resources, func, *args, **kwargs):
+        """
+        功能定位:
+        - 提交任务并同步等待其结束，返回任务函数的返回值；任务异常时原样抛出。
+
+        输入输出:
+        - 参数: 同 submit。
+        - 返回:
+          - Any，任务函数返回值。
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - submit 后 wait；若任务失败则重新抛出捕获到的异常。
+
+        业务关联:
+        - 上游: 需要排队但仍以同步结果返回前端的短任务。
+        - 下游: 与后台任务共享同一套资源互斥规则。
+        """
+        job = self.wait(self.submit(name, resources, func, *args, **kwargs))
+        if job.status == JOB_FAILED and job._exc is not None:
+            raise job._exc
+        return job.result
+
+    def get_job(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def list_jobs(self):
+        with self._lock:
+            jobs = list(self._history) + list(self._running.values()) + list(self._queue)
+            return [j.to_dict() for j in sorted(jobs, key=lambda j: j.id)]
+
+    def is_busy(self, resource=None):
+        """
+        功能定位:
+        - 查询调度器或指定资源是否存在未结束的任务。
+
+        输入输出:
+        - 参数:
+          - resource: str | None，资源键；None 表示任意资源。
+        - 返回:
+          - bool，存在运行中或排队中的相关任务时返回 True。
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 遍历运行中与排队任务，按 _resources_conflict 判断。
+
+        业务关联:
+        - 上游: 桥接层在提示“排队中”或前端查询状态时调用。
+        - 下游: 仅用于展示，不参与调度决策。
+        """
+        with self._lock:
+            pending = list(self._running.values()) + list(self._queue)
+        if resource is None:
+            return bool(pending)
+        return any(_resources_conflict(resource, r) for j in pending for r in j.resources)
+
+    def _can_start(self, job, blocked):
+        for r in job.resources:
+            for held in blocked:
+                if _resources_conflict(r, held):
+                    return False
+        return True
+
+    def _dispatch(self):
+        """
+        功能定位:
+        - 扫描队列并启动所有可执行的任务。
+
+        输入输出:
+        - 参数: 无
+        - 返回: None
+        - 外部资源/依赖: threading
+
+        实现逻辑:
+        - 1) blocked 初始化为运行中任务占用的资源。
+        - 2) 按 FIFO 遍历队列：可启动则移出队列并启动线程；否则把其资源加入 blocked，
+             保证后提交的冲突任务不会越过先提交的任务。
+
+        业务关联:
+        - 上游: submit 与任务结束时调用。
+        - 下游: 启动 _run_job 线程。
+        """
+        to_start = []
+        with self._lock:
+            blocked = set()
+            for j in self._running.values():
+                blocked.update(j.resources)
+            remaining = deque()
+            while self._queue:
+                job = self._queue.popleft()
+                if self._can_start(job, blocked):
+                    job.status = JOB_RUNNING
+                    job.started_at = time.time()
+                    self._running[job.id] = job
+                    to_start.append(job)
+                else:
+                    remaining.append(job)
+                blocked.update(job.resources)
+            self._queue = remaining
+
+        for job in to_start:
+            self._notify(job)
+            t = threading.Thread(target=self._run_job, args=(job,))
+            t.daemon = True
+            t.start()
+
+    def _run_job(self, job):
+        try:
+            job.result = job.func(job, *job.args, **job.kwargs)
+            job.status = JOB_DONE
+        except Exception as e:
+            job._exc = e
+            job.error = str(e)
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                self._running.pop(job.id, None)
+                self._history.append(job)
+                while len(self._history) > self._history_limit:
+                    old = self._history.popleft()
+                    self._jobs.pop(old.id, None)
+            job.done_event.set()
+            self._notify(job)
+            self._dispatch()
+
+    def _notify(self, job):
+        if not self._on_update:
+            return
+        try:
+            self._on_update(job.to_dict())
+        except Exception:
+            pass
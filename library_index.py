@@ -0,0 +1,674 @@
+# -*- coding: utf-8 -*-
+"""
+语音包库索引模块：持久化每个语音包的文件清单，并在后台计算全库冲突矩阵。
+
+功能定位:
+- 为语音包库中的每个语音包记录“目录 -> 文件名列表”，避免安装前冲突检查时重复遍历目录。
+- 计算冲突矩阵：每个将被复制到 sound/mod 的 .bank 文件名 -> 提供它的 (语音包, 文件夹) 集合，
+  并由此得到“语音包 -> 与其存在同名 .bank 的其他语音包”，供前端卡片直接展示冲突徽标。
+- 记录内容指纹（排序后的 (相对路径, 大小, CRC32) 的 SHA-1）与已导入压缩包索引，导入前据此识别重复内容。
+- 记录冷存储语音包的归档文件与归档时的详情/封面，目录删除后语音包仍能在列表中展示。
+- 缓存 .bank 文件的 SHA-1（按大小与 mtime 校验），跨语音包去重重复运行时只哈希变化的文件。
+- 缓存每个语音包的健康检查结果（按文件清单签名校验），重复检查时只检查变化的语音包。
+
+输入输出:
+- 输入: 语音包库目录、语音包名称列表。
+- 输出: 索引查询结果（安装文件名列表、冲突语音包列表、冲突矩阵）；索引文件落盘。
+- 外部资源/依赖:
+  - 文件: <library_dir>/.library_index.json（读写，原子替换）
+  - 系统能力: 文件系统遍历、threading（后台重建）
+
+实现逻辑:
+- 1) 每个语音包条目保存签名（语音包目录及其所有子目录的 mtime），签名不变则认为文件清单未变化。
+- 2) refresh_async 在后台线程中仅重扫签名变化的语音包，移除已不存在的语音包，然后重建冲突矩阵并落盘。
+- 3) 索引文件写入临时文件后 os.replace，避免中途退出导致索引损坏；损坏时按空索引重建。
+- 4) 压缩包的指纹直接来自中央目录（无需解压）；库目录指纹只在文件数与总大小与候选压缩包一致时才读取文件计算 CRC。
+
+业务关联:
+- 上游: LibraryManager 持有实例；main.py 在获取语音包列表时触发后台刷新，在冲突检查时读取文件清单。
+- 下游: 前端语音包卡片的冲突徽标、安装前冲突提示。
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+
+INDEX_FILE_NAME = ".library_index.json"
+INDEX_VERSION = 1
+
+# 安装时 install_list 中表示语音包根目录的特殊值（与前端/LibraryManager 保持一致）
+ROOT_FOLDER_LABEL = "根目录"
+
+
+def _is_bank(name):
+    return name.lower().endswith(".bank")
+
+
+def _is_junk(name):
+    # 与 zip_extractor.is_junk_member 一致：解压时被过滤的条目不参与指纹
+    return "__MACOSX" in name or "desktop.ini" in name.lower()
+
+
+def stat_signature(mod_dir):
+    """
+    内容签名：目录下所有文件 (相对路径, 大小, mtime_ns) 的 SHA-1（只 stat，不读文件内容）。
+    原地改写文件（即使大小不变）也会改变 mtime，用于判断依赖文件内容的缓存（内容指纹、详情、健康检查结论）是否仍然有效。
+    """
+    items = []
+    for root, _dirs, names in os.walk(mod_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            items.append(f"{os.path.relpath(path, mod_dir)}\0{st.st_size}\0{st.st_mtime_ns}")
+    if not items and not os.path.isdir(mod_dir):
+        raise FileNotFoundError(mod_dir)
+    items.sort()
+    return hashlib.sha1("\n".join(items).encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def content_fingerprint(entries):
+    """
+    功能定位:
+    - 计算内容指纹：与压缩包文件名、目录名无关，只取决于成员的相对路径、大小与 CRC32。
+
+    输入输出:
+    - 参数:
+      - entries: Iterable[tuple[str, int, int]]，(相对路径, 未压缩大小, CRC32)。
+    - 返回:
+      - str | None，SHA-1 十六进制摘要；没有有效成员时返回 None。
+    - 外部资源/依赖: hashlib
+
+    实现逻辑:
+    - 路径统一为小写正斜杠、跳过 __MACOSX/desktop.ini，排序后逐行 "路径<TAB>大小<TAB>CRC" 写入摘要。
+
+    业务关联:
+    - 上游: LibraryManager（压缩包中央目录）、LibraryIndex.disk_fingerprint（库目录）。
+    - 下游: 已导入压缩包索引与重复内容识别。
+    """
+    lines = []
+    for rel, size, crc in entries:
+        rel = str(rel).replace("\\", "/").strip("/").lower()
+        if not rel or _is_junk(rel):
+            continue
+        lines.append(f"{rel}\t{int(size)}\t{int(crc) & 0xFFFFFFFF:08x}\n")
+    if not lines:
+        return None
+    lines.sort()
+    digest = hashlib.sha1()
+    for line in lines:
+        digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LibraryIndex:
+    """
+    功能定位:
+    - 维护语音包库索引的内存结构、后台刷新与持久化。
+
+    输入输出:
+    - 输入: library_dir、日志回调、索引更新回调。
+    - 输出: files_for_install/conflicts_with/conflict_matrix 等查询。
+    - 外部资源/依赖: <library_dir>/.library_index.json。
+
+    实现逻辑:
+    - self._data 结构:
+      - version: int
+      - mods: dict[str, {"sig": list, "dirs": dict[str, list[str]], "stats": [文件数, 总字节数],
+        "fingerprint"?: str, "fp_sig"?: str, "skipped"?: list[[str, int]]}]，dirs 的键为相对目录（"." 表示根目录）；
+        fingerprint 仅在 fp_sig 与当前 stat_signature 一致时有效（任一文件大小或 mtime 变化即失效）；skipped 为导入筛选时未解压的 [成员名, 大小]
+      - archives: dict[str, {"mod": str, "archive": str, "size": int, "time": int}]，内容指纹 -> 导入记录
+      - conflict_matrix: dict[str, list[[mod, folder]]]，键为小写 .bank 文件名，仅保留提供者不少于 2 个语音包的条目
+    - self._conflicts_with: dict[str, set[str]]，由冲突矩阵派生，不落盘。
+    - 所有读写在 _lock 内完成；后台刷新使用 _running/_pending 标记合并重复请求（_pending 为 [最新的语音包列表] 或 None）。
+
+    业务关联:
+    - 上游: LibraryManager、main.py。
+    - 下游: 前端冲突徽标、安装冲突检查。
+    """
+
+    def __init__(self, library_dir, log_callback=None, on_update=None):
+        self.library_dir = Path(library_dir)
+        self.index_file = self.library_dir / INDEX_FILE_NAME
+        self._log = log_callback or (lambda *_args, **_kwargs: None)
+        self.on_update = on_update
+        self._lock = threading.RLock()
+        self._running = False
+        self._pending = None
+        self._data = self._load()
+        self._conflicts_with = self._derive_conflicts(self._data.get("conflict_matrix", {}))
+
+    # --- 持久化 ---
+    def _empty(self):
+        return {"version": INDEX_VERSION, "mods": {}, "conflict_matrix": {}, "archives": {}, "hashes": {}, "verdicts": {}}
+
+    def _load(self):
+        """
+        功能定位:
+        - 读取索引文件；不存在、无法解析或版本不一致时返回空索引。
+
+        输入输出:
+        - 参数: 无
+        - 返回: dict，索引结构。
+        - 外部资源/依赖: self.index_file（读取）
+
+        实现逻辑:
+        - json.load 后校验 version 与字段类型，异常时回退空索引（索引可随时重建，不需要保留）。
+
+        业务关联:
+        - 上游: __init__。
+        - 下游: 启动后立即可用的冲突数据。
+        """
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+                data.setdefault("mods", {})
+                data.setdefault("conflict_matrix", {})
+                data.setdefault("archives", {})
+                data.setdefault("hashes", {})
+                data.setdefault("verdicts", {})
+                return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"语音包库索引读取失败，将重建: {e}")
+        return self._empty()
+
+    def save(self):
+        """将索引以紧凑 JSON 写入临时文件后原子替换（索引可能较大，不做缩进）。"""
+        with self._lock:
+            try:
+                self.library_dir.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp_file, self.index_file)
+            except Exception as e:
+                print(f"无法保存语音包库索引: {e}")
+
+    # --- 扫描 ---
+    def _signature(self, mod_dir):
+        """
+        语音包文件清单签名：所有层级目录的 (相对路径, mtime_ns)（只遍历目录，不 stat 文件）。
+        任意层级的文件增删改名都会改变所在目录的 mtime；原地改写文件内容不影响文件清单。
+        """
+        st = os.stat(mod_dir)
+        sig = [[".", st.st_mtime_ns]]
+        stack = [(str(mod_dir), "")]
+        while stack:
+            path, rel = stack.pop()
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        child = f"{rel}{entry.name}"
+                        sig.append([child, entry.stat(follow_symlinks=False).st_mtime_ns])
+                        stack.append((entry.path, child + "/"))
+        sig.sort()
+        return sig
+
+    def _scan_mod(self, mod_dir):
+        """遍历语音包目录，返回 ({相对目录: [文件名]}, [文件数, 总字节数])（相对目录使用正斜杠，根目录为 "."）。"""
+        dirs = {}
+        count = 0
+        total = 0
+        stack = [(str(mod_dir), ".")]
+        while stack:
+            path, rel = stack.pop()
+            names = []
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, entry.name if rel == "." else f"{rel}/{entry.name}"))
+                    elif entry.is_file(follow_symlinks=False):
+                        names.append(entry.name)
+                        if not _is_junk(entry.name):
+                            count += 1
+                            try:
+                                total += entry.stat(follow_symlinks=False).st_size
+                            except OSError:
+                                pass
+            if names:
+                dirs[rel] = sorted(names)
+        return dirs, [count, total]
+
+    def is_fresh(self, mod_name):
+        """判断语音包条目存在且签名与磁盘一致（只遍历目录，不 stat 文件）。"""
+        with self._lock:
+            entry = self._data["mods"].get(mod_name)
+        if not entry:
+            return False
+        try:
+            return entry.get("sig") == self._signature(self.library_dir / mod_name)
+        except OSError:
+            return False
+
+    def refresh(self, mod_names=None, prune=True):
+        """
+        功能定位:
+        - 同步刷新索引：重扫签名变化的语音包并重建冲突矩阵。
+
+        输入输出:
+        - 参数:
+          - mod_names: Iterable[str] | None，当前语音包库中的语音包名称；None 表示重新扫描库目录。
+          - prune: bool，是否删除不在 mod_names 中的语音包条目；False 时只更新给定语音包（导入流水线逐个入库）。
+        - 返回:
+          - bool，索引内容是否发生变化。
+        - 外部资源/依赖: 语音包目录遍历、索引文件写入
+
+        实现逻辑:
+        - 1) 计算每个语音包的签名，与索引中记录不一致时重新遍历文件清单。
+        - 2) 删除索引中已不存在的语音包（归档文件仍存在的冷存储语音包保留）。
+        - 3) 有变化时重建冲突矩阵并落盘。
+
+        业务关联:
+        - 上游: refresh_async 后台线程。
+        - 下游: conflicts_with/files_for_install 查询结果。
+        """
+        if mod_names is None:
+            mod_names = [p.name for p in self.library_dir.iterdir() if p.is_dir()] if self.library_dir.exists() else []
+        mod_names = list(mod_names)
+
+        updates = {}
+        for mod_name in mod_names:
+            mod_dir = self.library_dir / mod_name
+            try:
+                sig = self._signature(mod_dir)
+            except OSError:
+                continue
+            with self._lock:
+                entry = self._data["mods"].get(mod_name)
+            if entry and entry.get("sig") == sig:
+                continue
+            try:
+                dirs, stats = self._scan_mod(mod_dir)
+                updates[mod_name] = {"sig": sig, "dirs": dirs, "stats": stats}
+            except OSError as e:
+                self._log(f"索引语音包失败 ({mod_name}): {e}", "WARN")
+
+        with self._lock:
+            mods = self._data["mods"]
+            keep = set(mod_names)
+            removed = [m for m in mods if m not in keep and not self._is_cold(mods[m])] if prune else []
+            if not updates and not removed:
+                return False
+            for mod_name in removed:
+                del mods[mod_name]
+            if removed:
+                archives = self._data["archives"]
+                for fp in [fp for fp, rec in archives.items() if rec.get("mod") in removed]:
+                    del archives[fp]
+            for mod_name, entry in updates.items():
+                # 保留其他模块写入的扩展字段，仅覆盖签名与文件清单
+                merged = dict(mods.get(mod_name) or {})
+                merged.update(entry)
+                mods[mod_name] = merged
+            self._rebuild_matrix()
+        self.save()
+        return True
+
+    def refresh_async(self, mod_names=None):
+        """
+        功能定位:
+        - 在后台守护线程中执行 refresh；已有刷新在运行时合并为一次追加刷新。
+
+        输入输出:
+        - 参数:
+          - mod_names: Iterable[str] | None，同 refresh。
+        - 返回: None
+        - 外部资源/依赖: threading
+
+        实现逻辑:
+        - 运行中则记录 _pending（保留最新一次请求的语音包列表）；结束后若有 _pending 再执行一轮。
+        - 任一轮索引发生变化时调用 on_update 通知调用方。
+
+        业务关联:
+        - 上游: main.get_library_list。
+        - 下游: on_update（前端刷新冲突徽标）。
+        """
+        names = list(mod_names) if mod_names is not None else None
+        with self._lock:
+            if self._running:
+                self._pending = [names]
+                return
+            self._running = True
+
+        def _run(names):
+            changed = False
+            while True:
+                try:
+                    changed = self.refresh(names) or changed
+                except Exception as e:
+                    self._log(f"语音包库索引刷新失败: {e}", "WARN")
+                with self._lock:
+                    if self._pending is None:
+                        self._running = False
+                        break
+                    names = self._pending[0]
+                    self._pending = None
+            if changed and self.on_update:
+                try:
+                    self.on_update()
+                except Exception:
+                    pass
+
+        t = threading.Thread(target=_run, args=(names,))
+        t.daemon = True
+        t.start()
+
+    # --- 冷存储 ---
+    def _is_cold(self, entry):
+        """条目是否为冷存储语音包（记录了归档文件且文件仍存在）。"""
+        cold = entry.get("cold") if isinstance(entry, dict) else None
+        return bool(cold) and (self.library_dir / cold.get("archive", "")).is_file()
+
+    def mark_cold(self, mod_name, archive_name, archive_size, details, cover_url, fingerprint=None):
+        """
+        记录语音包已归档到冷存储：保存归档文件名与大小、归档时的详情与封面 data URL，并落盘（须在删除目录前调用）。
+        文件清单（dirs）与冲突矩阵保持不变，冷存储语音包仍参与冲突检查；
+        内容指纹仅在仍有效时保留（冷存储期间用于重复导入识别），目录已被修改过或从未计算过时改用 fingerprint（归档内容指纹）。
+        """
+        valid_fp = self._valid_fingerprint(mod_name)
+        with self._lock:
+            entry = self._data["mods"].setdefault(mod_name, {})
+            if not valid_fp:
+                entry.pop("fp_sig", None)
+                if fingerprint:
+                    entry["fingerprint"] = fingerprint
+                else:
+                    entry.pop("fingerprint", None)
+            entry["cold"] = {
+                "archive": archive_name,
+                "size": int(archive_size),
+                "time": int(time.time()),
+                "details": details,
+                "cover": cover_url or "",
+            }
+        self.save()
+
+    def cold_entry(self, mod_name):
+        """返回冷存储记录（归档文件不存在时返回 None）。"""
+        with self._lock:
+            entry = self._data["mods"].get(mod_name) or {}
+            if not self._is_cold(entry):
+                return None
+            return dict(entry["cold"])
+
+    def cold_mods(self):
+        """返回归档文件存在的冷存储语音包名称列表。"""
+        with self._lock:
+            return [m for m, entry in self._data["mods"].items() if self._is_cold(entry)]
+
+    def clear_cold(self, mod_name):
+        """删除冷存储记录（语音包恢复为目录后调用）；恢复出的内容与归档时相同，保留的指纹按新目录重新签名。"""
+        try:
+            sig = stat_signature(self.library_dir / mod_name)
+        except OSError:
+            sig = None
+        with self._lock:
+            entry = self._data["mods"].get(mod_name)
+            if not entry or entry.pop("cold", None) is None:
+                return
+            if entry.get("fingerprint"):
+                if sig:
+                    entry["fp_sig"] = sig
+                else:
+                    entry.pop("fingerprint", None)
+                    entry.pop("fp_sig", None)
+        self.save()
+
+    def forget(self, mod_name):
+        """删除语音包条目及其压缩包索引记录，并重建冲突矩阵。"""
+        with self._lock:
+            if self._data["mods"].pop(mod_name, None) is None:
+                return
+            archives = self._data["archives"]
+            for fp in [fp for fp, rec in archives.items() if rec.get("mod") == mod_name]:
+                del archives[fp]
+            self._rebuild_matrix()
+        self.save()
+
+    # --- 文件哈希缓存（去重） ---
+    def file_hashes(self):
+        """返回文件哈希缓存的副本：{"语音包/相对路径": [大小, mtime_ns, sha1]}。"""
+        with self._lock:
+            return {k: list(v) for k, v in self._data["hashes"].items()}
+
+    def set_file_hashes(self, hashes):
+        """整体替换文件哈希缓存并落盘（调用方传入本次扫描仍存在的文件，已删除文件的记录随之清除）。"""
+        with self._lock:
+            self._data["hashes"] = dict(hashes)
+        self.save()
+
+    # --- 健康检查结果缓存 ---
+    def verdicts(self):
+        """返回健康检查结果缓存的副本：{语音包: {"sig": 文件签名, "result": 检查结果}}。"""
+        with self._lock:
+            return {k: dict(v) for k, v in self._data["verdicts"].items()}
+
+    def set_verdicts(self, verdicts):
+        """整体替换健康检查结果缓存并落盘（只保留本次检查到的语音包）。"""
+        with self._lock:
+            self._data["verdicts"] = dict(verdicts)
+        self.save()
+
+    # --- 冲突矩阵 ---
+    def _rebuild_matrix(self):
+        """
+        功能定位:
+        - 由各语音包的文件清单重建冲突矩阵与派生的冲突关系。
+
+        输入输出:
+        - 参数: 无
+        - 返回: None
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 1) 安装时所有文件会被平铺复制到 sound/mod，因此以小写文件名为键聚合 (mod, folder) 提供者。
+        - 2) 仅保留由 2 个及以上语音包提供的 .bank 文件名（单一提供者不构成跨语音包冲突）。
+        - 3) 派生 _conflicts_with：同一文件名下的语音包两两互为冲突。
+
+        业务关联:
+        - 上游: refresh。
+        - 下游: conflicts_with/conflict_matrix。
+        """
+        providers = {}
+        for mod_name, entry in self._data["mods"].items():
+            for rel_dir, names in (entry.get("dirs") or {}).items():
+                folder = ROOT_FOLDER_LABEL if rel_dir == "." else rel_dir
+                for name in names:
+                    if not _is_bank(name):
+                        continue
+                    providers.setdefault(name.lower(), []).append([mod_name, folder])
+
+        matrix = {}
+        for key, pairs in providers.items():
+            if len({m for m, _f in pairs}) >= 2:
+                matrix[key] = sorted(pairs)
+        self._data["conflict_matrix"] = matrix
+        self._conflicts_with = self._derive_conflicts(matrix)
+
+    @staticmethod
+    def _derive_conflicts(matrix):
+        result = {}
+        for pairs in matrix.values():
+            mods = {m for m, _f in pairs}
+            for m in mods:
+                result.setdefault(m, set()).update(mods - {m})
+        return result
+
+    def conflicts_with(self, mod_name):
+        """返回与指定语音包存在同名 .bank 文件的其他语音包名称列表（排序）。"""
+        with self._lock:
+            return sorted(self._conflicts_with.get(mod_name, ()))
+
+    def conflict_matrix(self):
+        """返回冲突矩阵的副本：{小写 .bank 文件名: [[mod, folder], ...]}。"""
+        with self._lock:
+            return {k: [list(p) for p in v] for k, v in self._data.get("conflict_matrix", {}).items()}
+
+    def files_for_install(self, mod_name, install_list):
+        """
+        功能定位:
+        - 根据索引返回安装指定文件夹时将写入 sound/mod 的文件名列表。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包名称。
+          - install_list: list[str]，待安装的相对文件夹列表（"根目录" 表示语音包根目录）。
+        - 返回:
+          - list[str] | None，文件名列表；语音包未被索引时返回 None，由调用方回退到目录遍历。
+        - 外部资源/依赖: 无（内存索引）
+
+        实现逻辑:
+        - 与 CoreService.install_from_library 的 os.walk 语义一致：选中文件夹及其所有子目录中的文件都会被安装。
+
+        业务关联:
+        - 上游: main.check_install_conflicts。
+        - 下游: ManifestManager.check_conflicts。
+        """
+        with self._lock:
+            entry = self._data["mods"].get(mod_name)
+            if not entry:
+                return None
+            dirs = entry.get("dirs") or {}
+            files = []
+            for folder in install_list or []:
+                rel = "." if folder == ROOT_FOLDER_LABEL else str(folder).replace("\\", "/").strip("/")
+                for rel_dir, names in dirs.items():
+                    if rel == "." or rel_dir == rel or rel_dir.startswith(rel + "/"):
+                        files.extend(names)
+            return files
+
+    # --- 内容指纹 / 重复导入识别 ---
+    def disk_fingerprint(self, mod_name):
+        """读取语音包目录下所有文件计算 CRC32 并返回内容指纹（仅在候选匹配时调用，代价与语音包体积成正比）。"""
+        mod_dir = self.library_dir / mod_name
+        entries = []
+        for root, _dirnames, filenames in os.walk(mod_dir):
+            for name in filenames:
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, mod_dir).replace("\\", "/")
+                if _is_junk(rel):
+                    continue
+                crc = 0
+                size = 0
+                with open(path, "rb") as f:
+                    while True:
+                        chunk = f.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        crc = zlib.crc32(chunk, crc)
+                        size += len(chunk)
+                entries.append((rel, size, crc))
+        return content_fingerprint(entries)
+
+    def _valid_fingerprint(self, mod_name):
+        """
+        返回语音包记录的指纹（记录时的内容签名与当前 stat_signature 一致才有效），否则返回 None。
+        冷存储语音包目录不存在、内容冻结在归档中，直接返回归档时保留的指纹。
+        """
+        with self._lock:
+            entry = self._data["mods"].get(mod_name) or {}
+            fp = entry.get("fingerprint")
+            fp_sig = entry.get("fp_sig")
+            cold = self._is_cold(entry)
+        if not fp:
+            return None
+        if cold and not (self.library_dir / mod_name).exists():
+            return fp
+        if not fp_sig:
+            return None
+        try:
+            return fp if fp_sig == stat_signature(self.library_dir / mod_name) else None
+        except OSError:
+            return None
+
+    def find_duplicate(self, fingerprint, stats=None):
+        """
+        功能定位:
+        - 导入前判断压缩包内容是否已存在于语音包库中。
+
+        输入输出:
+        - 参数:
+          - fingerprint: str | None，压缩包内容指纹（来自中央目录）。
+          - stats: list[int] | None，压缩包的 [文件数, 总字节数]，用于筛选需要计算目录指纹的候选语音包。
+        - 返回:
+          - str | None，内容相同的语音包名称。
+        - 外部资源/依赖: 索引内存结构；候选语音包目录（仅在文件数与总大小一致时读取）
+
+        实现逻辑:
+        - 1) 先查已导入压缩包索引：命中且该语音包记录的指纹仍有效（所有文件大小与 mtime 未变化）时直接返回，只 stat 不读文件。
+        - 2) 否则在 stats 完全一致且无有效指纹的语音包中计算目录指纹（结果写回索引，后续复用）。
+
+        业务关联:
+        - 上游: LibraryManager.unzip_single_zip/unzip_zips_to_library。
+        - 下游: 重复内容被跳过，不再解压。
+        """
+        if not fingerprint:
+            return None
+        with self._lock:
+            rec = self._data["archives"].get(fingerprint)
+        if rec and self._valid_fingerprint(rec.get("mod")) == fingerprint:
+            return rec.get("mod")
+        if not stats:
+            return None
+
+        with self._lock:
+            candidates = [m for m, e in self._data["mods"].items() if e.get("stats") == list(stats)]
+        for mod_name in candidates:
+            fp = self._valid_fingerprint(mod_name)
+            if fp is None:
+                try:
+                    sig = stat_signature(self.library_dir / mod_name)
+                    fp = self.disk_fingerprint(mod_name)
+                except OSError:
+                    continue
+                with self._lock:
+                    entry = self._data["mods"].get(mod_name)
+                    if entry is not None:
+                        entry["fingerprint"] = fp
+                        entry["fp_sig"] = sig
+                self.save()
+            if fp == fingerprint:
+                return mod_name
+        return None
+
+    def record_import(self, mod_name, fingerprint, archive_name, archive_size, skipped=None):
+        """
+        记录一次成功导入：保存语音包的内容指纹（附当前内容签名 stat_signature）、导入筛选跳过的成员与压缩包索引条目，并落盘。
+        指纹始终是压缩包完整内容的指纹；目录内容因筛选少于压缩包时，重复识别依赖压缩包索引条目。
+        """
+        if not fingerprint and not skipped:
+            return
+        try:
+            sig = stat_signature(self.library_dir / mod_name)
+        except OSError:
+            return
+        with self._lock:
+            entry = self._data["mods"].setdefault(mod_name, {})
+            if skipped:
+                entry["skipped"] = [[str(name), int(size)] for name, size in skipped]
+            else:
+                entry.pop("skipped", None)
+            if fingerprint:
+                entry["fingerprint"] = fingerprint
+                entry["fp_sig"] = sig
+                self._data["archives"][fingerprint] = {
+                    "mod": mod_name,
+                    "archive": archive_name,
+                    "size": int(archive_size),
+                    "time": int(time.time()),
+                }
+        self.save()
+
+    def skipped_files(self, mod_name):
+        """返回导入该语音包时因筛选未解压的 [[成员名, 大小], ...]（无记录时为空列表）。"""
+        with self._lock:
+            entry = self._data["mods"].get(mod_name) or {}
+            return [list(item) for item in entry.get("skipped") or []]
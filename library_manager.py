@@ -20,21 +20,50 @@
 - 1) 初始化时计算 APP_ROOT，并确保待解压区与语音包库目录存在。
 - 2) 导入时为每个压缩包创建目标目录并解压；若遇到加密压缩包，则通过 password_provider 获取密码重试。
 - 3) 读取详情时合并作者元数据与基于文件规则推断的标签，并计算大小、封面与可安装文件夹列表。
+- 4) 持有 LibraryIndex（语音包文件清单与全库冲突矩阵），由桥接层触发后台刷新。
+- 5) 不常用的语音包可归档到冷存储（<mod>.cold.zip），详情与封面保存在索引中，需要时恢复为目录或直接从归档安装。
 
 业务关联:
 - 上游: main.py 的桥接层调用该模块完成导入/扫描/详情读取。
 - 下游: 输出的语音包详情被前端用于渲染语音包卡片、安装选择与标签展示。
 """
+import base64
+import copy
+import fnmatch
+import hashlib
 import os
 import sys
 import shutil
 import subprocess
+import tempfile
 import zipfile
 import json
+import locale
 import re
+import threading
+import time
+import zlib
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from library_index import LibraryIndex, content_fingerprint, stat_signature
+from trash_reclaimer import remove_path
+from zip_extractor import (
+    ArchivePasswordIncorrect,
+    ArchivePasswordRequired,
+    DEFAULT_CHUNK_SIZE,
+    DiskSpaceError,
+    EXTRACT_JOURNAL_NAME,
+    ExtractJournal,
+    PROGRESS_INTERVAL,
+    ZipExtractor,
+    allocated_size,
+    check_disk_space,
+    is_junk_member,
+    tree_size,
+)
+
 # 工作目录根路径：打包环境使用可执行文件同级目录，开发环境使用源码目录
 if getattr(sys, 'frozen', False):
     APP_ROOT = os.path.dirname(sys.executable)
@@ -44,13 +73,35 @@ else:
 DIR_PENDING = os.path.join(APP_ROOT, "WT待解压区")
 DIR_LIBRARY = os.path.join(APP_ROOT, "WT语音包库")
 
-class ArchivePasswordRequired(Exception):
-    """表示压缩包需要密码。"""
-    pass
-
-class ArchivePasswordIncorrect(Exception):
-    """表示提供的压缩包密码不正确。"""
-    pass
+# 7z -bsp1 进度片段（如 " 42% 13 - sound/xxx.bank"）与密码错误提示关键字
+_SEVEN_ZIP_PERCENT_RE = re.compile(r"^(\d{1,3})%")
+_SEVEN_ZIP_PASSWORD_HINTS = ("wrong password", "can not open encrypted archive", "cannot open encrypted archive", "enter password")
+
+# 导入筛选方案：voice 只解压可安装内容（.bank、info/cover 元数据与允许列表），all 解压全部成员
+IMPORT_FILTER_VOICE = "voice"
+IMPORT_FILTER_ALL = "all"
+# voice 方案始终保留的文件：.bank，以及文件名（不含扩展名）为 info/cover 的元数据与封面
+VOICE_KEEP_EXTENSIONS = (".bank",)
+VOICE_META_STEMS = ("info", "cover")
+
+# 已解压文件夹的导入方式：移动（同盘 O(1) 重命名）、硬链接（源文件夹保留、不占额外空间）、复制
+IMPORT_MODE_MOVE = "move"
+IMPORT_MODE_LINK = "link"
+IMPORT_MODE_COPY = "copy"
+IMPORT_MODES = (IMPORT_MODE_MOVE, IMPORT_MODE_LINK, IMPORT_MODE_COPY)
+
+# 导出语音包时使用 ZIP_DEFLATED 的文本与图片扩展名；其余成员（.bank 为 FMOD 压缩容器，再压缩几乎无收益）使用 ZIP_STORED
+EXPORT_DEFLATE_EXTENSIONS = (
+    ".json", ".txt", ".md", ".ini", ".cfg", ".blk", ".xml", ".csv", ".html", ".htm",
+    ".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp", ".ico", ".svg",
+)
+# 导出时语音包没有元数据文件才写入的 info.json 默认字段（与 _build_mod_details 读取的元数据字段一致）
+EXPORT_INFO_KEYS = ("title", "author", "version", "date", "note", "link_bilibili", "link_wtlive", "link_video", "tags", "language")
+
+# 冷存储：归档文件后缀；非文本/图片成员取前 COLD_PROBE_BYTES 试压缩，压缩后小于原大小的 COLD_DEFLATE_RATIO 才压缩
+COLD_SUFFIX = ".cold.zip"
+COLD_PROBE_BYTES = 1024 * 1024
+COLD_DEFLATE_RATIO = 0.9
 
 class ArchivePasswordCanceled(Exception):
     """表示用户取消提供压缩包密码。"""
@@ -73,6 +124,10 @@ class LibraryManager:
         - 1) 选择 root_dir（frozen: sys.executable 同级；非 frozen: 源码目录）。
         - 2) 拼接 pending_dir 与 library_dir。
         - 3) 调用 _ensure_dirs 创建目录。
+        - 4) 创建语音包库索引 LibraryIndex（读取已有索引文件，刷新由调用方触发）。
+        - 5) 创建 ZIP 解压引擎（语音包库策略：穿越成员跳过、不限制扩展名）。
+        - 6) 导入筛选默认使用 voice 方案，允许列表为空（由 main.py 按配置覆盖）。
+        - 7) 创建语音包详情缓存与封面 data URL 缓存（导入流水线在导入完成前预热）。
 
         业务关联:
         - 上游: main.py 在启动时创建。
@@ -90,6 +145,20 @@ class LibraryManager:
         self.library_dir = self.root_dir / DIR_LIBRARY
         
         self._ensure_dirs()
+        self.index = LibraryIndex(self.library_dir, log_callback)
+        self._zip_extractor = ZipExtractor(log_callback)
+        # 7z 解压线程数（-mmt）；None 表示由 7z 自行决定
+        self.seven_zip_threads = None
+        # 导入筛选方案（IMPORT_FILTER_*）与额外保留的文件名通配符（如 "*.txt"，不区分大小写）
+        self.import_filter = IMPORT_FILTER_VOICE
+        self.import_allow_patterns = []
+        # 语音包详情缓存: 语音包名 -> (详情签名, 详情)；封面缓存: 路径 -> ((大小, mtime_ns), data URL)
+        self._details_cache = {}
+        self._cover_cache = {}
+        self._cache_lock = threading.Lock()
+        # 压缩包预检缓存: 路径 -> ((大小, mtime_ns), 结果)
+        self._inspect_cache = {}
+        self._inspect_lock = threading.Lock()
 
     def _load_json_with_fallback(self, file_path):
         """
@@ -104,17 +173,25 @@ class LibraryManager:
         - 外部资源/依赖: 文件 file_path（读取）
 
         实现逻辑:
-        - 依次尝试 encodings 列表中的编码读取并 json.load。
+        - 读取原始字节后交给 _parse_json_bytes 按编码列表依次尝试解析。
 
         业务关联:
         - 上游: get_mod_details。
         - 下游: 为元数据读取提供编码兼容。
         """
+        try:
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except Exception:
+            return None
+        return self._parse_json_bytes(data)
+
+    def _parse_json_bytes(self, data):
+        """按 utf-8-sig → utf-8 → cp950 → big5 → gbk 顺序解码字节并解析 JSON，失败返回 None。"""
         encodings = ["utf-8-sig", "utf-8", "cp950", "big5", "gbk"]
         for enc in encodings:
             try:
-                with open(file_path, "r", encoding=enc) as f:
-                    return json.load(f)
+                return json.loads(data.decode(enc))
             except Exception:
                 continue
         return None
@@ -190,7 +267,8 @@ class LibraryManager:
         - 外部资源/依赖: self.library_dir（目录遍历）
 
         实现逻辑:
-        - 遍历 library_dir 下的一级子项，收集其中的目录名称。
+        - 1) 遍历 library_dir 下的一级子项，收集其中的目录名称；含断点日志的目录是未完成的导入，不计入语音包。
+        - 2) 追加冷存储中的语音包（目录已删除，详情与封面来自索引）。
 
         业务关联:
         - 上游: main.py 获取语音包库列表时调用。
@@ -199,8 +277,10 @@ class LibraryManager:
         mods = []
         if self.library_dir.exists():
             for item in self.library_dir.iterdir():
-                if item.is_dir():
+                if item.is_dir() and not ExtractJournal.exists(item):
                     mods.append(item.name)
+        listed = set(mods)
+        mods.extend(m for m in self.index.cold_mods() if m not in listed)
         return mods
 
     def scan_pending(self):
@@ -319,7 +399,146 @@ class LibraryManager:
         except Exception:
             return
 
+    def _details_signature(self, mod_dir):
+        """
+        详情缓存签名：所有层级目录的 mtime（LibraryIndex._signature，覆盖空目录增删与目录日期）加上所有文件的
+        (相对路径, 大小, mtime_ns)（stat_signature）；任意层级的增删改名与原地改写都会使缓存失效，大小、标签、
+        能力映射与可安装文件夹随之重新计算。
+        """
+        return [self.index._signature(mod_dir), stat_signature(mod_dir)]
+
     def get_mod_details(self, mod_name):
+        """
+        功能定位:
+        - 返回语音包详情；签名未变化时直接使用缓存，否则重新读取（_build_mod_details）并缓存。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包目录名（位于 self.library_dir 下）。
+        - 返回:
+          - dict，语音包详情（调用方可修改的副本）；字段见 _build_mod_details。
+        - 外部资源/依赖: _details_signature（遍历目录并 stat 每个文件，不读内容）、self._details_cache
+
+        实现逻辑:
+        - 1) 计算详情签名，与缓存一致时返回深拷贝。
+        - 2) 否则构建详情；构建过程可能规范化文件名（cover.bank -> cover.png），因此在构建后重新计算签名再写入缓存。
+        - 3) 目录不存在而语音包处于冷存储时，返回归档时记录的详情（附 cold=True）。
+
+        业务关联:
+        - 上游: main.py 获取语音包列表时逐项调用；导入流水线的预热阶段。
+        - 下游: 前端卡片渲染；刷新列表时不再重复遍历未变化的语音包目录。
+        """
+        mod_dir = self.library_dir / mod_name
+        try:
+            sig = self._details_signature(mod_dir)
+        except OSError:
+            sig = None
+            cold = self.index.cold_entry(mod_name)
+            if cold:
+                details = copy.deepcopy(cold.get("details") or {})
+                details["cold"] = True
+                return details
+        if sig is not None:
+            with self._cache_lock:
+                cached = self._details_cache.get(mod_name)
+            if cached and cached[0] == sig:
+                return copy.deepcopy(cached[1])
+
+        details = self._build_mod_details(mod_name)
+        try:
+            sig = self._details_signature(mod_dir)
+        except OSError:
+            return details
+        with self._cache_lock:
+            self._details_cache[mod_name] = (sig, copy.deepcopy(details))
+        return details
+
+    def cover_data_url(self, cover_path):
+        """
+        功能定位:
+        - 将封面图片编码为 data URL，并按 (路径, 大小, mtime_ns) 缓存。
+
+        输入输出:
+        - 参数:
+          - cover_path: str | Path，图片路径。
+        - 返回:
+          - str，data:image/<ext>;base64,<data>；文件不存在或读取失败返回空字符串。
+        - 外部资源/依赖: 文件系统读取、base64 编码
+
+        实现逻辑:
+        - stat 命中缓存时直接返回；否则读取并编码（扩展名 jpg 映射为 jpeg）。
+
+        业务关联:
+        - 上游: main.py get_library_list（语音包封面与默认封面）、导入流水线预热阶段。
+        - 下游: 前端直接将 cover_url 作为 img src 使用。
+        """
+        path = str(cover_path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return ""
+        key = (st.st_size, st.st_mtime_ns)
+        with self._cache_lock:
+            cached = self._cover_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        ext = os.path.splitext(path)[1].lower().replace(".", "")
+        if ext == "jpg":
+            ext = "jpeg"
+        try:
+            with open(path, "rb") as f:
+                url = f"data:image/{ext};base64," + base64.b64encode(f.read()).decode("utf-8")
+        except Exception as e:
+            print(f"图片转码失败: {e}")
+            return ""
+        with self._cache_lock:
+            self._cover_cache[path] = (key, url)
+        return url
+
+    def warm_mod(self, mod_name):
+        """预热语音包：构建并缓存详情与封面 data URL（导入流水线的最后阶段）。"""
+        details = self.get_mod_details(mod_name)
+        if details.get("cover_path"):
+            self.cover_data_url(details["cover_path"])
+
+    def _find_info_file(self, mod_dir):
+        """
+        定位语音包的元数据文件（支持 WTLive 伪装格式），不存在时返回 None。
+        逻辑: info.json > info/info.json > *（AimerWT）.bank > info/*（AimerWT）.bank > 层级最浅的 info.json > 层级最浅的含 aimerwt 的 .bank
+        """
+        info_candidates = []
+        
+        # (1) 标准 info.json
+        info_candidates.append(mod_dir / "info.json")
+        info_candidates.append(mod_dir / "info" / "info.json")
+        
+        # (2) 伪装的 .bank 文件 (检测 （AimerWT） 字样)
+        try:
+            info_candidates.extend(list(mod_dir.glob("*（AimerWT）.bank")))
+            info_candidates.extend(list(mod_dir.glob("*(AimerWT).bank")))
+            if (mod_dir / "info").exists():
+                info_candidates.extend(list((mod_dir / "info").glob("*（AimerWT）.bank")))
+                info_candidates.extend(list((mod_dir / "info").glob("*(AimerWT).bank")))
+        except Exception as e:
+            print(f"Glob 搜索出错: {e}")
+
+        for cand in info_candidates:
+            if cand and cand.exists():
+                return cand
+        try:
+            info_jsons = [p for p in mod_dir.rglob("info.json") if p.is_file()]
+            info_jsons.sort(key=lambda p: len(p.parts))
+            if info_jsons:
+                return info_jsons[0]
+            aimer_banks = [p for p in mod_dir.rglob("*.bank") if p.is_file() and "aimerwt" in p.name.lower()]
+            aimer_banks.sort(key=lambda p: len(p.parts))
+            if aimer_banks:
+                return aimer_banks[0]
+        except Exception:
+            pass
+        return None
+
+    def _build_mod_details(self, mod_name):
         """
         功能定位:
         - 读取语音包的元数据与资源信息，生成前端展示所需的详情字典。
@@ -340,7 +559,7 @@ class LibraryManager:
         - 4) 将 tags 映射为 capabilities，计算目录大小，扫描封面与可安装文件夹列表。
 
         业务关联:
-        - 上游: main.py 获取语音包列表时逐项调用。
+        - 上游: get_mod_details（缓存未命中时）。
         - 下游: 前端使用返回字段渲染卡片、标签与安装选择界面。
         """
         import time
@@ -373,41 +592,7 @@ class LibraryManager:
         }
 
         # 2. 读取 info.json (支持 WTLive 伪装格式)
-        # 逻辑: info.json > info/info.json > *（AimerWT）.bank > info/*（AimerWT）.bank
-        info_candidates = []
-        
-        # (1) 标准 info.json
-        info_candidates.append(mod_dir / "info.json")
-        info_candidates.append(mod_dir / "info" / "info.json")
-        
-        # (2) 伪装的 .bank 文件 (检测 （AimerWT） 字样)
-        try:
-            info_candidates.extend(list(mod_dir.glob("*（AimerWT）.bank")))
-            info_candidates.extend(list(mod_dir.glob("*(AimerWT).bank")))
-            if (mod_dir / "info").exists():
-                info_candidates.extend(list((mod_dir / "info").glob("*（AimerWT）.bank")))
-                info_candidates.extend(list((mod_dir / "info").glob("*(AimerWT).bank")))
-        except Exception as e:
-            print(f"Glob 搜索出错: {e}")
-
-        found_info_file = None
-        for cand in info_candidates:
-            if cand and cand.exists():
-                found_info_file = cand
-                break
-        if not found_info_file:
-            try:
-                info_jsons = [p for p in mod_dir.rglob("info.json") if p.is_file()]
-                info_jsons.sort(key=lambda p: len(p.parts))
-                if info_jsons:
-                    found_info_file = info_jsons[0]
-                else:
-                    aimer_banks = [p for p in mod_dir.rglob("*.bank") if p.is_file() and "aimerwt" in p.name.lower()]
-                    aimer_banks.sort(key=lambda p: len(p.parts))
-                    if aimer_banks:
-                        found_info_file = aimer_banks[0]
-            except Exception:
-                pass
+        found_info_file = self._find_info_file(mod_dir)
         
         if found_info_file:
             try:
@@ -435,22 +620,7 @@ class LibraryManager:
             details["language"] = ["未识别"]
 
         # 将 tags 映射为前端使用的 capabilities 键
-        cap_map = {
-            "tank": "tank", "陆战": "tank", "ground": "tank",
-            "air": "air", "空战": "air", "aircraft": "air",
-            "naval": "naval", "海战": "naval",
-            "radio": "radio", "无线电": "radio", "无线电/局势": "radio",
-            "status": "status", "局势播报": "radio",
-            "missile": "missile", "导弹音效": "missile",
-            "music": "music", "音乐包": "music",
-            "noise": "noise", "降噪包": "noise",
-            "pilot": "pilot", "飞行员语音": "pilot"
-        }
-        for t in details["tags"]:
-            if t in cap_map:
-                details["capabilities"][cap_map[t]] = True
-            elif t in ["tank", "air", "naval", "radio", "status", "missile", "music", "noise", "pilot"]:
-                 details["capabilities"][t] = True
+        details["capabilities"].update(self._capabilities_from_tags(details["tags"]))
 
         # 5. 计算大小
         details["size_str"] = self._get_dir_size_str(mod_dir)
@@ -506,6 +676,27 @@ class LibraryManager:
         
         return details
 
+    def _capabilities_from_tags(self, tags):
+        """将标签（含中文别名）映射为前端使用的 capabilities 键。"""
+        cap_map = {
+            "tank": "tank", "陆战": "tank", "ground": "tank",
+            "air": "air", "空战": "air", "aircraft": "air",
+            "naval": "naval", "海战": "naval",
+            "radio": "radio", "无线电": "radio", "无线电/局势": "radio",
+            "status": "status", "局势播报": "radio",
+            "missile": "missile", "导弹音效": "missile",
+            "music": "music", "音乐包": "music",
+            "noise": "noise", "降噪包": "noise",
+            "pilot": "pilot", "飞行员语音": "pilot"
+        }
+        capabilities = {}
+        for t in tags:
+            if t in cap_map:
+                capabilities[cap_map[t]] = True
+            elif t in ["tank", "air", "naval", "radio", "status", "missile", "music", "noise", "pilot"]:
+                capabilities[t] = True
+        return capabilities
+
     def _detect_smart_tags(self, mod_dir):
         """
         功能定位:
@@ -533,66 +724,87 @@ class LibraryManager:
         - 上游: get_mod_details 在作者 tags 缺失或不完整时调用以补充展示标签。
         - 下游: tags 映射为 capabilities，影响前端卡片图标与筛选展示。
         """
-        detected_tags = set()
-        
         try:
-            # 遍历所有 .bank 文件
-            for f in mod_dir.rglob("*.bank"):
-                if not f.is_file(): continue
-                name = f.name.lower()
-                if name in [
-                    "crew_dialogs_common.assets.bank",
-                    "crew_dialogs_common.bank",
-                    "crew_dialogs_ground.assets.bank",
-                    "crew_dialogs_ground.bank",
-                    "crew_dialogs_naval.assets.bank",
-                    "crew_dialogs_naval.bank",
-                    "masterbank.assets.bank",
-                    "masterbank.bank"
-                ]:
-                    detected_tags.add("noise")
-                if re.match(r'dialogs_chat_[a-z0-9]+\.bank$', name):
-                    detected_tags.add("pilot")
-                
-                # 1. 陆战
-                # 匹配: _crew_dialogs_ground_cn.assets.bank
-                m_ground = re.match(r'(_)?crew_dialogs_ground_([a-z0-9]+)\.assets\.bank', name)
-                if m_ground:
-                    detected_tags.add("tank")
-                    continue
-                # 兼容无后缀
-                if "crew_dialogs_ground.assets.bank" in name:
-                    detected_tags.add("tank")
-                    continue
-                    
-                # 2. 无线电/局势 (合并原来的无线电和局势播报)
-                m_radio = re.match(r'(_)?crew_dialogs_common_([a-z0-9]+)\.assets\.bank', name)
-                if m_radio:
-                    detected_tags.add("radio")
-                    continue
-                if "crew_dialogs_common.assets.bank" in name:
-                    detected_tags.add("radio")
-                    continue
-                    
-                # 3. 空战 (仅检测 aircraft_gui.assets.bank)
-                if name == "aircraft_gui.assets.bank":
-                    detected_tags.add("air")
-                    continue
-                
-                # 4. 导弹音效 (检测多个文件)
-                if name in ["aircraft_common.assets.bank", "aircraft_effects.assets.bank", 
-                           "aircraft_guns.assets.bank", "aircraft_guns.bank"]:
-                    detected_tags.add("missile")
-                    continue
-                
-                # 5. 音乐包 (检测带有 aircraft_music 字样的文件)
-                if "aircraft_music" in name:
-                    detected_tags.add("music")
-                    continue
-                    
+            names = [f.name for f in mod_dir.rglob("*.bank") if f.is_file()]
         except Exception as e:
             print(f"智能检测出错: {e}")
-            
+            names = []
+        return self._tags_from_bank_names(names)
+
+    def _tags_from_bank_names(self, names):
+        """
+        功能定位:
+        - 按 .bank 文件名规则推断功能标签；目录扫描与压缩包预检共用同一套规则。
+
+        输入输出:
+        - 参数:
+          - names: Iterable[str]，.bank 文件名（不含目录，大小写不限）。
+        - 返回:
+          - list[str]，推断得到的标签列表（去重）。
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 规则见 _detect_smart_tags。
+
+        业务关联:
+        - 上游: _detect_smart_tags、inspect_archive。
+        - 下游: tags 映射为 capabilities。
+        """
+        detected_tags = set()
+        for raw_name in names:
+            name = raw_name.lower()
+            if not name.endswith(".bank"):
+                continue
+            if name in [
+                "crew_dialogs_common.assets.bank",
+                "crew_dialogs_common.bank",
+                "crew_dialogs_ground.assets.bank",
+                "crew_dialogs_ground.bank",
+                "crew_dialogs_naval.assets.bank",
+                "crew_dialogs_naval.bank",
+                "masterbank.assets.bank",
+                "masterbank.bank"
+            ]:
+                detected_tags.add("noise")
+            if re.match(r'dialogs_chat_[a-z0-9]+\.bank$', name):
+                detected_tags.add("pilot")
+
+            # 1. 陆战
+            # 匹配: _crew_dialogs_ground_cn.assets.bank
+            m_ground = re.match(r'(_)?crew_dialogs_ground_([a-z0-9]+)\.assets\.bank', name)
+            if m_ground:
+                detected_tags.add("tank")
+                continue
+            # 兼容无后缀
+            if "crew_dialogs_ground.assets.bank" in name:
+                detected_tags.add("tank")
+                continue
+
+            # 2. 无线电/局势 (合并原来的无线电和局势播报)
+            m_radio = re.match(r'(_)?crew_dialogs_common_([a-z0-9]+)\.assets\.bank', name)
+            if m_radio:
+                detected_tags.add("radio")
+                continue
+            if "crew_dialogs_common.assets.bank" in name:
+                detected_tags.add("radio")
+                continue
+
+            # 3. 空战 (仅检测 aircraft_gui.assets.bank)
+            if name == "aircraft_gui.assets.bank":
+                detected_tags.add("air")
+                continue
+
+            # 4. 导弹音效 (检测多个文件)
+            if name in ["aircraft_common.assets.bank", "aircraft_effects.assets.bank",
+                       "aircraft_guns.assets.bank", "aircraft_guns.bank"]:
+                detected_tags.add("missile")
+                continue
+
+            # 5. 音乐包 (检测带有 aircraft_music 字样的文件)
+            if "aircraft_music" in name:
+                detected_tags.add("music")
+                continue
+
         return list(detected_tags)
 
     def _map_lang_code(self, code):
@@ -652,29 +864,31 @@ class LibraryManager:
         try:
             # 获取文件夹下所有文件名
             filenames = [f.name for f in folder_path.iterdir() if f.is_file()]
-            
-            # 1. 陆战语音: _crew_dialogs_ground_<国家缩写>.assets.bank
-            # 兼容: crew_dialogs_ground.assets.bank (无前缀/后缀)
-            for name in filenames:
-                if re.match(r'(_)?crew_dialogs_ground.*\.assets\.bank', name, re.IGNORECASE):
-                    return "ground"
-            
-            # 2. 无线电语音: _crew_dialogs_common_<国家缩写>.assets.bank
-            # 兼容: crew_dialogs_common.assets.bank
-            for name in filenames:
-                if re.match(r'(_)?crew_dialogs_common.*\.assets\.bank', name, re.IGNORECASE):
-                    return "radio"
-            
-            # 3. 空战音效: aircraft_guns.assets.bank 或 aircraft_gui.assets.bank
-            for name in filenames:
-                if re.match(r'aircraft_guns\.assets\.bank', name, re.IGNORECASE) or \
-                   re.match(r'aircraft_gui\.assets\.bank', name, re.IGNORECASE):
-                    return "aircraft"
-            
-            return "folder"
-            
         except Exception:
             return "folder"
+        return self._folder_type_from_names(filenames)
+
+    def _folder_type_from_names(self, filenames):
+        """按文件夹内的文件名列表判断文件夹类型（目录扫描与压缩包预检共用）。"""
+        # 1. 陆战语音: _crew_dialogs_ground_<国家缩写>.assets.bank
+        # 兼容: crew_dialogs_ground.assets.bank (无前缀/后缀)
+        for name in filenames:
+            if re.match(r'(_)?crew_dialogs_ground.*\.assets\.bank', name, re.IGNORECASE):
+                return "ground"
+
+        # 2. 无线电语音: _crew_dialogs_common_<国家缩写>.assets.bank
+        # 兼容: crew_dialogs_common.assets.bank
+        for name in filenames:
+            if re.match(r'(_)?crew_dialogs_common.*\.assets\.bank', name, re.IGNORECASE):
+                return "radio"
+
+        # 3. 空战音效: aircraft_guns.assets.bank 或 aircraft_gui.assets.bank
+        for name in filenames:
+            if re.match(r'aircraft_guns\.assets\.bank', name, re.IGNORECASE) or \
+               re.match(r'aircraft_gui\.assets\.bank', name, re.IGNORECASE):
+                return "aircraft"
+
+        return "folder"
 
     def _detect_mod_capabilities(self, mod_dir):
         """[已废弃] 旧的检测逻辑"""
@@ -793,24 +1007,109 @@ class LibraryManager:
             or shutil.which("7zr.exe")
         )
 
-    def _run_7z(self, args):
-        result = subprocess.run(
+    def _run_7z(self, args, on_progress=None, abort_on_password=False):
+        """
+        功能定位:
+        - 以管道方式运行 7z 并流式读取输出：解析百分比进度，识别密码错误后可提前终止进程。
+
+        输入输出:
+        - 参数:
+          - args: list[str]，完整命令行（由调用方决定是否附带 -bsp1/-bse1 等流控制开关）。
+          - on_progress: Callable[[int], None] | None，百分比（0~100）变化时回调。
+          - abort_on_password: bool，输出中出现密码错误提示时立即结束 7z 进程。
+        - 返回:
+          - tuple[int, str, bool]，(退出码, 非进度输出文本, 是否检测到密码错误)。
+        - 外部资源/依赖: subprocess.Popen（stdout 管道，stderr 合并到 stdout）
+
+        实现逻辑:
+        - 1) 按块读取 stdout，以回车/换行/退格符切分片段；7z 的进度片段形如 " 42% 13 - name"。
+        - 2) 进度片段只用于回调且不保留，其余行写入输出缓冲（供错误信息与 l -slt 解析使用）。
+        - 3) 片段中出现 _SEVEN_ZIP_PASSWORD_HINTS 任一关键字时标记密码错误，按需 kill 进程。
+
+        业务关联:
+        - 上游: _extract_with_7z。
+        - 下游: 进度回调与密码错误判定。
+        """
+        proc = subprocess.Popen(
             args,
-            capture_output=True,
-            text=True,
-            errors="ignore",
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
         )
-        output = (result.stdout or "") + "\n" + (result.stderr or "")
-        return result.returncode, output
+        encoding = locale.getpreferredencoding(False) or "utf-8"
+        lines = []
+        password_error = False
+        last_percent = -1
+        pending = b""
+        try:
+            while True:
+                data = proc.stdout.read1(65536)
+                if not data:
+                    break
+                parts = re.split(rb"[\r\n\x08]+", pending + data)
+                pending = parts.pop()
+                for raw in parts:
+                    text = raw.decode(encoding, errors="ignore").strip()
+                    if not text:
+                        continue
+                    m = _SEVEN_ZIP_PERCENT_RE.match(text)
+                    if m:
+                        percent = min(100, int(m.group(1)))
+                        if on_progress and percent != last_percent:
+                            last_percent = percent
+                            on_progress(percent)
+                        continue
+                    lines.append(text)
+                    lower = text.lower()
+                    if any(hint in lower for hint in _SEVEN_ZIP_PASSWORD_HINTS):
+                        password_error = True
+                if password_error and abort_on_password:
+                    proc.kill()
+                    break
+            if pending.strip():
+                lines.append(pending.decode(encoding, errors="ignore").strip())
+        finally:
+            try:
+                proc.stdout.close()
+            except Exception:
+                pass
+            code = proc.wait()
+        return code, "\n".join(lines), password_error
+
+    def _extract_with_7z(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None, threads=None, extra_args=None):
+        """
+        功能定位:
+        - 调用 7z 解压 RAR 或 zipfile 不支持的 ZIP，并实时回报进度。
+
+        输入输出:
+        - 参数:
+          - archive_path: Path，压缩包路径。
+          - target_dir: Path，目标解压目录。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - base_progress/share_progress: float|int，该压缩包在总体进度中的起点与占比。
+          - password: str | None，密码。
+          - threads: int | None，7z 解压线程数（-mmt）；None 时使用 self.seven_zip_threads，仍为 None 则由 7z 自行决定。
+          - extra_args: list[str] | None，附加的 7z 开关（如 -xr! 排除规则）。
+        - 返回: None
+        - 外部资源/依赖: 7z 可执行文件
+
+        实现逻辑:
+        - 1) 以 -bsp1 -bse1 运行 7z，进度与错误信息都经 stdout 管道流式返回。
+        - 2) 百分比映射到 [base_progress, base_progress + share_progress] 并按 0.2 秒节流回调。
+        - 3) 流中出现密码错误提示时提前终止 7z，按是否提供密码抛出 ArchivePasswordIncorrect/Required。
 
-    def _extract_with_7z(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None):
+        业务关联:
+        - 上游: _extract_archive_with_password。
+        - 下游: 语音包库目录中的解压结果。
+        """
         seven_zip = self._find_7z()
         if not seven_zip:
             raise Exception("未检测到 7z 解压组件，请安装 7-Zip 后重试")
 
+        name = Path(archive_path).name
         if progress_callback:
             try:
-                progress_callback(int(base_progress), f"开始解压: {Path(archive_path).name}")
+                progress_callback(int(base_progress), f"开始解压: {name}")
             except Exception:
                 pass
 
@@ -819,14 +1118,37 @@ class LibraryManager:
             seven_zip,
             "x",
             "-y",
+            "-bsp1",
+            "-bse1",
             password_arg,
             f"-o{str(target_dir)}",
-            str(archive_path),
         ]
-        code, output = self._run_7z(args)
-        if code != 0:
+        if threads is None:
+            threads = self.seven_zip_threads
+        if threads:
+            args.append(f"-mmt{max(1, int(threads))}")
+        if extra_args:
+            args.extend(extra_args)
+        args.append(str(archive_path))
+
+        last_push = [0.0]
+
+        def _on_percent(percent):
+            if not progress_callback:
+                return
+            now = time.monotonic()
+            if (now - last_push[0]) < 0.2:
+                return
+            last_push[0] = now
+            try:
+                progress_callback(int(base_progress + percent / 100.0 * share_progress), f"解压中: {name} ({percent}%)")
+            except Exception:
+                pass
+
+        code, output, password_error = self._run_7z(args, on_progress=_on_percent, abort_on_password=True)
+        if password_error or code != 0:
             lower = output.lower()
-            if "password" in lower or "wrong password" in lower or "incorrect" in lower or "encrypted" in lower:
+            if password_error or "password" in lower or "incorrect" in lower or "encrypted" in lower:
                 if password:
                     raise ArchivePasswordIncorrect("密码错误")
                 raise ArchivePasswordRequired("需要密码")
@@ -834,360 +1156,1743 @@ class LibraryManager:
 
         if progress_callback:
             try:
-                progress_callback(int(base_progress + share_progress), f"解压完成: {Path(archive_path).name}")
+                progress_callback(int(base_progress + share_progress), f"解压完成: {name}")
             except Exception:
                 pass
 
-    def _extract_archive_with_password(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password_provider=None):
-        password = None
-        while True:
-            try:
-                if archive_path.suffix.lower() == ".zip":
-                    try:
-                        self._extract_zip_safely(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
-                    except (NotImplementedError, RuntimeError) as e:
-                        msg = str(e).lower()
-                        if "compression method is not supported" in msg:
-                            self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
-                        else:
-                            raise
-                elif archive_path.suffix.lower() == ".rar":
-                    self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password)
-                else:
-                    raise Exception("不支持的压缩格式")
-                return
-            except ArchivePasswordRequired:
-                if not password_provider:
-                    raise
-                password = password_provider(archive_path, "required")
-                if password is None:
-                    raise ArchivePasswordCanceled("用户取消输入密码")
-            except ArchivePasswordIncorrect:
-                try:
-                    self.log("密码错误，请重试", "WARN")
-                except Exception:
-                    pass
-                if not password_provider:
-                    raise
-                password = password_provider(archive_path, "incorrect")
-                if password is None:
-                    raise ArchivePasswordCanceled("用户取消输入密码")
-
-    def unzip_single_zip(self, zip_path, progress_callback=None, password_provider=None):
+    def _list_archive(self, archive_path):
         """
         功能定位:
-        - 将单个 ZIP/RAR 压缩包解压导入到语音包库目录（以压缩包文件名作为语音包目录名）。
+        - 只读取压缩包目录信息（不解压），列出成员名、未压缩大小与加密状态。
 
         输入输出:
         - 参数:
-          - zip_path: str | Path，压缩包路径（.zip/.rar）。
-          - progress_callback: Callable[[int, str], None] | None，进度回调。
-          - password_provider: Callable[[Path, str], str | None] | None，密码提供器；reason 取值 required/incorrect。
-        - 返回: None
-        - 外部资源/依赖:
-          - 目录: self.library_dir（写入目标语音包目录）
-          - 系统能力: zipfile 或 7z 可执行文件
+          - archive_path: Path，压缩包路径（.zip/.rar）。
+        - 返回:
+          - dict，包含 format、entries（[{name, size, is_dir, encrypted, crc, member}]）、header_encrypted（RAR 文件头加密，无法列出成员）。
+        - 外部资源/依赖: zipfile（中央目录）、7z l -slt（RAR）
 
         实现逻辑:
-        - 1) 校验文件存在且扩展名合法。
-        - 2) 执行磁盘空间估算与校验（不足时抛出异常）。
-        - 3) 目标目录已存在则跳过导入。
-        - 4) 创建目标目录并调用 _extract_archive_with_password 解压。
-        - 5) 解压完成后执行命名规范化（info.json、cover.png）。
+        - 1) ZIP：遍历 infolist，成员名取 ZipExtractor.member_names（整包检测编码，结果缓存）。
+        - 2) RAR：解析 7z l -slt 输出中 "----------" 之后的 Path/Size/Folder/Encrypted/CRC 字段块；
+             以空密码运行，文件头加密时 7z 报密码错误，标记 header_encrypted。
 
         业务关联:
-        - 上游: main.py 的“导入选中压缩包”流程。
-        - 下游: 新增语音包目录会被 scan_library/get_mod_details 识别并展示。
+        - 上游: inspect_archive、导入前的磁盘空间预检。
+        - 下游: 预览信息与空间估算。
         """
-        zip_path = Path(zip_path)
+        archive_path = Path(archive_path)
+        suffix = archive_path.suffix.lower()
+        entries = []
+        if suffix == ".zip":
+            with zipfile.ZipFile(archive_path, "r") as zf:
+                for m, name in zip(zf.infolist(), self._zip_extractor.member_names(zf)):
+                    entries.append({
+                        "name": name,
+                        "size": int(m.file_size or 0),
+                        "is_dir": m.is_dir(),
+                        "encrypted": bool(m.flag_bits & 0x1),
+                        "crc": int(m.CRC or 0),
+                        "member": m.filename,
+                    })
+            return {"format": "zip", "entries": entries, "header_encrypted": False}
+        if suffix != ".rar":
+            raise Exception("不支持的压缩格式")
 
-        if not zip_path.exists():
-            self.log(f"文件不存在: {zip_path}", "ERROR")
-            return
-        if zip_path.suffix.lower() not in (".zip", ".rar"):
-            raise ValueError("请选择有效的 .zip 或 .rar 文件")
+        seven_zip = self._find_7z()
+        if not seven_zip:
+            raise Exception("未检测到 7z 解压组件，请安装 7-Zip 后重试")
+        code, output, password_error = self._run_7z([seven_zip, "l", "-slt", "-p", str(archive_path)])
+        if password_error:
+            return {"format": "rar", "entries": [], "header_encrypted": True}
+        if code != 0:
+            raise Exception(output.strip() or "读取压缩包失败")
 
-        # 磁盘空间估算与校验
+        current = None
+        started = False
+        for line in output.splitlines():
+            if not started:
+                started = line.startswith("----------")
+                continue
+            key, sep, value = line.partition(" = ")
+            if not sep:
+                continue
+            key = key.strip()
+            if key == "Path":
+                current = {"name": value.replace("\\", "/"), "size": 0, "is_dir": False, "encrypted": False, "crc": 0, "member": value}
+                entries.append(current)
+            elif current is None:
+                continue
+            elif key == "Size":
+                try:
+                    current["size"] = int(value or 0)
+                except ValueError:
+                    pass
+            elif key == "Folder":
+                current["is_dir"] = value.strip() == "+"
+            elif key == "Attributes" and value.startswith("D"):
+                current["is_dir"] = True
+            elif key == "Encrypted":
+                current["encrypted"] = value.strip() == "+"
+            elif key == "CRC":
+                try:
+                    current["crc"] = int(value.strip() or "0", 16)
+                except ValueError:
+                    pass
+        return {"format": "rar", "entries": entries, "header_encrypted": False}
+
+    def _keeps_member(self, name):
+        """voice 筛选方案：判断成员是否为可安装内容（.bank、info.*/cover.*，或匹配允许列表）。"""
+        base = name.replace("\\", "/").rsplit("/", 1)[-1].lower()
+        if base.endswith(VOICE_KEEP_EXTENSIONS):
+            return True
+        if base.rsplit(".", 1)[0] in VOICE_META_STEMS:
+            return True
+        return any(fnmatch.fnmatchcase(base, str(p).lower()) for p in self.import_allow_patterns)
+
+    def _member_filter(self, listing):
+        """
+        功能定位:
+        - 按当前导入筛选方案决定本次导入的成员筛选函数，并列出将被跳过的成员。
+
+        输入输出:
+        - 参数:
+          - listing: dict | None，_list_archive 的结果。
+        - 返回:
+          - tuple[Callable[[str], bool] | None, list[list]]，(筛选函数, [[成员名, 大小], ...])；不筛选时为 (None, [])。
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 1) 方案为 all、目录无法读取（如 RAR 文件头加密）时不筛选。
+        - 2) 压缩包中没有任何可安装内容时不筛选，按完整内容导入，避免得到空目录。
+
+        业务关联:
+        - 上游: _preflight_archive。
+        - 下游: 解压时的成员筛选、空间预检与索引中的跳过记录。
+        """
+        if self.import_filter != IMPORT_FILTER_VOICE or not listing:
+            return None, []
+        files = [e for e in listing["entries"] if not e["is_dir"] and not is_junk_member(e["name"])]
+        skipped = [[e["name"], int(e["size"])] for e in files if not self._keeps_member(e["name"])]
+        if len(skipped) == len(files):
+            return None, []
+        return self._keeps_member, skipped
+
+    def _seven_zip_include_args(self):
+        """voice 筛选方案对应的 7z 包含开关（-ir! 递归匹配文件名）。"""
+        patterns = [f"*{ext}" for ext in VOICE_KEEP_EXTENSIONS]
+        patterns += [f"{stem}.*" for stem in VOICE_META_STEMS]
+        patterns += [str(p) for p in self.import_allow_patterns]
+        return [f"-ir!{p}" for p in patterns]
+
+    def _archive_required_bytes(self, listing, include=None):
+        """返回解压该压缩包需要写入的字节数（listing 来自 _list_archive；未压缩大小按分配单元取整；include 为成员筛选）。"""
+        return allocated_size(
+            e["size"] for e in listing["entries"]
+            if not e["is_dir"] and not is_junk_member(e["name"]) and (include is None or include(e["name"]))
+        )
+
+    def _archive_fingerprint(self, listing):
+        """由压缩包目录计算 (内容指纹, [文件数, 总字节数])；RAR 文件头加密无法列出成员时指纹为 None。"""
+        files = [e for e in listing["entries"] if not e["is_dir"] and not is_junk_member(e["name"])]
+        fingerprint = content_fingerprint((e["name"], e["size"], e["crc"]) for e in files)
+        return fingerprint, [len(files), sum(e["size"] for e in files)]
+
+    def _preflight_archive(self, archive_path, reserve=None, partial_dir=None):
+        """
+        功能定位:
+        - 导入前预检：读取一次压缩包目录，确定成员筛选、执行磁盘空间校验并计算内容指纹。
+
+        输入输出:
+        - 参数:
+          - archive_path: Path，压缩包路径。
+          - reserve: Callable[[int], None] | None，并行导入时的空间预占函数（内部完成校验与预占）；None 时直接校验。
+          - partial_dir: Path | None，续传时的未完成目录；其中已写入的字节从所需空间中扣除。
+        - 返回:
+          - tuple，(内容指纹, [文件数, 总字节数], 成员筛选函数, 将被跳过的 [[成员名, 大小], ...])；
+            目录读取失败时为 (None, None, None, [])。
+        - 外部资源/依赖: _list_archive、check_disk_space
+
+        实现逻辑:
+        - 1) 所需空间只计算筛选后保留的成员；内容指纹始终基于完整内容，与筛选方案无关。
+        - 2) 目录读取或空间查询本身失败时写 WARN 并跳过对应检查；空间不足时抛出 DiskSpaceError。
+
+        业务关联:
+        - 上游: unzip_single_zip、unzip_zips_to_library。
+        - 下游: LibraryIndex.find_duplicate/record_import。
+        """
         try:
-            zip_size = os.path.getsize(zip_path)
-            # 估算解压后大小 (通常是压缩包的 2-3 倍，这里保守估计 3 倍)
-            estimated_size = zip_size * 3
-            # 需要至少 2 倍的估算空间作为安全余量 (解压过程可能产生临时文件)
-            required_space = estimated_size * 2
-            
-            target_drive = Path(self.library_dir).anchor # 获取盘符 (如 C:\)
-            if not target_drive: target_drive = self.library_dir
-            
-            import shutil
-            total, used, free = shutil.disk_usage(target_drive)
-            
-            if free < required_space:
-                free_mb = free / (1024 * 1024)
-                required_mb = required_space / (1024 * 1024)
-                self.log(f"磁盘空间不足! 可用: {free_mb:.0f}MB, 需要: {required_mb:.0f}MB", "ERROR")
-                raise Exception(f"磁盘空间不足 (需 {required_mb:.0f}MB)")
-                
+            listing = self._list_archive(archive_path)
+        except Exception as e:
+            self.log(f"读取压缩包目录失败 (跳过预检): {e}", "WARN")
+            return None, None, None, []
+        include, skipped = self._member_filter(listing)
+        try:
+            required = self._archive_required_bytes(listing, include)
+            if partial_dir is not None:
+                required = max(0, required - tree_size(partial_dir))
+            if reserve is not None:
+                reserve(required)
+            else:
+                check_disk_space(self.library_dir, required)
+        except DiskSpaceError:
+            raise
         except Exception as e:
-            if "磁盘空间不足" in str(e):
-                raise e # 重新抛出给上层处理
             self.log(f"磁盘空间检查失败 (跳过检查): {e}", "WARN")
+        fingerprint, stats = self._archive_fingerprint(listing)
+        return fingerprint, stats, include, skipped
+
+    def _read_archive_member(self, archive_path, entry, max_bytes=8 * 1024 * 1024):
+        """读取压缩包内单个小成员的内容（ZIP 直接读取，RAR 经 7z e -so）；超过 max_bytes、加密或失败时返回 None。"""
+        if entry.get("encrypted") or int(entry.get("size") or 0) > max_bytes:
+            return None
+        try:
+            if Path(archive_path).suffix.lower() == ".zip":
+                with zipfile.ZipFile(archive_path, "r") as zf:
+                    return zf.read(entry["member"])
+            seven_zip = self._find_7z()
+            if not seven_zip:
+                return None
+            result = subprocess.run(
+                [seven_zip, "e", "-so", "-p", str(archive_path), entry["member"]],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+            )
+            if result.returncode != 0:
+                return None
+            return result.stdout
+        except Exception:
+            return None
+
+    def inspect_archive(self, archive_path):
+        """
+        功能定位:
+        - 不解压预览压缩包内容：可安装文件夹、智能标签、语言、info.json 元数据、封面与未压缩大小。
+
+        输入输出:
+        - 参数:
+          - archive_path: str | Path，压缩包路径（.zip/.rar）。
+        - 返回:
+          - dict，字段与 get_mod_details 对齐（title/author/version/date/note/links/tags/language/capabilities/
+            folders/size_str），另含 name、format、archive_size、uncompressed_size、file_count、bank_count、
+            cover_url（data URL 或空串）、has_info、encrypted、target_exists。
+        - 外部资源/依赖: _list_archive、_read_archive_member、缓存 self._inspect_cache
+
+        实现逻辑:
+        - 1) 以 (路径, 文件大小, mtime_ns) 为键命中缓存时直接返回副本。
+        - 2) 由目录信息计算大小与文件计数；标签与文件夹类型复用 _tags_from_bank_names/_folder_type_from_names。
+        - 3) 元数据按 get_mod_details 的候选顺序选择 info.json / info/info.json / *（AimerWT）.bank，
+             其次取层级最浅的 info.json 或含 aimerwt 的 .bank；封面取层级最浅的 cover.png/jpg/jpeg/bank。
+             只读取这两个小成员；成员加密时跳过（encrypted 置为 True）。
+
+        业务关联:
+        - 上游: main.py 的 inspect_archive 桥接接口（导入对话框预览）。
+        - 下游: 前端导入前展示语音包预览，避免解压错误的压缩包。
+        """
+        archive_path = Path(archive_path)
+        if not archive_path.is_file():
+            raise ValueError("压缩包不存在")
+        st = archive_path.stat()
+        cache_key = str(archive_path.resolve())
+        with self._inspect_lock:
+            cached = self._inspect_cache.get(cache_key)
+        if cached and cached[0] == (st.st_size, st.st_mtime_ns):
+            return dict(cached[1])
+
+        listing = self._list_archive(archive_path)
+        files = [e for e in listing["entries"] if not e["is_dir"] and not is_junk_member(e["name"])]
+
+        result = {
+            "name": archive_path.stem,
+            "format": listing["format"],
+            "archive_size": st.st_size,
+            "uncompressed_size": sum(e["size"] for e in files),
+            "file_count": len(files),
+            "bank_count": 0,
+            "title": archive_path.stem,
+            "author": "未知作者",
+            "version": "1.0",
+            "date": time.strftime("%Y-%m-%d", time.localtime(st.st_mtime)),
+            "note": "无详细介绍",
+            "link_bilibili": "",
+            "link_wtlive": "",
+            "link_video": "",
+            "tags": [],
+            "language": [],
+            "capabilities": {},
+            "folders": [],
+            "size_str": "",
+            "cover_url": "",
+            "has_info": False,
+            "encrypted": listing["header_encrypted"] or any(e["encrypted"] for e in files),
+            "target_exists": (self.library_dir / archive_path.stem).exists(),
+        }
+
+        # 文件夹与标签：与 _detect_mod_folders/_detect_smart_tags 使用相同规则
+        names_by_dir = {}
+        bank_dirs = set()
+        bank_names = []
+        for e in files:
+            parent, _, base = e["name"].rstrip("/").rpartition("/")
+            parent = parent or "."
+            names_by_dir.setdefault(parent, []).append(base)
+            if base.lower().endswith(".bank"):
+                bank_dirs.add(parent)
+                bank_names.append(base)
+        result["bank_count"] = len(bank_names)
+        result["folders"] = sorted(
+            (
+                {
+                    "path": d if d != "." else "根目录",
+                    "type": self._folder_type_from_names(names_by_dir.get(d, [])),
+                    "label": d if d != "." else "根目录",
+                }
+                for d in bank_dirs
+            ),
+            key=lambda x: x["path"],
+        )
+
+        # 元数据
+        def _depth(e):
+            return e["name"].count("/")
+
+        by_name = {e["name"].lower(): e for e in files}
+        info_entry = by_name.get("info.json") or by_name.get("info/info.json")
+        if info_entry is None:
+            for prefix in ("", "info/"):
+                for e in files:
+                    low = e["name"].lower()
+                    if low.startswith(prefix) and "/" not in low[len(prefix):] and \
+                            (low.endswith("（aimerwt）.bank") or low.endswith("(aimerwt).bank")):
+                        info_entry = e
+                        break
+                if info_entry:
+                    break
+        if info_entry is None:
+            info_jsons = sorted((e for e in files if e["name"].lower().rsplit("/", 1)[-1] == "info.json"), key=_depth)
+            aimer_banks = sorted((e for e in files if e["name"].lower().endswith(".bank") and "aimerwt" in e["name"].lower()), key=_depth)
+            info_entry = (info_jsons or aimer_banks or [None])[0]
+        if info_entry is not None:
+            data = self._read_archive_member(archive_path, info_entry, max_bytes=1024 * 1024)
+            meta = self._parse_json_bytes(data) if data else None
+            if isinstance(meta, dict):
+                result["has_info"] = True
+                for key in ["title", "author", "version", "date", "note", "link_bilibili", "link_wtlive", "link_video", "tags", "language"]:
+                    if key in meta:
+                        result[key] = meta[key]
+
+        combined_tags = []
+        for t in list(result["tags"]) + self._tags_from_bank_names(bank_names):
+            if t not in combined_tags:
+                combined_tags.append(t)
+        result["tags"] = combined_tags
+        if not result["language"]:
+            result["language"] = ["未识别"]
+        result["capabilities"] = self._capabilities_from_tags(result["tags"])
+
+        mb_size = result["uncompressed_size"] / (1024 * 1024)
+        result["size_str"] = "<1 MB" if mb_size < 1 else f"{int(mb_size)} MB"
+
+        # 封面
+        covers = sorted(
+            (e for e in files if e["name"].lower().rsplit("/", 1)[-1] in ("cover.png", "cover.jpg", "cover.jpeg", "cover.bank")),
+            key=_depth,
+        )
+        if covers:
+            data = self._read_archive_member(archive_path, covers[0])
+            if data:
+                ext = covers[0]["name"].rsplit(".", 1)[-1].lower()
+                mime = "jpeg" if ext in ("jpg", "jpeg") else "png"
+                result["cover_url"] = f"data:image/{mime};base64," + base64.b64encode(data).decode("ascii")
+
+        with self._inspect_lock:
+            if len(self._inspect_cache) >= 64:
+                self._inspect_cache.clear()
+            self._inspect_cache[cache_key] = ((st.st_size, st.st_mtime_ns), result)
+        return dict(result)
+
+    def _extract_archive_with_password(self, archive_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password_provider=None, threads=None, include=None):
+        password = None
+        seven_zip_args = self._seven_zip_include_args() if include is not None else None
+        while True:
+            try:
+                if archive_path.suffix.lower() == ".zip":
+                    try:
+                        self._extract_zip_safely(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password, threads=threads, include=include)
+                    except (NotImplementedError, RuntimeError) as e:
+                        msg = str(e).lower()
+                        if "compression method is not supported" in msg:
+                            self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password, threads=threads, extra_args=seven_zip_args)
+                        else:
+                            raise
+                elif archive_path.suffix.lower() == ".rar":
+                    self._extract_with_7z(archive_path, target_dir, progress_callback, base_progress, share_progress, password=password, threads=threads, extra_args=seven_zip_args)
+                else:
+                    raise Exception("不支持的压缩格式")
+                return
+            except ArchivePasswordRequired:
+                if not password_provider:
+                    raise
+                password = password_provider(archive_path, "required")
+                if password is None:
+                    raise ArchivePasswordCanceled("用户取消输入密码")
+            except ArchivePasswordIncorrect:
+                try:
+                    self.log("密码错误，请重试", "WARN")
+                except Exception:
+                    pass
+                if not password_provider:
+                    raise
+                password = password_provider(archive_path, "incorrect")
+                if password is None:
+                    raise ArchivePasswordCanceled("用户取消输入密码")
+
+    def _open_import_dir(self, archive_path, target_dir, resume):
+        """
+        功能定位:
+        - 为导入准备目标目录并写入断点日志头部，使中断后的目录可被识别为未完成的导入。
+
+        输入输出:
+        - 参数:
+          - archive_path: Path，压缩包路径。
+          - target_dir: Path，语音包目标目录。
+          - resume: bool，目标目录是否为未完成的导入（已有断点日志）。
+        - 返回:
+          - bool，是否沿用目录中已解压的文件续传。
+        - 外部资源/依赖: ExtractJournal、文件系统
+
+        实现逻辑:
+        - 1) 日志属于其他压缩包（同名压缩包已被替换）时清空目录重新开始。
+        - 2) 创建目录（续传时允许已存在）并写入或沿用日志头部。
+        - 3) 逐成员续传在 ZipExtractor 与交给 7z 的加密 ZIP 路径生效（后者由 ZipExtractor.verify_written 补记日志）；RAR 续传时整包重新解压（7z 覆盖已有文件）。
+
+        业务关联:
+        - 上游: unzip_single_zip、unzip_zips_to_library。
+        - 下游: _extract_zip_safely（ZipExtractor.extract resume=True）；导入完成后 ExtractJournal.discard。
+        """
+        journal = ExtractJournal(target_dir)
+        if resume and not journal.matches(archive_path):
+            self.log(f"[WARN] 压缩包已变化，重新导入: {archive_path.name}", "WARN")
+            shutil.rmtree(target_dir)
+            resume = False
+        target_dir.mkdir(exist_ok=resume)
+        journal.begin(archive_path)
+        journal.close()
+        return resume
+
+    def _log_filtered(self, skipped):
+        """记录导入筛选跳过的成员数量与体积。"""
+        if skipped:
+            total_mb = sum(size for _name, size in skipped) / (1024 * 1024)
+            self.log(f"[INFO] 已跳过 {len(skipped)} 个非安装文件 ({total_mb:.1f}MB)，明细已记录到语音包库索引", "INFO")
+
+    def _discard_failed_import(self, target_dir):
+        """导入失败或取消时的清理：断点日志中已有完整写入的成员时保留目录供下次续传，否则删除目录。"""
+        if not target_dir.exists():
+            return
+        _header, done = ExtractJournal(target_dir).load()
+        if done:
+            self.log(f"[INFO] 已保留 {len(done)} 个已解压文件，重新导入同一压缩包时将从断点继续", "INFO")
+            return
+        try: shutil.rmtree(target_dir)
+        except: pass
+
+    def _finalize_import(self, mod_name, target_dir, archive_path, fingerprint, skipped):
+        """
+        功能定位:
+        - 导入流水线的入库阶段：命名规范化、删除断点日志、更新语音包库索引并记录导入。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包名称。
+          - target_dir: Path，解压完成的语音包目录。
+          - archive_path: Path | None，来源压缩包；文件夹导入时为 None（无压缩包指纹可记录）。
+          - fingerprint: str | None，压缩包内容指纹。
+          - skipped: list，导入筛选跳过的 [成员名, 大小]。
+        - 返回: None
+        - 外部资源/依赖: _normalize_wtlive_compat_files、ExtractJournal、LibraryIndex.refresh/record_import
+
+        实现逻辑:
+        - 1) 规范化 info.json/cover.png 后删除断点日志（此后目录才会被 scan_library 计入）。
+        - 2) 只重扫该语音包并重建冲突矩阵（prune=False，不影响其他条目），再记录指纹与跳过明细。
+
+        业务关联:
+        - 上游: unzip_single_zip、unzip_zips_to_library（单独的入库工作线程）。
+        - 下游: 导入完成时索引与冲突关系已是最新，无需等待下一次列表刷新。
+        """
+        self._normalize_wtlive_compat_files(target_dir)
+        ExtractJournal(target_dir).discard()
+        self._log_filtered(skipped)
+        self.index.refresh([mod_name], prune=False)
+        if archive_path is not None:
+            self.index.record_import(mod_name, fingerprint, archive_path.name, archive_path.stat().st_size, skipped=skipped)
+
+    def unzip_single_zip(self, zip_path, progress_callback=None, password_provider=None):
+        """
+        功能定位:
+        - 将单个 ZIP/RAR 压缩包解压导入到语音包库目录（以压缩包文件名作为语音包目录名）。
+
+        输入输出:
+        - 参数:
+          - zip_path: str | Path，压缩包路径（.zip/.rar）。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - password_provider: Callable[[Path, str], str | None] | None，密码提供器；reason 取值 required/incorrect。
+        - 返回: None
+        - 外部资源/依赖:
+          - 目录: self.library_dir（写入目标语音包目录）
+          - 系统能力: zipfile 或 7z 可执行文件
+
+        实现逻辑:
+        - 1) 校验文件存在且扩展名合法。
+        - 2) 目标目录已存在或同名语音包已归档到冷存储则跳过导入；目录中有断点日志（上次导入被中断）时改为续传。
+        - 3) 读取一次压缩包目录：按未压缩大小执行磁盘空间预检（续传时扣除已写入部分，不足时抛出 DiskSpaceError），
+             并计算内容指纹；与库中已有语音包内容相同则跳过导入（不解压）。
+        - 4) 准备目标目录（_open_import_dir）并调用 _extract_archive_with_password 解压，逐成员写入断点日志；
+             voice 筛选方案下只解压可安装内容，被跳过的成员记录到索引。
+        - 5) 解压完成后执行入库阶段（_finalize_import：命名规范化、删除断点日志、索引更新与导入记录），
+             再预热详情与封面缓存（warm_mod）；进度 0-90 为解压，90-100 为入库与预热。
+        - 6) 失败或取消时已有完整写入的成员则保留目录（_discard_failed_import），下次导入同一压缩包从断点继续。
+
+        业务关联:
+        - 上游: main.py 的“导入选中压缩包”流程。
+        - 下游: 新增语音包目录会被 scan_library/get_mod_details 识别并展示。
+        """
+        zip_path = Path(zip_path)
+
+        if not zip_path.exists():
+            self.log(f"文件不存在: {zip_path}", "ERROR")
+            return
+        if zip_path.suffix.lower() not in (".zip", ".rar"):
+            raise ValueError("请选择有效的 .zip 或 .rar 文件")
 
         mod_name = zip_path.stem
         target_dir = self.library_dir / mod_name
         
+        resume = False
+        if self.index.cold_entry(mod_name) is not None:
+            self.log(f"[SKIPPED] 跳过重复: {mod_name} (已归档到冷存储，如需重新导入请先恢复或删除)", "WARN")
+            if progress_callback: progress_callback(100, "跳过重复文件")
+            return
         if target_dir.exists():
-            self.log(f"[SKIPPED] 跳过重复: {mod_name} (库中已存在)", "WARN")
-            self.log("提示: 如果想重新导入，请先删除库中的同名文件夹。", "INFO")
+            if not ExtractJournal.exists(target_dir):
+                self.log(f"[SKIPPED] 跳过重复: {mod_name} (库中已存在)", "WARN")
+                self.log("提示: 如果想重新导入，请先删除库中的同名文件夹。", "INFO")
+                if progress_callback: progress_callback(100, "跳过重复文件")
+                return
+            resume = True
+
+        # 预检：磁盘空间（按未压缩大小）与内容指纹（只读压缩包目录）
+        try:
+            fingerprint, stats, include, skipped = self._preflight_archive(zip_path, partial_dir=target_dir if resume else None)
+        except DiskSpaceError as e:
+            self.log(str(e), "ERROR")
+            raise
+        duplicate = self.index.find_duplicate(fingerprint, stats)
+        if duplicate:
+            self.log(f"[SKIPPED] 跳过重复内容: {zip_path.name} 与库中的 {duplicate} 内容相同", "WARN")
+            if resume:
+                try: shutil.rmtree(target_dir)
+                except: pass
             if progress_callback: progress_callback(100, "跳过重复文件")
             return
         
         try:
-            target_dir.mkdir()
-            self.log(f"[UNZIP] 正在导入: {zip_path.name}", "UNZIP")
+            if self._open_import_dir(zip_path, target_dir, resume):
+                self.log(f"[UNZIP] 继续未完成的导入: {zip_path.name}", "UNZIP")
+            else:
+                self.log(f"[UNZIP] 正在导入: {zip_path.name}", "UNZIP")
 
             self._extract_archive_with_password(
                 zip_path,
                 target_dir,
                 progress_callback,
                 0,
-                100,
+                90,
                 password_provider=password_provider,
+                include=include,
             )
-            self._normalize_wtlive_compat_files(target_dir)
+            if progress_callback: progress_callback(92, f"更新索引: {mod_name}")
+            self._finalize_import(mod_name, target_dir, zip_path, fingerprint, skipped)
+            if progress_callback: progress_callback(96, f"生成预览: {mod_name}")
+            self.warm_mod(mod_name)
             self.log(f"[SUCCESS] 导入成功: {mod_name}", "SUCCESS")
+            if progress_callback: progress_callback(100, "导入完成")
         except ArchivePasswordCanceled:
             self.log("[WARN] 已取消输入密码，导入已终止", "WARN")
-            if target_dir.exists():
-                try: shutil.rmtree(target_dir)
-                except: pass
+            self._discard_failed_import(target_dir)
             raise
         except Exception as e:
             self.log(f"[ERROR] 导入失败: {e}", "ERROR")
-            if target_dir.exists():
-                try: shutil.rmtree(target_dir)
-                except: pass
+            self._discard_failed_import(target_dir)
             raise
 
-    def unzip_zips_to_library(self, progress_callback=None, password_provider=None):
+    def unzip_zips_to_library(self, progress_callback=None, password_provider=None, archives=None, max_workers=None):
         """
         功能定位:
-        - 批量导入待解压区中的 ZIP/RAR 文件到语音包库，并通过回调输出总体进度。
+        - 批量导入待解压区中的 ZIP/RAR 文件到语音包库：解压 -> 入库（规范化、索引）-> 预热（详情、封面）三段流水线，
+          每段使用独立的工作线程，已解压完的压缩包在后续压缩包仍在解压时进入后续阶段；通过回调输出合并后的总体进度。
 
         输入输出:
         - 参数:
           - progress_callback: Callable[[int, str], None] | None，总体进度回调。
           - password_provider: Callable[[Path, str], str | None] | None，密码提供器。
+          - archives: list[Path] | None，指定要导入的压缩包列表；None 时扫描待解压区。
+          - max_workers: int | None，并行解压的压缩包数量；None 时取 min(4, CPU 核数, 压缩包数)。
         - 返回: None
         - 外部资源/依赖:
           - 目录: self.pending_dir（读取压缩包列表）、self.library_dir（写入解压结果）
+          - 系统能力: concurrent.futures 线程池（zlib 解压时释放 GIL，多线程可利用多核）
 
         实现逻辑:
-        - 1) scan_pending 获取待处理压缩包列表；为空则直接返回。
-        - 2) 对每个压缩包计算其进度区间（base_progress/share_progress）。
-        - 3) 若目标目录已存在则记录为跳过；否则创建目录并解压导入。
-        - 4) 对每个成功导入的语音包执行命名规范化。
+        - 1) 使用 archives 或 scan_pending 获取待处理压缩包列表；为空则直接返回。
+        - 2) 线程池中每个压缩包独立解压，进度按 0-100 上报到合并器，合并器取所有压缩包进度的平均值并节流输出。
+        - 3) 同批次同名压缩包、库中已存在的目标目录与冷存储中的同名语音包记录为跳过；目录中有断点日志（上次导入被中断）时续传。
+        - 4) 每个压缩包内部可用的解压线程数为 CPU 核数 / 并行压缩包数（见 _extract_zip_safely 多线程模式）。
+        - 5) password_provider 调用通过锁串行化：同一时刻只有一个密码弹窗，等待密码的压缩包不影响其他压缩包继续解压。
+        - 6) 解压成功的压缩包提交到入库线程（单线程，索引写入串行）执行 _finalize_import，完成后提交到预热线程执行 warm_mod；
+             每个压缩包的进度 0-90 为解压、95 为入库、100 为预热完成，总体进度到 100 时语音包列表所需数据均已缓存。
+        - 7) 解压前按未压缩大小做磁盘空间预检，并扣除其他进行中压缩包已预占的空间；空间不足的压缩包记为失败。
+        - 8) 内容指纹与库中语音包或同批次先处理的压缩包相同时跳过（不解压）；成功导入后删除断点日志并记录指纹。
+        - 9) 失败或取消时已有完整写入的成员则保留目录，下次导入同一压缩包从断点继续。
+        - 10) voice 筛选方案下只解压可安装内容，被跳过的成员记录到索引（与单个导入一致）。
 
         业务关联:
         - 上游: main.py 的“批量导入”流程。
         - 下游: 导入完成后前端刷新语音包库列表以展示新内容。
         """
-        zips = self.scan_pending()
+        zips = list(archives) if archives is not None else self.scan_pending()
         if not zips:
             self.log("待解压区没有 ZIP/RAR 文件。", "WARN")
             if progress_callback: progress_callback(100, "没有文件")
             return
 
         total = len(zips)
-        self.log(f"发现 {total} 个待解压文件...", "INFO")
-        
-        success_count = 0
-        skipped_count = 0
-        
-        for idx, zip_file in enumerate(zips):
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1, total)
+        max_workers = max(1, int(max_workers))
+        self.log(f"发现 {total} 个待解压文件，并行数 {max_workers}...", "INFO")
+        # 压缩包间并行与压缩包内并行共享 CPU：每个压缩包可用的解压线程数
+        zip_threads = max(1, (os.cpu_count() or 1) // max_workers)
+
+        # 合并进度：每个压缩包 0-100，总体进度为平均值；限制推送频率避免多线程刷屏
+        progress_lock = threading.Lock()
+        per_archive = [0.0] * total
+        last_emit = [0.0]
+
+        def _report(idx, value, message, force=False):
+            with progress_lock:
+                try:
+                    per_archive[idx] = max(per_archive[idx], min(100.0, float(value)))
+                except Exception:
+                    pass
+                now = time.monotonic()
+                if not progress_callback or (not force and now - last_emit[0] < 0.1):
+                    return
+                last_emit[0] = now
+                overall = sum(per_archive) / total
             try:
-                mod_name = zip_file.stem
-                target_dir = self.library_dir / mod_name
-                
-                # 计算总体进度区间
-                base_progress = (idx / total) * 100
-                share_progress = (1 / total) * 100
-                
-                if target_dir.exists():
-                    self.log(f"[SKIPPED] 跳过重复: {mod_name}", "WARN")
-                    skipped_count += 1
-                    if progress_callback:
-                        progress_callback(base_progress + share_progress, f"跳过: {mod_name}")
-                    continue
-                
-                target_dir.mkdir()
-                self.log(f"[UNZIP] 正在解压 ({idx + 1}/{total}): {zip_file.name}", "UNZIP")
+                progress_callback(int(overall), message)
+            except Exception:
+                pass
 
+        # 磁盘空间预占：并行解压时每个压缩包预检都扣除其他进行中任务已预占的空间
+        space_lock = threading.Lock()
+        reserved = [0]
+        # 本批次已认领的内容指纹 -> 压缩包文件名；已认领的目标目录名
+        claimed = {}
+        claimed_dirs = set()
+
+        # 密码弹窗串行化：持锁期间只阻塞请求密码的那个工作线程
+        password_lock = threading.Lock()
+        serialized_provider = None
+        if password_provider:
+            def serialized_provider(archive_path, reason):
+                with password_lock:
+                    return password_provider(archive_path, reason)
+
+        def _import_one(idx, zip_file):
+            mod_name = zip_file.stem
+            target_dir = self.library_dir / mod_name
+            with space_lock:
+                taken = mod_name in claimed_dirs
+                claimed_dirs.add(mod_name)
+            if not taken and self.index.cold_entry(mod_name) is not None:
+                self.log(f"[SKIPPED] 跳过重复: {mod_name} (已归档到冷存储)", "WARN")
+                _report(idx, 100, f"跳过: {mod_name}", force=True)
+                return "skipped", None
+            resume = not taken and target_dir.exists()
+            if taken or (resume and not ExtractJournal.exists(target_dir)):
+                self.log(f"[SKIPPED] 跳过重复: {mod_name}", "WARN")
+                _report(idx, 100, f"跳过: {mod_name}", force=True)
+                return "skipped", None
+
+            held = [0]
+            opened = False
+            try:
+                def _reserve(required):
+                    with space_lock:
+                        check_disk_space(self.library_dir, required, reserved=reserved[0])
+                        reserved[0] += required
+                        held[0] = required
+
+                fingerprint, stats, include, skipped = self._preflight_archive(
+                    zip_file, reserve=_reserve, partial_dir=target_dir if resume else None
+                )
+                # 同批次内容相同的压缩包只导入第一个
+                with space_lock:
+                    first = claimed.setdefault(fingerprint, zip_file.name) if fingerprint else zip_file.name
+                if first != zip_file.name:
+                    duplicate = f"同批次的 {first}"
+                else:
+                    duplicate = self.index.find_duplicate(fingerprint, stats)
+                    if duplicate:
+                        duplicate = f"库中的 {duplicate}"
+                if duplicate:
+                    self.log(f"[SKIPPED] 跳过重复内容: {zip_file.name} 与{duplicate} 内容相同", "WARN")
+                    if resume:
+                        try: shutil.rmtree(target_dir)
+                        except: pass
+                    _report(idx, 100, f"跳过: {mod_name}", force=True)
+                    return "skipped", None
+                resume = self._open_import_dir(zip_file, target_dir, resume)
+                opened = True
+                action = "继续解压" if resume else "正在解压"
+                self.log(f"[UNZIP] {action} ({idx + 1}/{total}): {zip_file.name}", "UNZIP")
                 self._extract_archive_with_password(
                     zip_file,
                     target_dir,
-                    progress_callback,
-                    base_progress,
-                    share_progress,
-                    password_provider=password_provider,
+                    lambda p, msg: _report(idx, p, msg),
+                    0,
+                    90,
+                    password_provider=serialized_provider,
+                    threads=zip_threads,
+                    include=include,
                 )
-                self._normalize_wtlive_compat_files(target_dir)
-                
-                success_count += 1
                 self.log(f"[SUCCESS] 解压成功: {mod_name}", "SUCCESS")
+                _report(idx, 90, f"解压完成: {mod_name}", force=True)
+                return "success", finalize_pool.submit(_finalize, idx, mod_name, target_dir, zip_file, fingerprint, skipped)
             except ArchivePasswordCanceled:
                 self.log(f"[WARN] 已取消输入密码，跳过: {zip_file.name}", "WARN")
-                if target_dir.exists():
-                    try: shutil.rmtree(target_dir)
-                    except: pass
-                if progress_callback:
-                    progress_callback(base_progress + share_progress, f"跳过: {mod_name}")
-                skipped_count += 1
+                if opened:
+                    self._discard_failed_import(target_dir)
+                _report(idx, 100, f"跳过: {mod_name}", force=True)
+                return "skipped", None
             except Exception as e:
                 self.log(f"[ERROR] 解压 {zip_file.name} 失败: {e}", "ERROR")
-                if target_dir.exists():
-                    try: shutil.rmtree(target_dir)
-                    except: pass
+                if opened:
+                    self._discard_failed_import(target_dir)
+                _report(idx, 100, f"失败: {mod_name}", force=True)
+                return "failed", None
+            finally:
+                with space_lock:
+                    reserved[0] -= held[0]
+
+        def _finalize(idx, mod_name, target_dir, zip_file, fingerprint, skipped):
+            try:
+                self._finalize_import(mod_name, target_dir, zip_file, fingerprint, skipped)
+            except Exception as e:
+                self.log(f"[WARN] 更新索引失败 ({mod_name}): {e}", "WARN")
+            _report(idx, 95, f"已入库: {mod_name}")
+            return warm_pool.submit(_warm, idx, mod_name)
+
+        def _warm(idx, mod_name):
+            try:
+                self.warm_mod(mod_name)
+            except Exception as e:
+                self.log(f"[WARN] 生成预览失败 ({mod_name}): {e}", "WARN")
+            _report(idx, 100, f"导入完成: {mod_name}", force=True)
+
+        results = []
+        # 退出顺序：解压线程池先关闭，随后入库与预热线程池依次排空
+        with ThreadPoolExecutor(max_workers=2) as warm_pool, \
+                ThreadPoolExecutor(max_workers=1) as finalize_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_import_one, idx, zip_file) for idx, zip_file in enumerate(zips)]
+            post = []
+            for fut in futures:
+                try:
+                    status, finalize_future = fut.result()
+                except Exception as e:
+                    self.log(f"[ERROR] 解压任务异常: {e}", "ERROR")
+                    status, finalize_future = "failed", None
+                results.append(status)
+                if finalize_future is not None:
+                    post.append(finalize_future)
+            for finalize_future in post:
+                try:
+                    finalize_future.result().result()
+                except Exception as e:
+                    self.log(f"[WARN] 导入后处理异常: {e}", "WARN")
 
+        success_count = results.count("success")
+        skipped_count = results.count("skipped")
         self.log(f"[INFO] 解压完成: 成功 {success_count}, 跳过 {skipped_count}", "INFO")
         if progress_callback: progress_callback(100, "全部完成")
 
-    def _extract_zip_safely(self, zip_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None):
+    def _populate_folder(self, source_dir, target_dir, use_links, journal, on_progress=None):
         """
         功能定位:
-        - 解压 ZIP 文件到目标目录，并提供进度回调与路径边界校验。
+        - 将已解压文件夹的文件树硬链接或复制到语音包目录，每个文件写完后记入断点日志。
 
         输入输出:
         - 参数:
-          - zip_path: Path，ZIP 文件路径。
-          - target_dir: Path，目标解压目录。
-          - progress_callback: Callable[[int, str], None] | None，进度回调。
-          - base_progress: float|int，该 ZIP 在总体进度中的起始百分比。
-          - share_progress: float|int，该 ZIP 在总体进度中的占比。
-          - password: str | None，ZIP 密码（若需要）。
-        - 返回: None
-        - 外部资源/依赖:
-          - 文件系统: 创建目录并写入解压文件
-          - zipfile: 读取 ZIP 成员并按块写入
+          - source_dir: Path，源文件夹。
+          - target_dir: Path，语音包目录（已存在）。
+          - use_links: bool，是否优先创建硬链接。
+          - journal: ExtractJournal，已打开且属于该源文件夹的断点日志。
+          - on_progress: Callable[[int, int, str], None] | None，进度回调 (已处理字节, 总字节, 当前文件)，按 PROGRESS_INTERVAL 节流。
+        - 返回:
+          - tuple[int, int]，(硬链接文件数, 复制文件数)。
+        - 外部资源/依赖: os.link、shutil.copy2、check_disk_space
 
         实现逻辑:
-        - 1) 读取成员列表并计算总文件数/总字节数（用于进度估算）。
-        - 2) 逐成员解码文件名并过滤无效项（如 __MACOSX、desktop.ini）。
-        - 3) 将目标路径 resolve 后校验必须位于 target_root 内，否则跳过该成员。
-        - 4) 对文件成员按块写入，同时更新 extracted_bytes 并节流更新进度。
+        - 1) os.walk 遍历源文件夹（不跟随符号链接）得到文件清单；目标文件大小与 mtime_ns 都与源文件一致才视为上次已完成
+             （硬链接共享 inode，copy2 在写完内容后才复制 mtime，写到一半的文件不会被误判），其余文件删除后重写。
+        - 2) 需要复制数据时（不使用硬链接，或硬链接失败后改为复制）先按剩余待写文件做磁盘空间预检。
+        - 3) 硬链接失败（跨盘、文件系统不支持）后本次剩余文件改为复制。
 
         业务关联:
-        - 上游: _extract_archive_with_password 在处理 .zip 时调用。
-        - 下游: 生成语音包库目录结构，供后续扫描与元数据读取。
+        - 上游: _transfer_folder。
+        - 下游: 中断后目录保留断点日志，重新导入同一文件夹时跳过已完成的文件。
         """
-        import time
-        target_root = Path(target_dir).resolve()
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            file_list = zf.infolist()
-            total_files = len(file_list)
-            last_update = 0.0
-            extracted_bytes = 0
-            total_bytes = 0
+        pending = []
+        for root, dirs, files in os.walk(source_dir):
+            rel = os.path.relpath(root, source_dir)
+            dest_root = target_dir if rel == "." else target_dir / rel
+            dest_root.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                src = os.path.join(root, name)
+                if os.path.islink(src):
+                    continue
+                src_st = os.stat(src)
+                dst = dest_root / name
+                try:
+                    dst_st = dst.stat()
+                except OSError:
+                    dst_st = None
+                if dst_st is not None:
+                    if dst_st.st_size == src_st.st_size and dst_st.st_mtime_ns == src_st.st_mtime_ns:
+                        continue
+                    dst.unlink()
+                pending.append((src, dst, src_st.st_size))
+
+        total = sum(size for _s, _d, size in pending) or 1
+        if not use_links:
+            check_disk_space(self.library_dir, allocated_size(size for _s, _d, size in pending))
+        linked = copied = 0
+        done = 0
+        last_emit = 0.0
+        for idx, (src, dst, size) in enumerate(pending):
+            if use_links:
+                try:
+                    os.link(src, dst)
+                    linked += 1
+                except OSError as e:
+                    self.log(f"[WARN] 无法创建硬链接，改为复制: {e}", "WARN")
+                    use_links = False
+                    check_disk_space(self.library_dir, allocated_size(s for _s, _d, s in pending[idx:]))
+            if not use_links:
+                shutil.copy2(src, dst)
+                copied += 1
+            journal.record(dst.relative_to(target_dir).as_posix(), size, 0)
+            done += size
+            now = time.monotonic()
+            if on_progress and now - last_emit >= PROGRESS_INTERVAL:
+                last_emit = now
+                on_progress(done, total, dst.name)
+        return linked, copied
+
+    def _transfer_folder(self, source_dir, target_dir, mode, resume, on_progress=None):
+        """
+        功能定位:
+        - 按导入方式把源文件夹转移到语音包目录，返回实际使用的方式（rename/hardlink/copy）。
+
+        输入输出:
+        - 参数:
+          - source_dir: Path，源文件夹（已 resolve）。
+          - target_dir: Path，语音包目录。
+          - mode: str，IMPORT_MODES 之一。
+          - resume: bool，目标目录是否为上次中断的导入（含断点日志）。
+          - on_progress: Callable[[int, int, str], None] | None，逐文件转移时的进度回调（见 _populate_folder）。
+        - 返回:
+          - str，"rename" | "hardlink" | "copy"。
+        - 外部资源/依赖: os.rename、_populate_folder、ExtractJournal
+
+        实现逻辑:
+        - 1) 目标目录中的断点日志不属于该文件夹（如同名压缩包中断的导入）时清空目录重新开始，与 _open_import_dir 一致。
+        - 2) move 且与语音包库同盘：os.rename 整个目录（O(1)，不复制数据）；重命名失败（文件被占用等）时退到逐文件转移。
+        - 3) 逐文件转移：同盘时硬链接，否则复制（磁盘空间预检见 _populate_folder）。
+        - 4) 转移期间目录含断点日志，scan_library 不会列出半成品；move 方式在全部文件转移后才删除源文件夹。
+
+        业务关联:
+        - 上游: import_folder。
+        - 下游: 返回后由 _finalize_import 完成规范化与索引。
+        """
+        if resume and not ExtractJournal(target_dir).matches(source_dir):
+            self.log(f"[WARN] 目录中未完成的导入不属于该文件夹，重新导入: {target_dir.name}", "WARN")
+            shutil.rmtree(target_dir)
+            resume = False
+        try:
+            same_volume = os.stat(source_dir).st_dev == os.stat(self.library_dir).st_dev
+        except OSError:
+            same_volume = False
+        if mode == IMPORT_MODE_MOVE and same_volume and not resume:
+            try:
+                os.rename(source_dir, target_dir)
+                return "rename"
+            except OSError as e:
+                self.log(f"[WARN] 无法直接移动 {source_dir.name}，改为逐文件转移: {e}", "WARN")
+
+        use_links = same_volume and mode != IMPORT_MODE_COPY
+        target_dir.mkdir(exist_ok=resume)
+        journal = ExtractJournal(target_dir)
+        journal.begin(source_dir)
+        try:
+            linked, copied = self._populate_folder(source_dir, target_dir, use_links, journal, on_progress)
+        finally:
+            journal.close()
+        if mode == IMPORT_MODE_MOVE:
+            try:
+                shutil.rmtree(source_dir)
+            except OSError as e:
+                self.log(f"[WARN] 已导入但未能删除源文件夹 {source_dir}: {e}", "WARN")
+        return "copy" if copied else "hardlink"
+
+    def import_folder(self, folders, mode=IMPORT_MODE_MOVE, progress_callback=None):
+        """
+        功能定位:
+        - 将已解压的语音包文件夹（可批量）导入语音包库，无需重新打包成压缩包。
+
+        输入输出:
+        - 参数:
+          - folders: str | Path | list[str | Path]，一个或多个源文件夹；文件夹名即语音包名。
+          - mode: str，"move"（默认，同盘 O(1) 重命名）| "link"（硬链接，源文件夹保留）| "copy"。
+          - progress_callback: Callable[[int, str], None] | None，总体进度回调。
+        - 返回:
+          - dict，{"imported": [语音包名], "skipped": [语音包名], "failed": [文件夹路径]}。
+        - 外部资源/依赖: _transfer_folder、_finalize_import、warm_mod、线程池
+
+        实现逻辑:
+        - 1) 逐个校验源文件夹：必须是目录、不能是语音包库本身或其内部/上级目录；同名语音包已存在（含冷存储）时跳过，
+             同名目录含断点日志（上次导入中断）时续传。
+        - 2) 转移在调用线程中依次执行（磁盘 I/O 为主，同盘移动几乎瞬时）；每个文件夹转移完成后提交到
+             入库线程（规范化、索引）与预热线程（详情、封面），与 unzip_zips_to_library 的后两段流水线一致。
+        - 3) 每个文件夹进度 0-80 为转移（逐文件转移时按字节推进）、90 为入库、100 为预热完成，总体进度为平均值。
+
+        业务关联:
+        - 上游: main.py 的“导入文件夹”操作（文件夹选择或拖入）。
+        - 下游: 导入完成后语音包库列表刷新即可看到新语音包。
+        """
+        if mode not in IMPORT_MODES:
+            raise ValueError(f"未知的导入方式: {mode}")
+        if isinstance(folders, (str, Path)):
+            folders = [folders]
+        folders = [Path(f) for f in folders]
+        result = {"imported": [], "skipped": [], "failed": []}
+        if not folders:
+            if progress_callback: progress_callback(100, "没有文件夹")
+            return result
+
+        self._ensure_dirs()
+        library = self.library_dir.resolve()
+        total = len(folders)
+        progress_lock = threading.Lock()
+        per_folder = [0.0] * total
+
+        def _report(idx, value, message):
+            with progress_lock:
+                per_folder[idx] = max(per_folder[idx], float(value))
+                overall = sum(per_folder) / total
             if progress_callback:
                 try:
-                    progress_callback(int(base_progress), f"开始解压: {Path(zip_path).name}")
+                    progress_callback(int(overall), message)
                 except Exception:
                     pass
-            if total_files > 0:
-                for m in file_list:
-                    if m.is_dir():
+
+        def _finalize(idx, mod_name, target_dir):
+            try:
+                self._finalize_import(mod_name, target_dir, None, None, [])
+            except Exception as e:
+                self.log(f"[WARN] 更新索引失败 ({mod_name}): {e}", "WARN")
+            _report(idx, 90, f"已入库: {mod_name}")
+            return warm_pool.submit(_warm, idx, mod_name)
+
+        def _warm(idx, mod_name):
+            try:
+                self.warm_mod(mod_name)
+            except Exception as e:
+                self.log(f"[WARN] 生成预览失败 ({mod_name}): {e}", "WARN")
+            _report(idx, 100, f"导入完成: {mod_name}")
+
+        claimed = set()
+        post = []
+        with ThreadPoolExecutor(max_workers=2) as warm_pool, ThreadPoolExecutor(max_workers=1) as finalize_pool:
+            for idx, folder in enumerate(folders):
+                try:
+                    source_dir = folder.resolve()
+                except OSError:
+                    source_dir = folder
+                mod_name = source_dir.name
+                target_dir = self.library_dir / mod_name
+                if not source_dir.is_dir():
+                    self.log(f"[ERROR] 不是文件夹: {folder}", "ERROR")
+                    result["failed"].append(str(folder))
+                    _report(idx, 100, f"失败: {folder.name}")
+                    continue
+                if source_dir == library or library in source_dir.parents or source_dir in library.parents:
+                    self.log(f"[ERROR] 不能导入语音包库本身或其所在目录: {source_dir}", "ERROR")
+                    result["failed"].append(str(folder))
+                    _report(idx, 100, f"失败: {mod_name}")
+                    continue
+                resume = target_dir.exists()
+                if mod_name in claimed or (resume and not ExtractJournal.exists(target_dir)):
+                    self.log(f"[SKIPPED] 跳过重复: {mod_name}", "WARN")
+                    result["skipped"].append(mod_name)
+                    _report(idx, 100, f"跳过: {mod_name}")
+                    continue
+                if self.index.cold_entry(mod_name) is not None:
+                    self.log(f"[SKIPPED] 跳过重复: {mod_name} (已归档到冷存储)", "WARN")
+                    result["skipped"].append(mod_name)
+                    _report(idx, 100, f"跳过: {mod_name}")
+                    continue
+                claimed.add(mod_name)
+
+                _report(idx, 0, f"正在导入: {mod_name}")
+                try:
+                    method = self._transfer_folder(
+                        source_dir, target_dir, mode, resume,
+                        lambda done, size, name, idx=idx: _report(idx, done * 80 / size, f"正在导入 {mod_name}: {name}"),
+                    )
+                except Exception as e:
+                    self.log(f"[ERROR] 导入文件夹 {source_dir} 失败: {e}", "ERROR")
+                    self._discard_failed_import(target_dir)
+                    result["failed"].append(str(folder))
+                    _report(idx, 100, f"失败: {mod_name}")
+                    continue
+                labels = {"rename": "移动", "hardlink": "硬链接", "copy": "复制"}
+                self.log(f"[SUCCESS] 已{labels[method]}导入 ({idx + 1}/{total}): {mod_name}", "SUCCESS")
+                _report(idx, 80, f"已转移: {mod_name}")
+                result["imported"].append(mod_name)
+                post.append(finalize_pool.submit(_finalize, idx, mod_name, target_dir))
+            for finalize_future in post:
+                try:
+                    finalize_future.result().result()
+                except Exception as e:
+                    self.log(f"[WARN] 导入后处理异常: {e}", "WARN")
+
+        self.log(
+            f"[INFO] 文件夹导入完成: 成功 {len(result['imported'])}, 跳过 {len(result['skipped'])}, 失败 {len(result['failed'])}",
+            "INFO",
+        )
+        if progress_callback: progress_callback(100, "全部完成")
+        return result
+
+    def _normalized_info(self, mod_name):
+        """
+        生成导出用的 info.json 内容（UTF-8）：以语音包原有的元数据文件为准，保留其全部字段、只统一编码；
+        语音包没有可解析的元数据文件时才按 get_mod_details 的结果写入 EXPORT_INFO_KEYS 默认字段。
+        """
+        info_file = self._find_info_file(self.library_dir / str(mod_name))
+        info = None
+        if info_file:
+            try:
+                info = self._load_json_with_fallback(info_file)
+            except Exception as e:
+                self.log(f"[WARN] 读取 info 文件失败，导出时写入默认信息 ({info_file.name}): {e}", "WARN")
+        if not isinstance(info, dict):
+            details = self.get_mod_details(mod_name)
+            info = {key: details.get(key) for key in EXPORT_INFO_KEYS}
+            if info.get("language") == ["未识别"]:
+                info["language"] = []
+        return json.dumps(info, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _mod_zip_entries(self, mod_dir):
+        """列出打包语音包目录时的成员 [(路径, 成员名, 大小)]；跳过断点日志、__MACOSX 等无效项与符号链接。"""
+        entries = []
+        for root, dirs, files in os.walk(mod_dir):
+            dirs.sort()
+            for name in sorted(files):
+                path = Path(root) / name
+                arcname = path.relative_to(mod_dir).as_posix()
+                if path.is_symlink() or is_junk_member(arcname) or name == EXTRACT_JOURNAL_NAME:
+                    continue
+                entries.append((path, arcname, path.stat().st_size))
+        return entries
+
+    def _write_mod_zip(self, entries, dest, deflate, extra=None, progress_callback=None, label="正在导出"):
+        """
+        功能定位:
+        - 将语音包成员写入 ZIP（导出与冷存储共用）：按成员选择 ZIP_DEFLATED 或 ZIP_STORED，存储成员按 1MB 块流式写入。
+
+        输入输出:
+        - 参数:
+          - entries: list[tuple[Path, str, int]]，_mod_zip_entries 的结果。
+          - dest: Path，目标 ZIP 路径。
+          - deflate: Callable[[Path], bool]，成员是否压缩。
+          - extra: dict[str, bytes] | None，额外写入的成员（如规范化后的 info.json），写在最前面并压缩。
+          - progress_callback: Callable[[int, str], None] | None，进度回调（0-99，按写入字节数）。
+          - label: str，进度提示前缀。
+        - 返回:
+          - tuple[int, int, int]，(存储成员数, 压缩成员数, 写入的原始字节数)。
+        - 外部资源/依赖: zipfile
+
+        实现逻辑:
+        - 先写入 <dest>.part，完成后 os.replace 为目标文件；任何异常（含取消）都会删除临时文件后抛出。
+
+        业务关联:
+        - 上游: export_mod、freeze_mod。
+        - 下游: 生成的 ZIP 可被 ZipExtractor 解压或由 CoreService.install_from_archive 直接安装。
+        """
+        total_bytes = sum(size for _p, _a, size in entries) or 1
+        done = 0
+        stored = deflated = 0
+        last_emit = 0.0
+        tmp_path = dest.with_name(dest.name + ".part")
+        try:
+            with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                for arcname, data in (extra or {}).items():
+                    zf.writestr(arcname, data)
+                    deflated += 1
+                    done += len(data)
+                for path, arcname, size in entries:
+                    zinfo = zipfile.ZipInfo.from_file(path, arcname, strict_timestamps=False)
+                    if deflate(path):
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+                        deflated += 1
+                    else:
+                        zinfo.compress_type = zipfile.ZIP_STORED
+                        stored += 1
+                    with open(path, "rb") as src, zf.open(zinfo, "w") as dst:
+                        shutil.copyfileobj(src, dst, DEFAULT_CHUNK_SIZE)
+                    done += size
+                    now = time.monotonic()
+                    if progress_callback and now - last_emit >= PROGRESS_INTERVAL:
+                        last_emit = now
+                        progress_callback(min(99, int(done * 99 / total_bytes)), f"{label}: {arcname}")
+            os.replace(tmp_path, dest)
+        except BaseException:
+            try: tmp_path.unlink()
+            except OSError: pass
+            raise
+        return stored, deflated, done
+
+    def export_mod(self, mod_name, dest, progress_callback=None):
+        """
+        功能定位:
+        - 将语音包库中的语音包打包为可分享的 ZIP：.bank 等已压缩内容原样存储，只压缩文本与图片。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包目录名。
+          - dest: str | Path，导出文件路径；为已存在的目录时导出为 <dest>/<mod_name>.zip。
+          - progress_callback: Callable[[int, str], None] | None，进度回调（按写入字节数）。
+        - 返回:
+          - dict，{"path": 导出文件路径, "files": 成员数, "bytes": 原始字节数, "stored": 存储成员数, "deflated": 压缩成员数}。
+        - 外部资源/依赖: _write_mod_zip、check_disk_space、get_mod_details
+
+        实现逻辑:
+        - 1) 校验语音包存在且不是未完成的导入（冷存储中的语音包需先恢复），按语音包大小做磁盘空间预检。
+        - 2) 成员以语音包目录为根（与导入时的目录结构一致，重新导入后内容不变）。
+        - 3) 扩展名属于 EXPORT_DEFLATE_EXTENSIONS 的成员使用 ZIP_DEFLATED，其余（.bank 为 FMOD 压缩容器）使用 ZIP_STORED，
+             导出速度取决于磁盘吞吐。
+        - 4) 根目录 info.json 替换为原有元数据文件的 UTF-8 版本（保留全部字段，_normalized_info），语音包原本没有时写入默认字段。
+
+        业务关联:
+        - 上游: main.py 的“导出语音包”操作。
+        - 下游: 导出的 ZIP 可直接放入待解压区或通过 unzip_single_zip 导入。
+        """
+        mod_dir = self.library_dir / str(mod_name)
+        if not mod_dir.is_dir():
+            if self.is_cold(mod_name):
+                raise RuntimeError(f"语音包已归档到冷存储，请先恢复: {mod_name}")
+            raise FileNotFoundError(f"语音包不存在: {mod_name}")
+        if ExtractJournal.exists(mod_dir):
+            raise RuntimeError(f"语音包尚未导入完成: {mod_name}")
+        dest = Path(dest)
+        if dest.is_dir():
+            dest = dest / f"{mod_dir.name}.zip"
+        elif dest.suffix.lower() != ".zip":
+            dest = dest.with_suffix(".zip")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        check_disk_space(dest.parent, tree_size(mod_dir))
+
+        info_bytes = self._normalized_info(mod_name)
+        entries = [e for e in self._mod_zip_entries(mod_dir) if e[1].lower() != "info.json"]
+        stored, deflated, done = self._write_mod_zip(
+            entries,
+            dest,
+            lambda path: path.suffix.lower() in EXPORT_DEFLATE_EXTENSIONS,
+            extra={"info.json": info_bytes},
+            progress_callback=progress_callback,
+        )
+
+        self.log(
+            f"[SUCCESS] 已导出 {mod_name}: {dest}（{len(entries) + 1} 个文件，存储 {stored}，压缩 {deflated}）",
+            "SUCCESS",
+        )
+        if progress_callback: progress_callback(100, "导出完成")
+        return {
+            "path": str(dest),
+            "files": len(entries) + 1,
+            "bytes": done,
+            "stored": stored,
+            "deflated": deflated,
+        }
+
+    def cold_archive_path(self, mod_name):
+        """冷存储归档文件路径：<library_dir>/<mod_name>.cold.zip（文件而非目录，不会被当作语音包目录扫描）。"""
+        return self.library_dir / f"{mod_name}{COLD_SUFFIX}"
+
+    def is_cold(self, mod_name):
+        """语音包是否处于冷存储（目录不存在且索引中有归档记录、归档文件存在）。"""
+        return not (self.library_dir / str(mod_name)).exists() and self.index.cold_entry(str(mod_name)) is not None
+
+    def cold_cover_url(self, mod_name):
+        """返回冷存储语音包归档时缓存的封面 data URL（无封面时为空字符串）。"""
+        entry = self.index.cold_entry(mod_name) or {}
+        return entry.get("cover") or ""
+
+    def _cold_deflate(self, path):
+        """冷存储成员是否压缩：文本与图片始终压缩；其他文件取前 1MB 试压缩，压缩率足够时才压缩（多数 .bank 原样存储）。"""
+        if path.suffix.lower() in EXPORT_DEFLATE_EXTENSIONS:
+            return True
+        try:
+            with open(path, "rb") as f:
+                sample = f.read(COLD_PROBE_BYTES)
+        except OSError:
+            return False
+        if not sample:
+            return False
+        return len(zlib.compress(sample, 6)) < len(sample) * COLD_DEFLATE_RATIO
+
+    def freeze_mod(self, mod_name, progress_callback=None):
+        """
+        功能定位:
+        - 将不常用的语音包归档到冷存储：目录打包为单个 ZIP 后删除，列表中仍展示归档时的详情与封面。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包目录名。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+        - 返回:
+          - dict，{"archive": 归档文件路径, "before": 归档前占用字节数, "after": 归档文件字节数}。
+        - 外部资源/依赖: _write_mod_zip、LibraryIndex.mark_cold、trash_reclaimer.remove_path
+
+        实现逻辑:
+        - 1) 校验语音包目录存在且不是未完成的导入；读取详情与封面 data URL（归档后无法再从目录读取）。
+        - 2) 刷新该语音包的索引条目，冷存储期间文件清单仍用于冲突检查与安装前冲突提示。
+        - 3) 打包为 <mod>.cold.zip：文本与图片压缩，其他文件按 _cold_deflate 试压缩结果决定压缩或存储；
+             ZIP 中央目录即成员索引，安装时可按文件夹直接定位成员流式写入 sound/mod。
+        - 4) 写入索引冷存储记录（附带归档中央目录计算的内容指纹，冷存储期间识别重复导入）后删除目录；
+             删除失败时撤销记录与归档文件，语音包保持原状。
+
+        业务关联:
+        - 上游: main.py 的“归档到冷存储”操作。
+        - 下游: scan_library/get_mod_details 返回冷存储语音包；安装时走 CoreService.install_from_archive，或 thaw_mod 恢复目录。
+        """
+        mod_dir = self.library_dir / str(mod_name)
+        if not mod_dir.is_dir():
+            raise FileNotFoundError(f"语音包不存在: {mod_name}")
+        if ExtractJournal.exists(mod_dir):
+            raise RuntimeError(f"语音包尚未导入完成: {mod_name}")
+
+        details = self.get_mod_details(mod_name)
+        cover_url = self.cover_data_url(details["cover_path"]) if details.get("cover_path") else ""
+        details["cover_path"] = None
+        self.index.refresh([mod_name], prune=False)
+
+        entries = self._mod_zip_entries(mod_dir)
+        before = allocated_size(size for _p, _a, size in entries)
+        check_disk_space(self.library_dir, before)
+        archive = self.cold_archive_path(mod_name)
+        stored, deflated, _done = self._write_mod_zip(
+            entries, archive, self._cold_deflate, progress_callback=progress_callback, label="正在归档"
+        )
+        after = archive.stat().st_size
+        with zipfile.ZipFile(archive) as zf:
+            fingerprint = content_fingerprint((m.filename, m.file_size, m.CRC) for m in zf.infolist() if not m.is_dir())
+        self.index.mark_cold(mod_name, archive.name, after, details, cover_url, fingerprint)
+        try:
+            remove_path(mod_dir)
+        except Exception as e:
+            self.index.clear_cold(mod_name)
+            try: archive.unlink()
+            except OSError: pass
+            raise RuntimeError(f"删除语音包目录失败，已取消归档: {e}")
+        with self._cache_lock:
+            self._details_cache.pop(mod_name, None)
+
+        self.log(
+            f"[SUCCESS] 已归档到冷存储: {mod_name}（{before / 1024 / 1024:.1f}MB -> {after / 1024 / 1024:.1f}MB，"
+            f"压缩 {deflated} 个文件，存储 {stored} 个文件）",
+            "SUCCESS",
+        )
+        if progress_callback: progress_callback(100, "归档完成")
+        return {"archive": str(archive), "before": before, "after": after}
+
+    def thaw_mod(self, mod_name, progress_callback=None):
+        """
+        功能定位:
+        - 将冷存储中的语音包恢复为语音包库目录。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包名称。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+        - 返回: None
+        - 外部资源/依赖: _open_import_dir、_extract_zip_safely、_finalize_import、LibraryIndex.clear_cold
+
+        实现逻辑:
+        - 1) 与导入相同的解压流程：断点日志标记未完成目录（中断后再次恢复从断点继续），按未压缩大小做磁盘空间预检。
+        - 2) 解压完成后入库（规范化、索引刷新），清除冷存储记录并删除归档文件，最后预热详情与封面。
+
+        业务关联:
+        - 上游: main.py 的“恢复”操作。
+        - 下游: 语音包恢复为普通目录，可使用复制国籍文件、导出等依赖目录的功能。
+        """
+        if self.index.cold_entry(mod_name) is None:
+            raise FileNotFoundError(f"冷存储中没有该语音包: {mod_name}")
+        archive = self.cold_archive_path(mod_name)
+        target_dir = self.library_dir / mod_name
+        resume = target_dir.exists()
+        if resume and not ExtractJournal.exists(target_dir):
+            raise RuntimeError(f"语音包库中已存在同名目录: {mod_name}")
+        with zipfile.ZipFile(archive) as zf:
+            required = allocated_size(m.file_size for m in zf.infolist())
+        check_disk_space(self.library_dir, required, freed=tree_size(target_dir) if resume else 0)
+
+        self._open_import_dir(archive, target_dir, resume)
+        try:
+            self._extract_zip_safely(archive, target_dir, progress_callback, 0, 90)
+        except BaseException:
+            self._discard_failed_import(target_dir)
+            raise
+        self._finalize_import(mod_name, target_dir, None, None, [])
+        self.index.clear_cold(mod_name)
+        try:
+            archive.unlink()
+        except OSError as e:
+            self.log(f"[WARN] 未能删除冷存储归档 {archive.name}: {e}", "WARN")
+        self.warm_mod(mod_name)
+        self.log(f"[SUCCESS] 已从冷存储恢复: {mod_name}", "SUCCESS")
+        if progress_callback: progress_callback(100, "恢复完成")
+
+    def discard_cold(self, mod_name):
+        """删除冷存储语音包：删除归档文件与索引条目。"""
+        archive = self.cold_archive_path(mod_name)
+        if archive.exists():
+            archive.unlink()
+        self.index.forget(mod_name)
+
+    def _hash_file(self, path):
+        """按 1MB 块计算文件 SHA-1（hashlib 处理大块数据时释放 GIL，可多线程并行）。"""
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(DEFAULT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                h.update(chunk)
+        return h.hexdigest()
+
+    def dedupe_library(self, progress_callback=None, dry_run=False, max_workers=None):
+        """
+        功能定位:
+        - 跨语音包去重：内容完全相同的 .bank 文件替换为指向同一份数据的硬链接，并报告回收的空间。
+
+        输入输出:
+        - 参数:
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - dry_run: bool，只统计可回收空间，不修改文件。
+          - max_workers: int | None，并行哈希线程数；None 时取 min(4, CPU 核数)。
+        - 返回:
+          - dict，{"groups": 重复组数, "linked": 替换为硬链接的文件数, "reclaimed": 回收字节数,
+                  "hashed": 本次计算哈希的文件数, "cached": 命中哈希缓存的文件数}。
+        - 外部资源/依赖: os.link/os.replace、hashlib、LibraryIndex.file_hashes/set_file_hashes
+
+        实现逻辑:
+        - 1) 遍历语音包库中所有语音包目录（冷存储语音包与未完成的导入除外）的 .bank 文件，按大小分桶；
+             只有同一大小、且分属至少两个不同 inode（已是硬链接的文件视为一份）的桶才需要哈希。
+        - 2) 哈希缓存按 (大小, mtime_ns) 校验，命中则不读文件；其余文件在线程池中并行计算 SHA-1。
+        - 3) 同一 (大小, SHA-1) 的文件中保留链接数最多的 inode，其余文件先在同目录创建临时硬链接再 os.replace 覆盖，
+             替换过程中任何时刻目标路径都是完整文件；被替换文件原本没有其他链接时计入回收空间。
+        - 4) 更新哈希缓存（只保留本次扫描到的文件）并落盘，重复运行时只哈希新增或变化的文件。
+
+        业务关联:
+        - 上游: main.py 的“语音包库去重”操作。
+        - 下游: 安装时 copy2 复制的是链接指向的数据，对游戏目录无影响；语音包目录 mtime 变化后索引与详情缓存会自动刷新。
+        """
+        if max_workers is None:
+            max_workers = min(4, os.cpu_count() or 1)
+        cache = self.index.file_hashes()
+        files = []
+        for mod_name in self.scan_library():
+            mod_dir = self.library_dir / mod_name
+            if not mod_dir.is_dir():
+                continue
+            for root, _dirs, names in os.walk(mod_dir):
+                for name in names:
+                    if not name.lower().endswith(".bank"):
                         continue
-                    name = m.filename
-                    if "__MACOSX" in name or "desktop.ini" in name:
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path, follow_symlinks=False)
+                    except OSError:
                         continue
+                    if not st.st_size or not os.path.isfile(path) or os.path.islink(path):
+                        continue
+                    key = f"{mod_name}/{os.path.relpath(path, mod_dir).replace(os.sep, '/')}"
+                    files.append((key, path, st))
+
+        buckets = {}
+        for item in files:
+            buckets.setdefault(item[2].st_size, []).append(item)
+        candidates = [
+            item
+            for group in buckets.values()
+            if len({(st.st_dev, st.st_ino) for _k, _p, st in group}) > 1
+            for item in group
+        ]
+
+        hashes = {}
+        to_hash = []
+        for key, path, st in candidates:
+            cached = cache.get(key)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                hashes[key] = cached[2]
+            else:
+                to_hash.append((key, path))
+        cached_count = len(hashes)
+        total_hash = len(to_hash)
+        self.log(f"[INFO] 去重: {len(files)} 个 .bank 文件，{len(candidates)} 个同大小候选，需计算哈希 {total_hash} 个", "INFO")
+
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+                futures = {pool.submit(self._hash_file, path): key for key, path in to_hash}
+                for done_count, fut in enumerate(as_completed(futures), 1):
+                    key = futures[fut]
                     try:
-                        total_bytes += int(getattr(m, "file_size", 0) or 0)
-                    except Exception:
-                        pass
-            
-            for idx, member in enumerate(file_list):
-                if idx % 50 == 0:
-                    time.sleep(0.001)
-                
+                        hashes[key] = fut.result()
+                    except OSError as e:
+                        self.log(f"[WARN] 读取失败，跳过: {key} ({e})", "WARN")
+                    if progress_callback:
+                        progress_callback(int(done_count * 80 / total_hash), f"正在计算哈希: {done_count}/{total_hash}")
+
+        groups = {}
+        for key, path, st in candidates:
+            digest = hashes.get(key)
+            if digest:
+                groups.setdefault((st.st_size, digest), []).append((key, path, st))
+
+        dup_groups = 0
+        linked = 0
+        reclaimed = 0
+        for (size, digest), group in groups.items():
+            # 保留链接数最多的 inode（上次去重已合并的文件），新增的重复文件链接过去即可
+            group.sort(key=lambda item: -item[2].st_nlink)
+            keeper_key, keeper_path, keeper_st = group[0]
+            keeper_id = (keeper_st.st_dev, keeper_st.st_ino)
+            dups = [item for item in group[1:] if (item[2].st_dev, item[2].st_ino) != keeper_id]
+            if not dups:
+                continue
+            dup_groups += 1
+            seen = {keeper_id}
+            for key, path, st in dups:
+                inode = (st.st_dev, st.st_ino)
+                # 同一 inode 的多个路径只在最后一个链接被替换时才真正释放空间
+                freed = inode not in seen and st.st_nlink <= sum(1 for _k, _p, s in dups if (s.st_dev, s.st_ino) == inode)
+                seen.add(inode)
+                if dry_run:
+                    linked += 1
+                    reclaimed += allocated_size([size]) if freed else 0
+                    continue
+                tmp_path = f"{path}.dedupe.tmp"
                 try:
-                    filename = member.filename.encode('cp437').decode('utf-8')
-                except:
-                    try:
-                        filename = member.filename.encode('cp437').decode('cp950')
-                    except:
-                        try:
-                            filename = member.filename.encode('cp437').decode('gbk')
-                        except:
-                            filename = member.filename
+                    os.link(keeper_path, tmp_path)
+                    os.replace(tmp_path, path)
+                except OSError as e:
+                    try: os.unlink(tmp_path)
+                    except OSError: pass
+                    self.log(f"[WARN] 无法创建硬链接，跳过: {key} ({e})", "WARN")
+                    continue
+                linked += 1
+                reclaimed += allocated_size([size]) if freed else 0
+                hashes[key] = digest
+
+        if not dry_run:
+            # 替换后的文件与保留文件共享 inode，mtime 随之变化：按当前状态重建缓存
+            new_cache = {}
+            for key, path, st in files:
+                digest = hashes.get(key)
+                if digest is None:
+                    old = cache.get(key)
+                    if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+                        new_cache[key] = old
+                    continue
+                try:
+                    cur = os.stat(path)
+                except OSError:
+                    continue
+                new_cache[key] = [cur.st_size, cur.st_mtime_ns, digest]
+            self.index.set_file_hashes(new_cache)
+
+        verb = "可回收" if dry_run else "已回收"
+        self.log(
+            f"[SUCCESS] 去重完成: {dup_groups} 组重复文件，{'可' if dry_run else '已'}替换 {linked} 个文件，"
+            f"{verb} {reclaimed / 1024 / 1024:.1f}MB",
+            "SUCCESS",
+        )
+        if progress_callback: progress_callback(100, "去重完成")
+        return {
+            "groups": dup_groups,
+            "linked": linked,
+            "reclaimed": reclaimed,
+            "hashed": total_hash,
+            "cached": cached_count,
+        }
 
-                if "__MACOSX" in filename or "desktop.ini" in filename: continue
-                
-                now = time.monotonic()
-                should_push = (idx == 0) or (idx % 10 == 0) or (idx == total_files - 1)
-                if progress_callback and total_files > 0 and should_push and (now - last_update) >= 0.05:
-                    ratio = idx / total_files
-                    current_percent = base_progress + ratio * share_progress
-                    fname = filename
-                    if len(fname) > 25:
-                        fname = "..." + fname[-25:]
-                    try:
-                        progress_callback(int(current_percent), f"解压中: {fname}")
-                    except Exception:
-                        pass
-                    last_update = now
-                
-                # 路径边界校验：目标路径必须位于 target_dir 内部
-                full_target_path = (target_dir / filename).resolve()
+    def _check_bank_header(self, path, size):
+        """校验 .bank 容器头部：RIFF（FMOD Studio 为 RIFF....FEV ）按声明长度检查是否被截断，FSB5 只校验魔数；返回问题描述或 None。"""
+        try:
+            with open(path, "rb") as f:
+                head = f.read(12)
+        except OSError as e:
+            return f"无法读取: {e}"
+        if head[:4] == b"RIFF":
+            if len(head) < 12:
+                return "文件头不完整"
+            declared = int.from_bytes(head[4:8], "little") + 8
+            if declared > size:
+                return f"文件被截断（声明 {declared} 字节，实际 {size} 字节）"
+            if head[8:12] != b"FEV ":
+                return f"RIFF 容器类型未知: {head[8:12]!r}"
+            return None
+        if head[:4] == b"FSB5":
+            return None
+        return "不是 FMOD bank（缺少 RIFF/FSB5 文件头）"
+
+    def _verify_mod(self, mod_name):
+        """
+        功能定位:
+        - 检查单个语音包目录的完整性，返回问题列表与结论。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包目录名。
+        - 返回:
+          - dict，{"mod", "status": ok|warn|error, "files": 文件数, "issues": [{"level": info|warn|error, "file", "msg"}]}；
+            info 级别只是提示，不影响 status。
+        - 外部资源/依赖: 文件系统读取（每个 .bank 只读前 12 字节）、_load_json_with_fallback
+
+        实现逻辑:
+        - 1) .bank：零字节为错误；文件头不是 RIFF(FEV)/FSB5、RIFF 声明长度大于文件大小（截断）为错误。
+             伪装成 .bank 的元数据（info.bank、cover.bank、*AimerWT*.bank）不参与校验。
+        - 2) 成对文件：xxx.assets.bank 所在目录缺少 xxx.bank 时仅记为提示（许多语音包只附带资源 bank，由游戏自带的同名 bank 加载）。
+        - 3) 其他零字节文件为警告；根目录 info.json 存在但无法解析为对象时为错误。
+
+        业务关联:
+        - 上游: verify_library（线程池并行）。
+        - 下游: 前端逐个语音包展示检查结果。
+        """
+        mod_dir = self.library_dir / mod_name
+        issues = []
+        count = 0
+        for root, _dirs, names in os.walk(mod_dir):
+            lower_names = {n.lower() for n in names}
+            for name in names:
+                if name == EXTRACT_JOURNAL_NAME or is_junk_member(name):
+                    continue
+                count += 1
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, mod_dir).replace(os.sep, "/")
+                try:
+                    size = os.path.getsize(path)
+                except OSError as e:
+                    issues.append({"level": "error", "file": rel, "msg": f"无法读取: {e}"})
+                    continue
+                lower = name.lower()
+                if not lower.endswith(".bank"):
+                    if size == 0:
+                        issues.append({"level": "warn", "file": rel, "msg": "零字节文件"})
+                    continue
+                if lower in ("info.bank", "cover.bank") or "aimerwt" in lower:
+                    continue
+                if size == 0:
+                    issues.append({"level": "error", "file": rel, "msg": "零字节 .bank 文件"})
+                    continue
+                problem = self._check_bank_header(path, size)
+                if problem:
+                    issues.append({"level": "error", "file": rel, "msg": problem})
+                if lower.endswith(".assets.bank"):
+                    partner = lower[: -len(".assets.bank")] + ".bank"
+                    if partner not in lower_names:
+                        issues.append({"level": "info", "file": rel, "msg": f"未附带配对文件 {name[: -len('.assets.bank')]}.bank"})
+
+        info_file = mod_dir / "info.json"
+        if info_file.is_file() and not isinstance(self._load_json_with_fallback(info_file), dict):
+            issues.append({"level": "error", "file": "info.json", "msg": "info.json 无法解析"})
+
+        levels = {issue["level"] for issue in issues}
+        status = "error" if "error" in levels else ("warn" if "warn" in levels else "ok")
+        return {"mod": mod_name, "status": status, "files": count, "issues": issues}
+
+    def verify_library(self, progress_callback=None, on_result=None, max_workers=None):
+        """
+        功能定位:
+        - 全库健康检查：并行检查每个语音包的 .bank 容器头、成对文件与元数据，逐个语音包推送结果。
+
+        输入输出:
+        - 参数:
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - on_result: Callable[[dict], None] | None，每个语音包检查完成（或命中缓存）时调用，参数为 _verify_mod 的结果（附 cached 字段）。
+          - max_workers: int | None，并行线程数；None 时取 min(8, CPU 核数 * 2)（以小块读取与 stat 为主）。
+        - 返回:
+          - list[dict]，所有语音包的检查结果。
+        - 外部资源/依赖: 线程池、LibraryIndex.verdicts/set_verdicts
+
+        实现逻辑:
+        - 1) 对语音包库中的每个语音包目录（冷存储与未完成的导入除外）计算内容签名（stat_signature，只 stat），
+             与缓存签名一致时直接返回缓存结论，否则提交到线程池执行 _verify_mod。
+        - 2) 结果按完成顺序通过 on_result 推送，前端无需等待全库检查结束。
+        - 3) 检查结束后按本次结果重建缓存并落盘，已删除语音包的结论随之清除。
+
+        业务关联:
+        - 上游: main.py 的“语音包库健康检查”任务。
+        - 下游: 前端展示损坏的语音包，提示用户重新导入。
+        """
+        if max_workers is None:
+            max_workers = min(8, (os.cpu_count() or 1) * 2)
+        mods = [m for m in self.scan_library() if (self.library_dir / m).is_dir()]
+        total = len(mods)
+        if not total:
+            if progress_callback: progress_callback(100, "语音包库为空")
+            return []
+
+        cache = self.index.verdicts()
+        verdicts = {}
+        results = []
+        done = [0]
+        lock = threading.Lock()
+
+        def _emit(result):
+            with lock:
+                results.append(result)
+                done[0] += 1
+                finished = done[0]
+            if on_result:
                 try:
-                    is_inside = os.path.commonpath([str(full_target_path), str(target_root)]) == str(target_root)
+                    on_result(result)
                 except Exception:
-                    is_inside = False
-                if not is_inside:
-                     self.log(f"[WARN] 拦截恶意路径穿越文件: {filename}", "WARN")
-                     continue
-
-                target_path = target_dir / filename
-                if member.is_dir():
-                    target_path.mkdir(parents=True, exist_ok=True)
-                else:
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    if member.flag_bits & 0x1 and not password:
-                        raise ArchivePasswordRequired("ZIP 需要密码")
-                    pwd = password.encode("utf-8") if password else None
-                    try:
-                        source_file = zf.open(member, pwd=pwd)
-                    except RuntimeError as e:
-                        msg = str(e).lower()
-                        if "password" in msg:
-                            if password:
-                                raise ArchivePasswordIncorrect("ZIP 密码错误")
-                            raise ArchivePasswordRequired("ZIP 需要密码")
-                        raise
-                    except Exception:
-                        raise
-                    with source_file as source, open(target_path, "wb") as target:
-                        chunk_size = 8192  # 8KB chunks
-                        while True:
-                            chunk = source.read(chunk_size)
-                            if not chunk:
-                                break
-                            target.write(chunk)
-                            if total_bytes > 0:
-                                extracted_bytes += len(chunk)
-                            now = time.monotonic()
-                            if progress_callback and total_files > 0 and (now - last_update) >= 0.2:
-                                if total_bytes > 0:
-                                    ratio = extracted_bytes / total_bytes
-                                else:
-                                    ratio = idx / total_files
-                                current_percent = base_progress + ratio * share_progress
-                                fname = filename
-                                if len(fname) > 25:
-                                    fname = "..." + fname[-25:]
-                                progress_callback(int(current_percent), f"解压中: {fname}")
-                                last_update = now
-            
+                    pass
             if progress_callback:
-                progress_callback(int(base_progress + share_progress), "解压完成")
+                progress_callback(int(finished * 99 / total), f"已检查 {finished}/{total}: {result['mod']}")
+
+        def _check(mod_name):
+            mod_dir = self.library_dir / mod_name
+            sig = stat_signature(mod_dir)
+            cached = cache.get(mod_name)
+            if cached and cached.get("sig") == sig:
+                result = dict(cached["result"], cached=True)
+            else:
+                result = dict(self._verify_mod(mod_name), cached=False)
+            with lock:
+                verdicts[mod_name] = {"sig": sig, "result": {k: v for k, v in result.items() if k != "cached"}}
+            _emit(result)
+
+        with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+            for fut in [pool.submit(_check, m) for m in mods]:
+                try:
+                    fut.result()
+                except Exception as e:
+                    self.log(f"[WARN] 健康检查异常: {e}", "WARN")
+
+        self.index.set_verdicts(verdicts)
+        bad = [r["mod"] for r in results if r["status"] == "error"]
+        warned = sum(1 for r in results if r["status"] == "warn")
+        reused = sum(1 for r in results if r.get("cached"))
+        self.log(
+            f"[INFO] 健康检查完成: {total} 个语音包，错误 {len(bad)}，警告 {warned}（{reused} 个未变化，沿用上次结果）",
+            "INFO",
+        )
+        for mod_name in bad:
+            self.log(f"[WARN] 语音包存在损坏文件，建议重新导入: {mod_name}", "WARN")
+        if progress_callback: progress_callback(100, "检查完成")
+        return results
+
+    def _extract_zip_safely(self, zip_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None, threads=None, include=None):
+        """
+        功能定位:
+        - 解压 ZIP 文件到语音包目录：普通 ZIP 委托共享解压引擎 ZipExtractor，加密 ZIP 优先交给 7z。
+
+        输入输出:
+        - 参数:
+          - zip_path: Path，ZIP 文件路径。
+          - target_dir: Path，目标解压目录。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - base_progress/share_progress: float|int，该 ZIP 在总体进度中的起点与占比。
+          - password: str | None，ZIP 密码（若需要）。
+          - threads: int | None，解压线程数；None 时按 CPU 核数自动选择，小压缩包始终单线程。
+          - include: Callable[[str], bool] | None，成员筛选（voice 方案）；7z 路径使用等价的 -ir! 开关。
+        - 返回: None
+        - 外部资源/依赖: zip_extractor.ZipExtractor、7z 可执行文件（可选）
+
+        实现逻辑:
+        - 1) zipfile 的 ZipCrypto 解密逐字节在 Python 层执行，加密大包比未加密慢一个数量级；
+             因此存在加密成员且检测到 7z 时，先用 verify_password 校验加密头校验字节（不写文件），
+             通过后交给 7z 解压，并排除 __MACOSX 与 desktop.ini。
+             7z 使用 -mcp 指定与 ZipExtractor.member_names 相同的成员名编码，解压出的文件名与清单、索引一致；
+             目标目录有断点日志时先用 ZipExtractor.verify_written 校验已完整写入的成员，经 -x@ 列表排除（续传），
+             7z 失败或取消时再次校验并记入日志，目录得以保留供下次续传。
+        - 2) 其余情况走 ZipExtractor（语音包库策略：多编码还原成员名，路径穿越成员写日志后跳过，不限制扩展名）；
+             目标目录由 _open_import_dir 写入了断点日志时逐成员记录并续传。
+
+        业务关联:
+        - 上游: _extract_archive_with_password 在处理 .zip 时调用。
+        - 下游: 生成语音包库目录结构，供后续扫描与元数据读取。
+        """
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            encrypted = bool(self._zip_extractor.encrypted_members(zf))
+        if encrypted and self._find_7z():
+            self._zip_extractor.verify_password(zip_path, password)
+            extra_args = ["-xr!__MACOSX", "-xr!desktop.ini"]
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                codepage = self._zip_extractor.name_codepage(zf)
+            if codepage:
+                extra_args.append(f"-mcp={codepage}")
+            if include is not None:
+                extra_args += self._seven_zip_include_args()
+            journaled = ExtractJournal.exists(target_dir)
+            list_file = None
+            try:
+                if journaled:
+                    written = self._zip_extractor.verify_written(zip_path, target_dir, include)
+                    if written:
+                        self.log(f"[RESUME] 已校验 {len(written)} 个已解压文件，从断点继续: {Path(zip_path).name}", "INFO")
+                        fd, list_file = tempfile.mkstemp(prefix="aimerwt_7z_", suffix=".lst")
+                        with os.fdopen(fd, "w", encoding="utf-8") as f:
+                            f.write("\n".join(written) + "\n")
+                        extra_args += ["-scsUTF-8", f"-x@{list_file}"]
+                try:
+                    self._extract_with_7z(
+                        zip_path, target_dir, progress_callback, base_progress, share_progress,
+                        password=password, threads=threads, extra_args=extra_args,
+                    )
+                except BaseException:
+                    if journaled:
+                        try:
+                            self._zip_extractor.verify_written(zip_path, target_dir, include)
+                        except Exception:
+                            pass
+                    raise
+            finally:
+                if list_file:
+                    try: os.unlink(list_file)
+                    except OSError: pass
+            return
+        self._zip_extractor.extract(
+            zip_path, target_dir, progress_callback, base_progress, share_progress,
+            password=password, threads=threads, resume=ExtractJournal.exists(target_dir), include=include,
+        )
 
     def copy_country_files(self, mod_name, game_path, country_code, include_ground=True, include_radio=True):
         """
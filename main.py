@@ -30,7 +30,6 @@
 - 下游: 调用 core_logic/library_manager 等模块对语音包库与游戏目录执行实际读写。
 """
 
-import base64
 import itertools
 import json
 import os
@@ -45,6 +44,14 @@ import webview
 
 from config_manager import ConfigManager
 from core_logic import CoreService
+from job_scheduler import (
+    RES_GAME_MOD,
+    RES_LIBRARY,
+    RES_USERSIGHTS,
+    RES_USERSKINS,
+    JobScheduler,
+    library_resource,
+)
 from library_manager import ArchivePasswordCanceled, LibraryManager
 from logger import setup_logger
 from sights_manager import SightsManager
@@ -101,7 +108,7 @@ class AppApi:
       - setup_logger（日志文件）
 
     实现逻辑:
-    - 通过线程锁与状态位控制并发操作（避免重复任务叠加）。
+    - 通过 JobScheduler 按资源粒度调度后台任务：不冲突的任务并发执行，冲突的任务排队等待。
     - 对部分参数进行格式兼容（例如 JSON 字符串形式的列表参数）。
     - 通过 log_from_backend 统一处理日志与前端展示。
 
@@ -124,7 +131,7 @@ class AppApi:
           - 其他模块: ConfigManager/CoreService/LibraryManager/SkinsManager/SightsManager
 
         实现逻辑:
-        - 1) 初始化线程锁与任务状态位。
+        - 1) 初始化任务调度器。
         - 2) 初始化日志记录器。
         - 3) 初始化管理器对象并将 log_from_backend 作为回调注入。
         - 4) 初始化与“压缩包密码输入”相关的线程同步对象。
@@ -133,8 +140,6 @@ class AppApi:
         - 上游: 应用启动时创建 AppApi 实例。
         - 下游: 供前端调用的所有 API 方法依赖此处初始化的对象。
         """
-        self._lock = threading.Lock()
-
         self._logger = setup_logger()
 
         self._perf_enabled = os.environ.get("AIMERWT_PERF", "").strip() == "1"
@@ -145,15 +150,21 @@ class AppApi:
         # 管理器实例：配置、语音包库、涂装、炮镜、游戏目录操作
         self._cfg_mgr = ConfigManager()
         self._lib_mgr = LibraryManager(self.log_from_backend)
+        self._lib_mgr.index.on_update = self._on_library_index_update
+        self._lib_mgr.import_filter, self._lib_mgr.import_allow_patterns = self._cfg_mgr.get_import_filter()
         self._skins_mgr = SkinsManager(self.log_from_backend)
         self._sights_mgr = SightsManager(self.log_from_backend)
         self._logic = CoreService()
         self._logic.set_callbacks(self.log_from_backend)
+        self._logic.manifest_backend = self._cfg_mgr.get_manifest_backend()
 
         self._search_running = False
-        self._is_busy = False
+        # 后台任务调度器：按资源（语音包库/sound/mod/UserSkins/UserSights）互斥，冲突任务排队
+        self._scheduler = JobScheduler(on_update=self._on_job_update)
         self._password_event = threading.Event()
         self._password_lock = threading.Lock()
+        # 多个导入任务可能并发请求密码：串行化弹窗，同一时刻只显示一个
+        self._password_request_lock = threading.Lock()
         self._password_value = None
         self._password_cancelled = False
 
@@ -452,6 +463,81 @@ class AppApi:
         """
         self._cfg_mgr.set_active_theme(filename)
 
+    def get_import_settings(self):
+        """
+        功能定位:
+        - 返回语音包导入筛选设置，供设置页展示。
+
+        输入输出:
+        - 参数: 无
+        - 返回:
+          - dict，{"mode": "voice" | "all", "patterns": list[str]}。
+        - 外部资源/依赖: ConfigManager.get_import_filter
+
+        实现逻辑:
+        - 读取配置中的筛选方案与额外保留的文件名通配符。
+
+        业务关联:
+        - 上游: 前端设置页“导入设置”初始化。
+        - 下游: 前端下拉框与通配符输入框。
+        """
+        mode, patterns = self._cfg_mgr.get_import_filter()
+        return {"mode": mode, "patterns": patterns}
+
+    def set_import_settings(self, mode, patterns=None):
+        """
+        功能定位:
+        - 保存语音包导入筛选设置，并立即应用到语音包库管理器。
+
+        输入输出:
+        - 参数:
+          - mode: str，"voice"（只解压可安装内容）或 "all"（全部解压）。
+          - patterns: list[str] | str | None，额外保留的文件名通配符；字符串按逗号、分号或空白拆分；None 表示保持不变。
+        - 返回:
+          - dict，校验后的设置（同 get_import_settings）。
+        - 外部资源/依赖: ConfigManager.set_import_filter/get_import_filter
+
+        实现逻辑:
+        - 1) 拆分通配符字符串并写入配置（非法方案按 "voice" 处理）。
+        - 2) 读回校验后的设置，覆盖 LibraryManager.import_filter/import_allow_patterns，下一次导入即生效。
+
+        业务关联:
+        - 上游: 前端设置页“导入设置”变更。
+        - 下游: LibraryManager 导入时的成员筛选。
+        """
+        if isinstance(patterns, str):
+            patterns = [p for p in re.split(r"[,;，；\s]+", patterns) if p]
+        self._cfg_mgr.set_import_filter(mode, patterns)
+        mode, patterns = self._cfg_mgr.get_import_filter()
+        self._lib_mgr.import_filter, self._lib_mgr.import_allow_patterns = mode, patterns
+        self.log_from_backend(
+            f"[INFO] 导入筛选已更新: {'只解压可安装内容' if mode == 'voice' else '解压全部文件'}"
+            + (f"，额外保留: {', '.join(patterns)}" if patterns and mode == "voice" else ""),
+            "INFO",
+        )
+        return {"mode": mode, "patterns": patterns}
+
+    def get_skipped_files(self, mod_name):
+        """
+        功能定位:
+        - 返回导入该语音包时因筛选未解压的文件列表。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包名称。
+        - 返回:
+          - list[dict]，[{"name": 成员名, "size": 字节数}, ...]（无记录时为空列表）。
+        - 外部资源/依赖: LibraryIndex.skipped_files（内存）
+
+        实现逻辑:
+        - 读取语音包库索引中记录的跳过成员。
+
+        业务关联:
+        - 上游: 前端语音包卡片的“已跳过文件”提示。
+        - 下游: 用户确认被筛选掉的内容，必要时切换为全部解压后重新导入。
+        """
+        return [{"name": name, "size": size} for name, size in self._lib_mgr.index.skipped_files(str(mod_name))]
+
     def set_theme(self, mode):
         """
         功能定位:
@@ -608,11 +694,14 @@ class AppApi:
 
         实现逻辑:
         - 1) 扫描库目录得到语音包目录名列表。
-        - 2) 对每个语音包读取详情字典，并确定封面路径：
+        - 2) 对每个语音包读取详情字典（签名未变化时命中 LibraryManager 详情缓存），并确定封面路径：
            - 优先使用详情中的 cover_path；
            - 当 cover_path 缺失或文件不存在时，使用默认封面。
-        - 3) 将封面图片读取并转为 data URL 写入 details["cover_url"]。
-        - 4) 补充 details["id"]=mod 并汇总返回。
+        - 3) 将封面图片转为 data URL 写入 details["cover_url"]（LibraryManager.cover_data_url 缓存编码结果）；
+             冷存储语音包（details["cold"]）使用归档时缓存在索引中的封面。
+        - 4) 补充 details["id"]=mod，以及来自语音包库索引的 details["conflicts_with"]（存在同名 .bank 的其他语音包），
+             前端据此与已安装列表求交集显示冲突徽标；details["skipped_count"] 为导入时因筛选未解压的文件数。
+        - 5) 触发语音包库索引后台刷新；索引变化后通过 app.onLibraryIndexUpdated 通知前端。
 
         业务关联:
         - 上游: 前端进入“语音包库”页面或手动刷新时调用。
@@ -636,26 +725,94 @@ class AppApi:
             if not cover_path or not os.path.exists(cover_path):
                 cover_path = str(default_cover_path)
 
-            # 封面图片读取并转为 data URL
-            if cover_path and os.path.exists(cover_path):
-                try:
-                    ext = os.path.splitext(cover_path)[1].lower().replace(".", "")
-                    if ext == "jpg":
-                        ext = "jpeg"
-                    with open(cover_path, "rb") as f:
-                        b64_data = base64.b64encode(f.read()).decode("utf-8")
-                        details["cover_url"] = f"data:image/{ext};base64,{b64_data}"
-                except Exception as e:
-                    print(f"图片转码失败: {e}")
+            # 封面图片转为 data URL（按路径、大小与修改时间缓存，导入流水线已预热）；冷存储语音包使用索引中缓存的封面
+            cold_cover = self._lib_mgr.cold_cover_url(mod) if details.get("cold") else ""
+            details["cover_url"] = cold_cover or self._lib_mgr.cover_data_url(cover_path)
 
-            # 补充 ID
+            # 补充 ID 与冲突关系（索引尚未建立时为空列表）
             details["id"] = mod
+            details["conflicts_with"] = self._lib_mgr.index.conflicts_with(mod)
+            details["skipped_count"] = len(self._lib_mgr.index.skipped_files(mod))
             result.append(details)
+        self._lib_mgr.index.refresh_async(mods)
         if self._perf_enabled and t0 is not None:
             dt_ms = (time.perf_counter() - t0) * 1000.0
             self.log_from_backend(f"[PERF] get_library_list {dt_ms:.1f}ms mods={len(result)}", "SYS")
         return result
 
+    def get_library_conflicts(self):
+        """
+        功能定位:
+        - 返回语音包库索引中的冲突关系，供前端在索引后台刷新完成后更新冲突徽标。
+
+        输入输出:
+        - 参数: 无
+        - 返回:
+          - dict[str, list[str]]，语音包名 -> 存在同名 .bank 的其他语音包列表（仅包含存在冲突的语音包）。
+        - 外部资源/依赖: LibraryIndex（内存）
+
+        实现逻辑:
+        - 遍历当前语音包列表，读取索引派生的冲突关系。
+
+        业务关联:
+        - 上游: 前端 app.onLibraryIndexUpdated。
+        - 下游: 前端语音包卡片冲突徽标。
+        """
+        result = {}
+        for mod in self._lib_mgr.scan_library():
+            others = self._lib_mgr.index.conflicts_with(mod)
+            if others:
+                result[mod] = others
+        return result
+
+    def inspect_archive(self, path=None):
+        """
+        功能定位:
+        - 不解压预览压缩包内容，供导入对话框在解压前展示语音包信息。
+
+        输入输出:
+        - 参数:
+          - path: str | None，压缩包路径（.zip/.rar）；为空时弹出文件选择对话框。
+        - 返回:
+          - dict，{success: bool, info?: dict, msg?: str, canceled?: bool}；info 结构见 LibraryManager.inspect_archive，
+            另含 path（压缩包路径，供后续导入或直接安装使用）。
+        - 外部资源/依赖:
+          - LibraryManager.inspect_archive（按大小与修改时间缓存）
+          - PyWebview 对话框: self._window.create_file_dialog（OPEN 单选）
+
+        实现逻辑:
+        - 1) 未传入路径时打开文件选择对话框，用户取消时返回 canceled=True。
+        - 2) 调用 inspect_archive；捕获异常并转换为返回结构。
+
+        业务关联:
+        - 上游: 前端导入对话框。
+        - 下游: 前端预览卡片（标题/封面/标签/文件夹/大小）。
+        """
+        if not path:
+            if not self._window:
+                return {"success": False, "canceled": True}
+            result = self._window.create_file_dialog(
+                webview.FileDialog.OPEN, allow_multiple=False,
+                file_types=("Zip Files (*.zip)", "Rar Files (*.rar)", "All files (*.*)"),
+            )
+            if not result:
+                return {"success": False, "canceled": True}
+            path = result[0]
+        try:
+            info = self._lib_mgr.inspect_archive(path)
+            info["path"] = str(path)
+            return {"success": True, "info": info}
+        except Exception as e:
+            return {"success": False, "msg": str(e)}
+
+    def _on_library_index_update(self):
+        """语音包库索引在后台刷新且内容发生变化时，通知前端重新拉取冲突关系（前端未实现时忽略）。"""
+        if self._window:
+            try:
+                self._window.evaluate_js("if(window.app && app.onLibraryIndexUpdated) app.onLibraryIndexUpdated()")
+            except Exception:
+                pass
+
     def open_folder(self, folder_type):
         """
         功能定位:
@@ -739,6 +896,103 @@ class AppApi:
             except Exception as e:
                 print(f"Loading UI 更新失败: {e}")
 
+    # --- 后台任务调度 ---
+    def _on_job_update(self, job_info):
+        """
+        功能定位:
+        - 将调度器推送的任务状态变更转发给前端（前端未实现 onJobUpdate 时忽略）。
+
+        输入输出:
+        - 参数:
+          - job_info: dict，Job.to_dict 生成的任务状态快照。
+        - 返回: None
+        - 外部资源/依赖: self._window.evaluate_js（app.onJobUpdate）
+
+        实现逻辑:
+        - 序列化为 JSON 后调用前端钩子；窗口未就绪或推送失败时静默忽略。
+
+        业务关联:
+        - 上游: JobScheduler 在任务入队/开始/进度更新/结束时回调。
+        - 下游: 前端可据此展示任务队列与单任务进度。
+        """
+        if not self._window:
+            return
+        try:
+            job_js = json.dumps(job_info, ensure_ascii=False)
+            self._window.evaluate_js(f"if(window.app && app.onJobUpdate) app.onJobUpdate({job_js})")
+        except Exception:
+            pass
+
+    def _submit_job(self, name, resources, func):
+        """
+        功能定位:
+        - 向调度器提交后台任务；若资源被占用，则提示任务已进入队列。
+
+        输入输出:
+        - 参数:
+          - name: str，任务名称。
+          - resources: list[str]，任务占用的资源键。
+          - func: Callable[[Job], Any]，任务函数。
+        - 返回:
+          - int，job_id。
+        - 外部资源/依赖: JobScheduler
+
+        实现逻辑:
+        - 提交前检查资源占用情况，占用时写一条排队日志，随后提交任务。
+
+        业务关联:
+        - 上游: 导入/安装/还原等桥接层接口。
+        - 下游: 任务在资源可用时由调度器启动。
+        """
+        if any(self._scheduler.is_busy(r) for r in resources):
+            self.log_from_backend(f"[INFO] 任务已加入队列，等待前序任务完成: {name}")
+        return self._scheduler.submit(name, resources, func)
+
+    def _job_progress(self, job):
+        """
+        功能定位:
+        - 生成绑定到指定任务的进度回调：同时更新任务进度与前端加载组件。
+
+        输入输出:
+        - 参数:
+          - job: Job，调度器中的任务对象。
+        - 返回:
+          - Callable[[int, str], None]，进度回调。
+        - 外部资源/依赖: update_loading_ui
+
+        实现逻辑:
+        - 回调内部先写入 job.set_progress，再转发到 update_loading_ui。
+
+        业务关联:
+        - 上游: 各后台任务把该回调传给业务管理器。
+        - 下游: 前端加载组件与任务列表同步显示进度。
+        """
+        def _cb(progress, message):
+            job.set_progress(progress, message)
+            self.update_loading_ui(progress, message)
+
+        return _cb
+
+    def get_jobs(self):
+        """
+        功能定位:
+        - 返回当前排队中、运行中与最近结束的后台任务列表。
+
+        输入输出:
+        - 参数: 无
+        - 返回:
+          - list[dict]，任务状态快照列表（按 job_id 升序）。
+        - 外部资源/依赖: JobScheduler.list_jobs
+
+        实现逻辑:
+        - 直接返回调度器的任务快照。
+
+        业务关联:
+        - 上游: 前端任务面板查询。
+        - 下游: 无。
+        """
+        return self._scheduler.list_jobs()
+
     def submit_archive_password(self, password):
         """
         功能定位:
@@ -801,9 +1055,10 @@ class AppApi:
           - str | None，用户输入密码；用户取消返回 None。
         - 外部资源/依赖:
           - 前端弹窗: app.openArchivePasswordModal
-          - 线程同步: self._password_event/self._password_lock
+          - 线程同步: self._password_event/self._password_lock/self._password_request_lock
 
         实现逻辑:
+        - 0) 持有 _password_request_lock 期间完成整个交互，保证并发任务的密码弹窗依次出现。
         - 1) 清理上次密码状态并清空事件。
         - 2) 通过 evaluate_js 打开前端密码弹窗。
         - 3) wait 等待事件被 submit/cancel 触发。
@@ -815,18 +1070,19 @@ class AppApi:
         """
         if not self._window:
             return None
-        with self._password_lock:
-            self._password_event.clear()
-            self._password_value = None
-            self._password_cancelled = False
-        name_js = json.dumps(str(archive_name or ""), ensure_ascii=False)
-        err_js = json.dumps(str(error_hint or ""), ensure_ascii=False)
-        self._window.evaluate_js(f"app.openArchivePasswordModal({name_js}, {err_js})")
-        self._password_event.wait()
-        with self._password_lock:
-            if self._password_cancelled:
-                return None
-            return self._password_value
+        with self._password_request_lock:
+            with self._password_lock:
+                self._password_event.clear()
+                self._password_value = None
+                self._password_cancelled = False
+            name_js = json.dumps(str(archive_name or ""), ensure_ascii=False)
+            err_js = json.dumps(str(error_hint or ""), ensure_ascii=False)
+            self._window.evaluate_js(f"app.openArchivePasswordModal({name_js}, {err_js})")
+            self._password_event.wait()
+            with self._password_lock:
+                if self._password_cancelled:
+                    return None
+                return self._password_value
 
     def import_zips(self):
         """
@@ -842,9 +1098,9 @@ class AppApi:
           - 密码交互: _request_archive_password（通过 password_provider 回调）
 
         实现逻辑:
-        - 1) 使用 _is_busy 防止并发导入任务。
+        - 1) 扫描待解压区，以每个压缩包对应的语音包目录作为任务资源提交到调度器（同名目录的任务排队）。
         - 2) 前端显示加载组件并推送初始进度。
-        - 3) 在后台线程执行 unzip_zips_to_library，并将 update_loading_ui 作为进度回调。
+        - 3) 在后台任务中执行 unzip_zips_to_library，并将任务进度回调传入。
         - 4) 解压完成后通知前端刷新语音包库列表并将进度更新到 100。
         - 5) 用户取消密码输入时中止导入并隐藏加载组件。
 
@@ -852,10 +1108,8 @@ class AppApi:
         - 上游: 前端“批量导入”操作触发。
         - 下游: 语音包库目录新增内容，前端刷新后展示新语音包。
         """
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return
-        self._is_busy = True
+        archives = self._lib_mgr.scan_pending()
+        resources = [library_resource(p.stem) for p in archives]
 
         # 显示加载组件（关闭自动模拟，由后端推送真实进度）
         if self._window:
@@ -865,15 +1119,16 @@ class AppApi:
             )
             self.update_loading_ui(1, "开始扫描待解压区...")
 
-        def _run():
+        def _run(job):
             try:
                 def password_provider(archive_path, reason):
                     hint = "密码错误，请重试" if reason == "incorrect" else ""
                     return self._request_archive_password(Path(archive_path).name, hint)
 
                 self._lib_mgr.unzip_zips_to_library(
-                    progress_callback=self.update_loading_ui,
+                    progress_callback=self._job_progress(job),
                     password_provider=password_provider,
+                    archives=archives,
                 )
 
                 # 完成后通知前端刷新列表
@@ -896,20 +1151,82 @@ class AppApi:
                     self._window.evaluate_js(
                         f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
                     )
-            finally:
-                self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._submit_job("批量导入语音包", resources, _run)
+
+    def import_folders(self, paths=None, mode="move"):
+        """
+        功能定位:
+        - 将已解压的语音包文件夹（可多选）导入到语音包库，无需重新打包。
+
+        输入输出:
+        - 参数:
+          - paths: list[str] | str | None，源文件夹列表（可能以 JSON 字符串形式传入）；为空时弹出文件夹选择对话框。
+          - mode: str，"move" | "link" | "copy"，见 LibraryManager.import_folder。
+        - 返回:
+          - bool，导入任务已启动返回 True；用户取消或参数错误返回 False。
+        - 外部资源/依赖:
+          - PyWebview 对话框: self._window.create_file_dialog（FOLDER 多选）
+          - LibraryManager.import_folder
+          - 前端组件: MinimalistLoading.show/update
+
+        实现逻辑:
+        - 1) 解析 paths；为空时打开文件夹选择对话框。
+        - 2) 以每个文件夹对应的语音包目录作为任务资源提交到调度器，后台执行 import_folder 并推送进度。
+        - 3) 完成后通知前端刷新语音包库列表。
 
-    def import_selected_zip(self):
+        业务关联:
+        - 上游: 前端“导入文件夹”操作。
+        - 下游: 语音包库目录新增内容，前端刷新后展示新语音包。
+        """
+        if isinstance(paths, str):
+            try:
+                paths = json.loads(paths)
+            except json.JSONDecodeError:
+                paths = [paths]
+        if not paths:
+            if not self._window:
+                return False
+            paths = self._window.create_file_dialog(webview.FileDialog.FOLDER, allow_multiple=True)
+            if not paths:
+                return False
+        folders = [Path(p) for p in paths]
+
+        if self._window:
+            msg_js = json.dumps("正在准备导入...", ensure_ascii=False)
+            self._window.evaluate_js(
+                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
+            )
+
+        def _run(job):
+            try:
+                self._lib_mgr.import_folder(folders, mode=mode, progress_callback=self._job_progress(job))
+                if self._window:
+                    self._window.evaluate_js("app.refreshLibrary({manual:true})")
+                    msg_js = json.dumps("导入完成", ensure_ascii=False)
+                    self._window.evaluate_js(
+                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                    )
+            except Exception as e:
+                self.log_from_backend(f"[ERROR] 导入文件夹失败: {e}")
+                if self._window:
+                    msg_js = json.dumps("导入失败", ensure_ascii=False)
+                    self._window.evaluate_js(
+                        f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                    )
+
+        resources = [library_resource(f.name) for f in folders]
+        self._submit_job("导入语音包文件夹", resources, _run)
+        return True
+
+    def import_selected_zip(self, path=None):
         """
         功能定位:
         - 打开文件选择对话框导入单个 ZIP/RAR 到语音包库，并将进度同步到前端加载组件。
 
         输入输出:
-        - 参数: 无
+        - 参数:
+          - path: str | None，压缩包路径（导入预览对话框传入）；为空时弹出文件选择对话框。
         - 返回: None
         - 外部资源/依赖:
           - PyWebview 对话框: self._window.create_file_dialog（OPEN 单选）
@@ -918,31 +1235,29 @@ class AppApi:
           - 密码交互: _request_archive_password
 
         实现逻辑:
-        - 1) 若已有任务运行则提示并返回。
-        - 2) 打开文件选择对话框，读取用户选择的压缩包路径。
-        - 3) 显示加载组件，在后台线程执行 unzip_single_zip 并推送真实进度。
+        - 1) 未传入路径时打开文件选择对话框，读取用户选择的压缩包路径。
+        - 2) 以目标语音包目录作为任务资源提交到调度器（与同名目录的任务排队）。
+        - 3) 显示加载组件，在后台任务中执行 unzip_single_zip 并推送真实进度。
         - 4) 完成后通知前端刷新语音包库列表并更新进度到 100；异常时写日志并更新前端状态。
 
         业务关联:
-        - 上游: 前端“选择文件导入”触发。
+        - 上游: 前端“选择文件导入”触发；导入预览对话框的“导入到语音包库”。
         - 下游: 语音包库目录新增内容，前端刷新后展示新语音包。
         """
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return
-
-        # 打开文件选择对话框（返回列表，即使为单选）
-        file_types = ("Zip Files (*.zip)", "Rar Files (*.rar)", "All files (*.*)")
+        if path:
+            result = [path]
+        else:
+            # 打开文件选择对话框（返回列表，即使为单选）
+            file_types = ("Zip Files (*.zip)", "Rar Files (*.rar)", "All files (*.*)")
 
-        # 使用 OPEN 对话框模式进行单文件选择
-        result = self._window.create_file_dialog(
-            webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
-        )
+            # 使用 OPEN 对话框模式进行单文件选择
+            result = self._window.create_file_dialog(
+                webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
+            )
 
         if result and len(result) > 0:
             zip_path = result[0]
             # self.log_from_backend(f"[INFO] 准备导入: {zip_path}")
-            self._is_busy = True
 
             # 显示加载条
             if self._window:
@@ -953,7 +1268,7 @@ class AppApi:
                     f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
                 )
 
-            def _run():
+            def _run(job):
                 try:
                     self.update_loading_ui(1, f"正在读取: {Path(zip_path).name}")
 
@@ -963,7 +1278,7 @@ class AppApi:
 
                     self._lib_mgr.unzip_single_zip(
                         Path(zip_path),
-                        progress_callback=self.update_loading_ui,
+                        progress_callback=self._job_progress(job),
                         password_provider=password_provider,
                     )
 
@@ -987,12 +1302,12 @@ class AppApi:
                         self._window.evaluate_js(
                             f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
                         )
-                finally:
-                    self._is_busy = False
 
-            t = threading.Thread(target=_run)
-            t.daemon = True
-            t.start()
+            self._submit_job(
+                f"导入语音包: {Path(zip_path).name}",
+                [library_resource(Path(zip_path).stem)],
+                _run,
+            )
         else:
             pass
 
@@ -1044,10 +1359,6 @@ class AppApi:
         return data
 
     def import_skin_zip_dialog(self):
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return False
-
         path = self._cfg_mgr.get_game_path()
         valid, msg = self._logic.validate_game_path(path)
         if not valid:
@@ -1066,10 +1377,6 @@ class AppApi:
         return True
 
     def import_skin_zip_from_path(self, zip_path):
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return False
-
         path = self._cfg_mgr.get_game_path()
         valid, msg = self._logic.validate_game_path(path)
         if not valid:
@@ -1077,7 +1384,6 @@ class AppApi:
             return False
 
         zip_path = str(zip_path)
-        self._is_busy = True
 
         if self._window:
             msg_js = json.dumps(f"涂装解压: {Path(zip_path).name}", ensure_ascii=False)
@@ -1085,10 +1391,10 @@ class AppApi:
                 f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
             )
 
-        def _run():
+        def _run(job):
             try:
                 self._skins_mgr.import_skin_zip(
-                    zip_path, path, progress_callback=self.update_loading_ui
+                    zip_path, path, progress_callback=self._job_progress(job)
                 )
                 if self._window:
                     self._window.evaluate_js("if(app.refreshSkins) app.refreshSkins()")
@@ -1110,12 +1416,8 @@ class AppApi:
                     self._window.evaluate_js(
                         f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
                     )
-            finally:
-                self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._submit_job(f"导入涂装: {Path(zip_path).name}", [RES_USERSKINS], _run)
         return True
 
     def rename_skin(self, old_name, new_name):
@@ -1162,17 +1464,13 @@ class AppApi:
           - SkinsManager.update_skin_cover（写入 preview.png）
 
         实现逻辑:
-        - 1) 若系统处于忙碌状态则拒绝操作。
-        - 2) 打开图片文件选择对话框并读取用户选择。
-        - 3) 调用 update_skin_cover 写入 preview.png。
+        - 1) 打开图片文件选择对话框并读取用户选择。
+        - 2) 通过调度器占用 UserSkins 资源后调用 update_skin_cover 写入 preview.png（导入进行中时排队等待）。
 
         业务关联:
         - 上游: 前端涂装编辑弹窗“更换封面”操作。
         - 下游: 前端刷新涂装列表后封面展示更新。
         """
-        if self._is_busy:
-            return {"success": False, "msg": "系统繁忙"}
-
         file_types = ("Image Files (*.jpg;*.jpeg;*.png;*.webp)", "All files (*.*)")
         result = self._window.create_file_dialog(
             webview.FileDialog.OPEN, allow_multiple=False, file_types=file_types
@@ -1182,7 +1480,11 @@ class AppApi:
             img_path = result[0]
             path = self._cfg_mgr.get_game_path()
             try:
-                self._skins_mgr.update_skin_cover(path, skin_name, img_path)
+                self._scheduler.run(
+                    "更新涂装封面",
+                    [RES_USERSKINS],
+                    lambda _job: self._skins_mgr.update_skin_cover(path, skin_name, img_path),
+                )
                 return {"success": True, "new_cover": img_path}  # Return path, JS can reload
             except Exception as e:
                 return {"success": False, "msg": str(e)}
@@ -1204,19 +1506,20 @@ class AppApi:
           - ConfigManager.get_game_path
 
         实现逻辑:
-        - 1) 若系统处于忙碌状态则拒绝操作。
+        - 1) 通过调度器占用 UserSkins 资源（导入进行中时排队等待）。
         - 2) 调用 update_skin_cover_data 写入封面并返回结果。
 
         业务关联:
         - 上游: 前端裁剪封面后提交调用。
         - 下游: 前端刷新列表后封面展示更新。
         """
-        if self._is_busy:
-            return {"success": False, "msg": "系统繁忙"}
-
         path = self._cfg_mgr.get_game_path()
         try:
-            self._skins_mgr.update_skin_cover_data(path, skin_name, data_url)
+            self._scheduler.run(
+                "更新涂装封面",
+                [RES_USERSKINS],
+                lambda _job: self._skins_mgr.update_skin_cover_data(path, skin_name, data_url),
+            )
             return {"success": True}
         except Exception as e:
             return {"success": False, "msg": str(e)}
@@ -1240,10 +1543,11 @@ class AppApi:
 
         实现逻辑:
         - 1) 若 install_list 为字符串则尝试 json.loads 转为列表。
-        - 2) 通过线程锁与 _is_busy 控制并发，避免同时执行多个任务。
-        - 3) 校验游戏路径有效性；失败时清理 busy 状态并返回 False。
-        - 4) 写入当前语音包标识到配置。
-        - 5) 在后台线程执行 install_from_library，并通过 update_loading_ui 推送进度。
+        - 2) 校验游戏路径有效性；失败时返回 False。
+        - 3) 写入当前语音包标识到配置。
+        - 4) 以 sound/mod 与该语音包目录作为任务资源提交到调度器；资源被占用时排队等待。
+        - 5) 在后台任务中执行 install_from_library，并通过任务进度回调推送进度；
+             冷存储中的语音包改为 install_from_archive 从归档 ZIP 直接安装。
         - 6) 完成后通知前端更新“已安装”状态并结束加载组件。
 
         业务关联:
@@ -1260,30 +1564,28 @@ class AppApi:
                 )
                 return False
 
-        # 使用线程锁与状态位限制并发任务
-        with self._lock:
-            if self._is_busy:
-                self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...", "WARN")
-                return False
-            self._is_busy = True
-
         path = self._cfg_mgr.get_game_path()
         valid, _ = self._logic.validate_game_path(path)
         if not valid:
             self.log_from_backend("[ERROR] 安装失败：未设置有效游戏路径", "ERROR")
-            with self._lock:
-                self._is_busy = False
             return False
 
         # 记录当前语音包标识，供前端在列表中标记已生效项
         self._cfg_mgr.set_current_mod(mod_name)
 
-        def _run():
+        def _run(job):
             try:
-                mod_path = self._lib_mgr.library_dir / mod_name
-                self._logic.install_from_library(
-                    mod_path, install_list, progress_callback=self.update_loading_ui
-                )
+                if self._lib_mgr.is_cold(mod_name):
+                    # 冷存储语音包：从归档 ZIP 直接流式写入 sound/mod，无需先恢复目录
+                    self._logic.install_from_archive(
+                        self._lib_mgr.cold_archive_path(mod_name), install_list,
+                        progress_callback=self._job_progress(job), mod_name=mod_name,
+                    )
+                else:
+                    mod_path = self._lib_mgr.library_dir / mod_name
+                    self._logic.install_from_library(
+                        mod_path, install_list, progress_callback=self._job_progress(job)
+                    )
 
                 # 安装完成，通知前端
                 if self._window:
@@ -1301,13 +1603,72 @@ class AppApi:
                     self._window.evaluate_js(
                         f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
                     )
-            finally:
-                with self._lock:
-                    self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._submit_job(
+            f"安装语音包: {mod_name}",
+            [RES_GAME_MOD, library_resource(mod_name)],
+            _run,
+        )
+        return True
+
+    def install_archive(self, path, install_list):
+        """
+        功能定位:
+        - 不导入语音包库，直接把 ZIP 中选中的文件夹安装到游戏 sound/mod。
+
+        输入输出:
+        - 参数:
+          - path: str，ZIP 压缩包路径。
+          - install_list: list[str] | str，压缩包内的相对文件夹列表（inspect_archive 返回的 folders[].path）；可能以 JSON 字符串形式传入。
+        - 返回:
+          - bool，安装任务已启动返回 True；参数错误或环境不满足时返回 False。
+        - 外部资源/依赖:
+          - CoreService.install_from_archive
+          - 密码交互: _request_archive_password
+          - 前端组件: MinimalistLoading.update
+
+        实现逻辑:
+        - 1) 解析 install_list 并校验游戏路径。
+        - 2) 以 sound/mod 作为任务资源提交到调度器，在后台执行 install_from_archive 并推送进度。
+
+        业务关联:
+        - 上游: 前端导入预览对话框中的“直接安装”操作。
+        - 下游: 游戏 sound/mod 内容、config.blk 开关与安装清单。
+        """
+        if isinstance(install_list, str):
+            try:
+                install_list = json.loads(install_list)
+            except json.JSONDecodeError:
+                self.log_from_backend(
+                    f"[ERROR] 解析安装列表失败: {install_list}", "ERROR"
+                )
+                return False
+
+        game_path = self._cfg_mgr.get_game_path()
+        valid, _ = self._logic.validate_game_path(game_path)
+        if not valid:
+            self.log_from_backend("[ERROR] 安装失败：未设置有效游戏路径", "ERROR")
+            return False
+
+        archive_path = Path(path)
+
+        def _run(job):
+            def password_provider(p, reason):
+                hint = "密码错误，请重试" if reason == "incorrect" else ""
+                return self._request_archive_password(Path(p).name, hint)
+
+            self._logic.install_from_archive(
+                archive_path, install_list,
+                progress_callback=self._job_progress(job),
+                password_provider=password_provider,
+            )
+            if self._window:
+                msg_js = json.dumps("安装结束", ensure_ascii=False)
+                self._window.evaluate_js(
+                    f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                )
+
+        self._submit_job(f"直接安装: {archive_path.name}", [RES_GAME_MOD], _run)
         return True
 
     def check_install_conflicts(self, mod_name, install_list):
@@ -1325,12 +1686,13 @@ class AppApi:
           - ConfigManager.get_game_path
           - CoreService.validate_game_path（初始化 manifest_mgr）
           - LibraryManager.library_dir（定位语音包源目录）
-          - ManifestManager.check_conflicts（基于 .manifest.json 的 file_map 检测）
+          - LibraryIndex.files_for_install（语音包库索引中的文件清单）
+          - ManifestManager.check_conflicts（与安装清单的文件所有权求交集）
 
         实现逻辑:
         - 1) 若 install_list 为字符串则尝试解析为列表。
         - 2) 校验游戏路径与语音包目录存在。
-        - 3) 递归遍历 install_list 对应目录，收集将写入 sound/mod 的目标文件名列表。
+        - 3) 索引中该语音包签名未变化时直接取索引文件清单；否则递归遍历 install_list 对应目录收集目标文件名。
         - 4) 调用 manifest_mgr.check_conflicts 返回冲突结果。
 
         业务关联:
@@ -1355,17 +1717,12 @@ class AppApi:
             if not mod_path.exists():
                 return []
 
-            # 遍历将要安装的目录集合，收集目标文件名列表
-            files_to_install = []
-            for folder_rel_path in install_list:
-                if folder_rel_path == "根目录":
-                    src_dir = mod_path
-                else:
-                    src_dir = mod_path / folder_rel_path
-                if src_dir.exists():
-                    for root, dirs, files in os.walk(src_dir):
-                        for file in files:
-                            files_to_install.append(file)
+            # 优先使用语音包库索引中的文件清单；索引缺失或已过期时遍历目录
+            files_to_install = None
+            if self._lib_mgr.index.is_fresh(mod_name):
+                files_to_install = self._lib_mgr.index.files_for_install(mod_name, install_list)
+            if files_to_install is None:
+                files_to_install = self._collect_install_files(mod_path, install_list)
 
             # 调用 manifest_mgr 进行冲突检测
             if self._logic.manifest_mgr:
@@ -1375,6 +1732,229 @@ class AppApi:
             self.log_from_backend(f"[WARN] 冲突检测失败: {e}", "WARN")
             return []
 
+    def _collect_install_files(self, mod_path, install_list):
+        """遍历 install_list 对应目录（含子目录），收集将写入 sound/mod 的目标文件名列表。"""
+        files_to_install = []
+        for folder_rel_path in install_list:
+            if folder_rel_path == "根目录":
+                src_dir = mod_path
+            else:
+                src_dir = mod_path / folder_rel_path
+            if src_dir.exists():
+                for root, dirs, files in os.walk(src_dir):
+                    for file in files:
+                        files_to_install.append(file)
+        return files_to_install
+
+    def export_mod(self, mod_name, dest=None):
+        """
+        功能定位:
+        - 将语音包库中的语音包导出为可分享的 ZIP 文件。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包目录名。
+          - dest: str | None，导出文件路径；为空时弹出保存对话框。
+        - 返回:
+          - bool，导出任务已启动返回 True；用户取消返回 False。
+        - 外部资源/依赖:
+          - PyWebview 对话框: self._window.create_file_dialog（SAVE）
+          - LibraryManager.export_mod
+          - 前端组件: MinimalistLoading.show/update
+
+        实现逻辑:
+        - 1) 未指定 dest 时以 <mod_name>.zip 作为默认文件名弹出保存对话框。
+        - 2) 以该语音包目录作为任务资源提交到调度器（导入/删除同一语音包时排队），后台执行导出并推送进度。
+
+        业务关联:
+        - 上游: 前端语音包卡片“导出”操作。
+        - 下游: 生成的 ZIP 可在其他电脑上直接导入。
+        """
+        if not dest:
+            if not self._window:
+                return False
+            result = self._window.create_file_dialog(
+                webview.FileDialog.SAVE, save_filename=f"{mod_name}.zip", file_types=("ZIP 压缩包 (*.zip)",)
+            )
+            if not result:
+                return False
+            dest = result[0] if isinstance(result, (list, tuple)) else result
+
+        if self._window:
+            msg_js = json.dumps("正在导出...", ensure_ascii=False)
+            self._window.evaluate_js(
+                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
+            )
+
+        def _run(job):
+            try:
+                self._lib_mgr.export_mod(mod_name, dest, progress_callback=self._job_progress(job))
+                msg = "导出完成"
+            except Exception as e:
+                self.log_from_backend(f"[ERROR] 导出失败: {e}")
+                msg = "导出失败"
+            if self._window:
+                msg_js = json.dumps(msg, ensure_ascii=False)
+                self._window.evaluate_js(
+                    f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                )
+
+        self._submit_job(f"导出语音包: {mod_name}", [library_resource(str(mod_name))], _run)
+        return True
+
+    def freeze_mod(self, mod_name):
+        """
+        功能定位:
+        - 将语音包归档到冷存储（打包为单个 ZIP 并删除目录），列表中仍展示详情与封面。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包目录名。
+        - 返回:
+          - bool，任务已启动返回 True。
+        - 外部资源/依赖: LibraryManager.freeze_mod、前端组件 MinimalistLoading
+
+        实现逻辑:
+        - 以该语音包目录作为任务资源提交到调度器，后台执行归档并推送进度，完成后刷新语音包库列表。
+
+        业务关联:
+        - 上游: 前端语音包卡片“归档到冷存储”操作。
+        - 下游: 语音包库占用空间；安装该语音包时从归档直接安装。
+        """
+        return self._submit_cold_job(f"归档语音包: {mod_name}", mod_name, self._lib_mgr.freeze_mod, "归档")
+
+    def thaw_mod(self, mod_name):
+        """
+        功能定位:
+        - 将冷存储中的语音包恢复为语音包库目录。
+
+        输入输出:
+        - 参数:
+          - mod_name: str，语音包名称。
+        - 返回:
+          - bool，任务已启动返回 True。
+        - 外部资源/依赖: LibraryManager.thaw_mod、前端组件 MinimalistLoading
+
+        实现逻辑:
+        - 以该语音包目录作为任务资源提交到调度器，后台执行恢复并推送进度，完成后刷新语音包库列表。
+
+        业务关联:
+        - 上游: 前端冷存储语音包卡片“恢复”操作。
+        - 下游: 语音包恢复为普通目录。
+        """
+        return self._submit_cold_job(f"恢复语音包: {mod_name}", mod_name, self._lib_mgr.thaw_mod, "恢复")
+
+    def _submit_cold_job(self, title, mod_name, func, action):
+        """提交冷存储归档/恢复任务：显示加载组件，后台执行 func(mod_name, progress_callback)，结束后刷新列表。"""
+        if self._window:
+            msg_js = json.dumps(f"正在{action}...", ensure_ascii=False)
+            self._window.evaluate_js(
+                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
+            )
+
+        def _run(job):
+            try:
+                func(str(mod_name), progress_callback=self._job_progress(job))
+                msg = f"{action}完成"
+            except Exception as e:
+                self.log_from_backend(f"[ERROR] {action}失败: {e}", "ERROR")
+                msg = f"{action}失败"
+            if self._window:
+                self._window.evaluate_js("app.refreshLibrary({manual:true})")
+                msg_js = json.dumps(msg, ensure_ascii=False)
+                self._window.evaluate_js(
+                    f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                )
+
+        self._submit_job(title, [library_resource(str(mod_name))], _run)
+        return True
+
+    def dedupe_library(self, dry_run=False):
+        """
+        功能定位:
+        - 跨语音包去重：将内容相同的 .bank 文件替换为硬链接并报告回收空间。
+
+        输入输出:
+        - 参数:
+          - dry_run: bool，只统计可回收空间，不修改文件。
+        - 返回:
+          - bool，任务已启动返回 True。
+        - 外部资源/依赖: LibraryManager.dedupe_library、前端组件 MinimalistLoading
+
+        实现逻辑:
+        - 以整个语音包库（RES_LIBRARY，与所有语音包目录互斥）作为任务资源提交到调度器：导入/安装/删除进行中时排队，
+          去重开始后提交的导入、重命名等任务也等待去重结束。后台执行去重并推送进度。
+
+        业务关联:
+        - 上游: 前端语音包库“去重”操作。
+        - 下游: 语音包库占用空间减少；日志输出回收空间。
+        """
+        if self._window:
+            msg_js = json.dumps("正在查找重复文件...", ensure_ascii=False)
+            self._window.evaluate_js(
+                f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
+            )
+
+        def _run(job):
+            try:
+                self._lib_mgr.dedupe_library(progress_callback=self._job_progress(job), dry_run=bool(dry_run))
+                msg = "去重完成"
+            except Exception as e:
+                self.log_from_backend(f"[ERROR] 去重失败: {e}", "ERROR")
+                msg = "去重失败"
+            if self._window:
+                msg_js = json.dumps(msg, ensure_ascii=False)
+                self._window.evaluate_js(
+                    f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                )
+
+        self._submit_job("语音包库去重", [RES_LIBRARY], _run)
+        return True
+
+    def verify_library(self):
+        """
+        功能定位:
+        - 全库健康检查：并行检查每个语音包，并将结果逐个推送到前端。
+
+        输入输出:
+        - 参数: 无
+        - 返回:
+          - bool，任务已启动返回 True。
+        - 外部资源/依赖:
+          - LibraryManager.verify_library
+          - 前端回调: app.onLibraryVerifyResult(result)、MinimalistLoading.update
+
+        实现逻辑:
+        - 1) 以整个语音包库（RES_LIBRARY，与所有语音包目录互斥）作为任务资源提交到调度器，检查期间不会有导入/删除修改语音包库。
+        - 2) 每个语音包检查完成（或沿用缓存结论）时调用前端 app.onLibraryVerifyResult，前端无需等待全库结束。
+
+        业务关联:
+        - 上游: 前端语音包库“健康检查”操作。
+        - 下游: 前端标记损坏的语音包，提示用户重新导入。
+        """
+        def _on_result(result):
+            if self._window:
+                payload = json.dumps(result, ensure_ascii=False)
+                self._window.evaluate_js(
+                    f"if(window.app && app.onLibraryVerifyResult) app.onLibraryVerifyResult({payload})"
+                )
+
+        def _run(job):
+            try:
+                self._lib_mgr.verify_library(progress_callback=self._job_progress(job), on_result=_on_result)
+                msg = "检查完成"
+            except Exception as e:
+                self.log_from_backend(f"[ERROR] 健康检查失败: {e}", "ERROR")
+                msg = "检查失败"
+            if self._window:
+                msg_js = json.dumps(msg, ensure_ascii=False)
+                self._window.evaluate_js(
+                    f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
+                )
+
+        self._submit_job("语音包库健康检查", [RES_LIBRARY], _run)
+        return True
+
     def delete_mod(self, mod_name):
         """
         功能定位:
@@ -1389,21 +1969,20 @@ class AppApi:
           - 文件系统: <library_dir>/<mod_name>（删除）
 
         实现逻辑:
-        - 1) 使用 _is_busy 防止与其他任务并发。
+        - 1) 通过调度器占用该语音包目录资源（导入/安装该语音包进行中时排队等待）。
         - 2) 将 library_dir 与 target 路径 resolve 后做包含关系校验，限制删除范围。
-        - 3) 调用 shutil.rmtree 删除目标目录并写日志。
+        - 3) 调用 shutil.rmtree 删除目标目录并写日志；冷存储语音包删除归档文件与索引条目。
 
         业务关联:
         - 上游: 前端语音包卡片“删除”操作触发。
         - 下游: 前端刷新语音包库列表后移除该条目。
         """
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return False
-
         import shutil
 
-        try:
+        def _delete(_job):
+            if self._lib_mgr.is_cold(str(mod_name)):
+                self._lib_mgr.discard_cold(str(mod_name))
+                return
             library_dir = Path(self._lib_mgr.library_dir).resolve()
             target = (library_dir / str(mod_name)).resolve()
             if os.path.commonpath([str(target), str(library_dir)]) != str(
@@ -1411,6 +1990,11 @@ class AppApi:
             ) or str(target) == str(library_dir):
                 raise Exception("非法路径")
             shutil.rmtree(target)
+
+        try:
+            self._scheduler.run(
+                f"删除语音包: {mod_name}", [library_resource(str(mod_name))], _delete
+            )
             self.log_from_backend(f"[INFO] 已删除语音包: {mod_name}")
             return True
         except Exception as e:
@@ -1492,41 +2076,30 @@ class AppApi:
           - 前端回调: app.onRestoreSuccess
 
         实现逻辑:
-        - 1) 若系统忙碌则拒绝执行。
-        - 2) 校验游戏路径有效性；失败则写日志并返回 False。
-        - 3) 后台线程调用 core_logic.restore_game 执行目录清理与配置写回。
+        - 1) 校验游戏路径有效性；失败则写日志并返回 False。
+        - 2) 以 sound/mod 作为任务资源提交到调度器（安装进行中时排队等待）。
+        - 3) 后台任务调用 core_logic.restore_game 执行目录清理与配置写回。
         - 4) 还原完成后将 current_mod 置空并通知前端刷新状态。
 
         业务关联:
         - 上游: 前端“还原纯净”按钮触发。
         - 下游: 游戏目录与配置状态恢复到未加载语音包的状态。
         """
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return False
-
         path = self._cfg_mgr.get_game_path()
         valid, msg = self._logic.validate_game_path(path)
         if not valid:
             self.log_from_backend(f"[ERROR] 还原失败: {msg}", "ERROR")
             return False
 
-        self._is_busy = True
-
-        def _run():
-            try:
-                self._logic.restore_game()
+        def _run(job):
+            self._logic.restore_game()
 
-                # 还原成功，清除状态
-                self._cfg_mgr.set_current_mod("")
-                if self._window:
-                    self._window.evaluate_js("app.onRestoreSuccess()")
-            finally:
-                self._is_busy = False
+            # 还原成功，清除状态
+            self._cfg_mgr.set_current_mod("")
+            if self._window:
+                self._window.evaluate_js("app.onRestoreSuccess()")
 
-        t = threading.Thread(target=_run)
-        t.daemon = True  # 设置为守护线程
-        t.start()
+        self._submit_job("还原纯净模式", [RES_GAME_MOD], _run)
         return True
 
     def clear_logs(self):
@@ -1800,18 +2373,19 @@ class AppApi:
         - 外部资源/依赖: SightsManager.update_sight_cover_data
 
         实现逻辑:
-        - 1) 若系统处于忙碌状态则拒绝操作。
+        - 1) 通过调度器占用 UserSights 资源（导入进行中时排队等待）。
         - 2) 调用 update_sight_cover_data 写入封面并返回结果。
 
         业务关联:
         - 上游: 前端裁剪封面后提交调用。
         - 下游: 前端刷新列表后封面展示更新。
         """
-        if self._is_busy:
-            return {"success": False, "msg": "系统繁忙"}
-
         try:
-            self._sights_mgr.update_sight_cover_data(sight_name, data_url)
+            self._scheduler.run(
+                "更新炮镜封面",
+                [RES_USERSIGHTS],
+                lambda _job: self._sights_mgr.update_sight_cover_data(sight_name, data_url),
+            )
             return {"success": True}
         except Exception as e:
             return {"success": False, "msg": str(e)}
@@ -1830,7 +2404,7 @@ class AppApi:
           - import_sights_zip_from_path
 
         实现逻辑:
-        - 1) 校验当前无并发任务且已设置 UserSights 路径。
+        - 1) 校验已设置 UserSights 路径。
         - 2) 打开文件选择对话框获取 zip_path。
         - 3) 调用 import_sights_zip_from_path 执行后台导入。
 
@@ -1838,10 +2412,6 @@ class AppApi:
         - 上游: 前端“导入炮镜”按钮触发。
         - 下游: 导入完成后前端刷新炮镜列表展示新内容。
         """
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return False
-
         if not self._sights_mgr.get_usersights_path():
             self.log_from_backend("[WARN] 请先设置有效的 UserSights 路径", "WARN")
             return False
@@ -1873,24 +2443,19 @@ class AppApi:
           - 前端回调: app.refreshSights
 
         实现逻辑:
-        - 1) 校验当前无并发任务且已设置 UserSights 路径。
-        - 2) 显示加载组件并在后台线程执行 import_sights_zip，使用 update_loading_ui 推送进度。
+        - 1) 校验已设置 UserSights 路径。
+        - 2) 显示加载组件，以 UserSights 作为任务资源提交到调度器，在后台任务中执行 import_sights_zip 并推送进度。
         - 3) 完成后通知前端刷新炮镜列表并更新进度到 100。
 
         业务关联:
         - 上游: import_sights_zip_dialog 或前端拖拽导入流程调用。
         - 下游: UserSights 目录新增内容，前端刷新后展示新炮镜。
         """
-        if self._is_busy:
-            self.log_from_backend("[WARN] 另一个任务正在进行中，请稍候...")
-            return False
-
         if not self._sights_mgr.get_usersights_path():
             self.log_from_backend("[WARN] 请先设置有效的 UserSights 路径", "WARN")
             return False
 
         zip_path = str(zip_path)
-        self._is_busy = True
 
         if self._window:
             msg_js = json.dumps(f"炮镜解压: {Path(zip_path).name}", ensure_ascii=False)
@@ -1898,10 +2463,10 @@ class AppApi:
                 f"if(window.MinimalistLoading) MinimalistLoading.show(false, {msg_js})"
             )
 
-        def _run():
+        def _run(job):
             try:
                 self._sights_mgr.import_sights_zip(
-                    zip_path, progress_callback=self.update_loading_ui
+                    zip_path, progress_callback=self._job_progress(job)
                 )
                 if self._window:
                     self._window.evaluate_js("if(app.refreshSights) app.refreshSights()")
@@ -1923,12 +2488,8 @@ class AppApi:
                     self._window.evaluate_js(
                         f"if(window.MinimalistLoading) MinimalistLoading.update(100, {msg_js})"
                     )
-            finally:
-                self._is_busy = False
 
-        t = threading.Thread(target=_run)
-        t.daemon = True
-        t.start()
+        self._submit_job(f"导入炮镜: {Path(zip_path).name}", [RES_USERSIGHTS], _run)
         return True
 
     def open_sights_folder(self):
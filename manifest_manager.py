@@ -9,13 +9,21 @@
 - 输入: 游戏根目录、语音包名称、待安装文件名列表、已安装文件名列表。
 - 输出: 冲突列表、清单文件写入结果（通过文件系统副作用体现）。
 - 外部资源/依赖:
-  - 文件: <game_root>/sound/mod/.manifest.json（读写/删除）
+  - 文件: <game_root>/sound/mod/.manifest.json（快照，读写/删除）
+  - 文件: <game_root>/sound/mod/.manifest.journal（追加日志，读写/删除）
+  - 文件: <game_root>/sound/mod/.manifest.db（可选 SQLite 后端，读写）
 
 实现逻辑:
-- 1) 初始化时加载 .manifest.json；读取失败时使用空清单结构。
+- 1) 初始化时加载 .manifest.json 快照，再按序重放 .manifest.journal 中快照之后的变更；末尾写了一半的行视为未提交并忽略。
 - 2) 冲突检测使用 file_map 对文件名进行所有权查询。
-- 3) 安装记录写入 installed_mods 与 file_map，并落盘保存。
-- 4) 还原或卸载时按语音包维度移除记录或清空整个清单。
+- 3) 安装记录/移除记录只向日志追加一行并 fsync，写入成本与变更大小成正比。
+- 4) 日志累计到一定行数或体积后压缩：快照写入临时文件并 fsync，再以 os.replace 原子替换，最后清空日志。
+- 5) 还原时清空整个清单（删除快照与日志）。
+- 6) 已安装列表通过 snapshot() 读取缓存快照：本进程写入时直接失效；外部修改通过存储文件 mtime/size 签名发现，
+     签名检查按间隔节流，未变化时不读取文件内容。
+- 7) reconcile 以 os.scandir 单次遍历 sound/mod，按 size/mtime（可选哈希）比对清单，报告孤立/缺失/被修改文件并修复清单。
+- 8) 可选 SQLite 后端（配置 manifest_backend="sqlite"）：文件所有权、文件明细与安装历史存为带索引的表，
+     冲突检测/文件列表/历史均为单条索引查询；首次启用时自动从 JSON 清单迁移。
 
 业务关联:
 - 上游: core_logic.py 在安装/还原流程中调用；main.py 在安装前冲突检查中调用。
@@ -24,9 +32,229 @@
 
 import json
 import os
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
 
+
+def _empty_manifest():
+    return {"installed_mods": {}, "file_map": {}, "journal_seq": 0}
+
+
+class _SqliteManifestStore:
+    """
+    功能定位:
+    - 安装清单的 SQLite 存储后端：文件所有权、每个语音包的文件明细与安装历史均为带索引的表。
+
+    输入输出:
+    - 输入: 数据库文件路径。
+    - 输出: 冲突查询、文件列表、历史记录等查询结果；安装/移除记录的事务写入。
+    - 外部资源/依赖: sqlite3、<game_root>/sound/mod/.manifest.db
+
+    实现逻辑:
+    - 表结构:
+      - mods(name, install_time)
+      - files(name, owner, size, hash, mtime, method, active)：每个语音包安装的每个文件一行；
+        active=1 表示该文件名当前归属于 owner（后安装者覆盖先安装者，与 JSON 后端 file_map 语义一致）。
+      - events(mod, action, time, file_count)：install/remove/clear 历史。
+    - 索引: files(name, active)、files(owner)、events(time)。
+    - 连接允许跨线程使用，所有访问由 _lock 串行化；WAL 模式降低写入成本。
+
+    业务关联:
+    - 上游: ManifestManager 在 backend="sqlite" 时委托本类。
+    - 下游: 冲突检测、已安装列表、安装历史展示。
+    """
+
+    # SQLite 早期版本单条语句最多 999 个绑定参数，IN 查询按此分批
+    _IN_CHUNK = 500
+
+    def __init__(self, db_file):
+        self.db_file = Path(db_file)
+        self._lock = threading.RLock()
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+                CREATE TABLE IF NOT EXISTS mods (
+                    name TEXT PRIMARY KEY,
+                    install_time TEXT
+                );
+                CREATE TABLE IF NOT EXISTS files (
+                    name TEXT NOT NULL,
+                    owner TEXT NOT NULL,
+                    size INTEGER,
+                    hash TEXT,
+                    mtime REAL,
+                    method TEXT,
+                    active INTEGER NOT NULL DEFAULT 1,
+                    PRIMARY KEY (owner, name)
+                );
+                CREATE INDEX IF NOT EXISTS idx_files_name ON files(name, active);
+                CREATE INDEX IF NOT EXISTS idx_files_owner ON files(owner);
+                CREATE TABLE IF NOT EXISTS events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    mod TEXT,
+                    action TEXT NOT NULL,
+                    time TEXT NOT NULL,
+                    file_count INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_events_time ON events(time);
+            """)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+    def get_meta(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+            return row["value"] if row else None
+
+    def set_meta(self, key, value):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _record(self, mod_name, files, install_time, file_details):
+        details = file_details or {}
+        cur = self._conn
+        # 覆盖安装：先清理该语音包旧的文件行，再把本次文件名的所有权转移过来
+        cur.execute("DELETE FROM files WHERE owner = ?", (mod_name,))
+        names = list(dict.fromkeys(files))
+        for i in range(0, len(names), self._IN_CHUNK):
+            chunk = names[i:i + self._IN_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            cur.execute(f"UPDATE files SET active = 0 WHERE active = 1 AND name IN ({marks})", chunk)
+        cur.executemany(
+            "INSERT INTO files(name, owner, size, hash, mtime, method, active) VALUES (?, ?, ?, ?, ?, ?, 1)",
+            [
+                (
+                    name, mod_name,
+                    (details.get(name) or {}).get("size"),
+                    (details.get(name) or {}).get("hash"),
+                    (details.get(name) or {}).get("mtime"),
+                    (details.get(name) or {}).get("method"),
+                )
+                for name in names
+            ],
+        )
+        cur.execute("INSERT OR REPLACE INTO mods(name, install_time) VALUES (?, ?)", (mod_name, install_time))
+        return len(names)
+
+    def record_installation(self, mod_name, files, install_time, file_details=None):
+        with self._lock, self._conn:
+            count = self._record(mod_name, files, install_time, file_details)
+            self._conn.execute(
+                "INSERT INTO events(mod, action, time, file_count) VALUES (?, 'install', ?, ?)",
+                (mod_name, install_time, count),
+            )
+
+    def remove_mod(self, mod_name):
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT 1 FROM mods WHERE name = ?", (mod_name,)).fetchone()
+            if not row:
+                return
+            count = self._conn.execute("SELECT COUNT(*) FROM files WHERE owner = ?", (mod_name,)).fetchone()[0]
+            # 删除该语音包的文件行；被它覆盖过的旧所有者不会恢复所有权（与 JSON 后端一致）
+            self._conn.execute("DELETE FROM files WHERE owner = ?", (mod_name,))
+            self._conn.execute("DELETE FROM mods WHERE name = ?", (mod_name,))
+            self._conn.execute(
+                "INSERT INTO events(mod, action, time, file_count) VALUES (?, 'remove', ?, ?)",
+                (mod_name, datetime.now().isoformat(), count),
+            )
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files")
+            self._conn.execute("DELETE FROM mods")
+            self._conn.execute(
+                "INSERT INTO events(mod, action, time, file_count) VALUES (NULL, 'clear', ?, NULL)",
+                (datetime.now().isoformat(),),
+            )
+
+    def import_manifest(self, manifest):
+        """将 JSON 清单结构整体导入（迁移用）；按安装时间先后重放，保证文件所有权与 file_map 一致。"""
+        installed = manifest.get("installed_mods") or {}
+        file_map = manifest.get("file_map") or {}
+        ordered = sorted(installed.items(), key=lambda kv: str((kv[1] or {}).get("install_time") or ""))
+        with self._lock, self._conn:
+            for mod_name, info in ordered:
+                info = info or {}
+                self._record(mod_name, info.get("files") or [], info.get("install_time") or "", info.get("file_meta"))
+            # 以 file_map 为准校正所有权（其中已被移除的映射在此置为非活动）
+            self._conn.execute("UPDATE files SET active = 0")
+            self._conn.executemany(
+                "UPDATE files SET active = 1 WHERE name = ? AND owner = ?",
+                list(file_map.items()),
+            )
+
+    def conflicts(self, mod_name, files):
+        names = list(dict.fromkeys(files))
+        owners = {}
+        with self._lock:
+            for i in range(0, len(names), self._IN_CHUNK):
+                chunk = names[i:i + self._IN_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT name, owner FROM files WHERE active = 1 AND owner != ? AND name IN ({marks})",
+                    [mod_name] + chunk,
+                ).fetchall()
+                for row in rows:
+                    owners[row["name"]] = row["owner"]
+        # 保持与输入顺序一致（含重复文件名），与 JSON 后端的返回一致
+        return [
+            {"file": name, "existing_mod": owners[name], "new_mod": mod_name}
+            for name in files if name in owners
+        ]
+
+    def owned_files(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT name, owner, size, mtime, hash FROM files WHERE active = 1").fetchall()
+            return {
+                row["name"]: (row["owner"], {"size": row["size"], "mtime": row["mtime"], "hash": row["hash"]})
+                for row in rows
+            }
+
+    def apply_reconcile(self, drop, meta):
+        with self._lock, self._conn:
+            names = list(drop)
+            for i in range(0, len(names), self._IN_CHUNK):
+                chunk = names[i:i + self._IN_CHUNK]
+                marks = ",".join("?" * len(chunk))
+                self._conn.execute(f"DELETE FROM files WHERE active = 1 AND name IN ({marks})", chunk)
+            self._conn.executemany(
+                "UPDATE files SET size = ?, mtime = ?, hash = COALESCE(?, hash) WHERE active = 1 AND name = ?",
+                [(m.get("size"), m.get("mtime"), m.get("hash"), name) for name, m in meta.items()],
+            )
+            # 已无任何活动文件的语音包视为已卸载
+            self._conn.execute(
+                "DELETE FROM mods WHERE name NOT IN (SELECT DISTINCT owner FROM files WHERE active = 1)"
+            )
+            self._conn.execute(
+                "DELETE FROM files WHERE owner NOT IN (SELECT name FROM mods)"
+            )
+            self._conn.execute(
+                "INSERT INTO events(mod, action, time, file_count) VALUES (NULL, 'reconcile', ?, ?)",
+                (datetime.now().isoformat(), len(names) + len(meta)),
+            )
+
+    def list_mods(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT name FROM mods ORDER BY install_time").fetchall()
+            return [row["name"] for row in rows]
+
+
 class ManifestManager:
     """
     功能定位:
@@ -34,20 +262,30 @@ class ManifestManager:
 
     输入输出:
     - 输入: game_root（游戏根目录）。
-    - 输出: self.manifest（内存中的清单结构），以及对 .manifest.json 的读写。
-    - 外部资源/依赖: <game_root>/sound/mod/.manifest.json。
+    - 输出: self.manifest（内存中的清单结构），以及对 .manifest.json/.manifest.journal 的读写。
+    - 外部资源/依赖: <game_root>/sound/mod/.manifest.json、<game_root>/sound/mod/.manifest.journal、
+      <game_root>/sound/mod/.manifest.db（SQLite 后端）。
 
     实现逻辑:
-    - self.manifest 结构:
-      - installed_mods: dict[str, {"files": list[str], "install_time": str}]
+    - backend="json"（默认）时使用快照 + 追加日志；backend="sqlite" 时委托 _SqliteManifestStore，self.manifest 为 None。
+    - self.manifest 结构（JSON 后端）:
+      - installed_mods: dict[str, {"files": list[str], "install_time": str, "file_meta": dict}]
       - file_map: dict[str, str]，file_name -> mod_name
+      - journal_seq: int，快照已包含的最后一条日志序号（重放时跳过序号不大于它的日志行）
+    - 日志每行一个 JSON 对象: {"seq": int, "op": "record"|"remove", "mod": str, ...}。
 
     业务关联:
     - 上游: 安装/还原流程创建并调用该对象。
     - 下游: 冲突检测与安装记录依赖该对象提供的数据。
     """
+
+    # 日志压缩阈值：累计行数或日志体积任一达到即重写快照
+    COMPACT_EVERY_OPS = 64
+    COMPACT_JOURNAL_BYTES = 1024 * 1024
+    # 外部修改检测的最小间隔（秒）：间隔内的读取直接使用缓存快照
+    DISK_CHECK_INTERVAL = 2.0
     
-    def __init__(self, game_root):
+    def __init__(self, game_root, backend="json"):
         """
         功能定位:
         - 绑定游戏根目录并加载清单文件到内存。
@@ -55,14 +293,16 @@ class ManifestManager:
         输入输出:
         - 参数:
           - game_root: str | Path，游戏根目录路径。
+          - backend: str，"json" 或 "sqlite"。
         - 返回: None
         - 外部资源/依赖:
-          - 文件: <game_root>/sound/mod/.manifest.json（读取）
+          - 文件: <game_root>/sound/mod/.manifest.json、.manifest.journal、.manifest.db（读取）
 
         实现逻辑:
         - 1) 规范化 game_root 为 Path。
-        - 2) 生成 manifest_file 路径。
-        - 3) 调用 _load_manifest 读取清单内容。
+        - 2) 生成 manifest_file、journal_file 与 db_file 路径。
+        - 3) SQLite 后端：打开数据库并按需从 JSON 清单迁移；打开失败时回退到 JSON 后端。
+        - 4) JSON 后端：调用 _load_manifest 读取快照并重放日志。
 
         业务关联:
         - 上游: core_logic.validate_game_path 校验通过后初始化。
@@ -70,62 +310,368 @@ class ManifestManager:
         """
         self.game_root = Path(game_root)
         self.manifest_file = self.game_root / "sound" / "mod" / ".manifest.json"
+        self.journal_file = self.game_root / "sound" / "mod" / ".manifest.journal"
+        self.db_file = self.game_root / "sound" / "mod" / ".manifest.db"
+        self._lock = threading.RLock()
+        self._journal_ops = 0
+        self._store = None
+        self.manifest = None
+        self.backend = "json"
+        # 已安装列表快照缓存：(_version, tuple[str], frozenset[str])
+        self._version = 0
+        self._snapshot_cache = None
+        self._disk_sig = None
+        self._last_disk_check = 0.0
+        if backend == "sqlite":
+            try:
+                self._store = _SqliteManifestStore(self.db_file)
+                self.backend = "sqlite"
+                self._migrate_json_to_sqlite()
+                self._changed()
+                return
+            except Exception as e:
+                print(f"SQLite 清单初始化失败，回退到 JSON 清单: {e}")
+                if self._store:
+                    self._store.close()
+                self._store = None
         self.manifest = self._load_manifest()
+        self._changed()
+
+    def close(self):
+        """释放 SQLite 连接（JSON 后端无需释放）；切换游戏目录时由调用方调用。"""
+        if self._store:
+            self._store.close()
+
+    def _storage_sig(self):
+        sig = []
+        for path in self.storage_files():
+            try:
+                st = path.stat()
+                sig.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def _changed(self):
+        """本进程修改清单后调用：使快照缓存失效，并记录当前存储文件签名（避免把自身写入误判为外部修改）。"""
+        with self._lock:
+            self._version += 1
+            self._disk_sig = self._storage_sig()
+            self._last_disk_check = time.monotonic()
+
+    def _refresh_if_changed(self):
+        """
+        功能定位:
+        - 按间隔检查清单存储文件是否被外部修改，若修改则重新加载。
+
+        输入输出:
+        - 参数: 无
+        - 返回: None
+        - 外部资源/依赖: 存储文件的 stat 信息
+
+        实现逻辑:
+        - 1) 距上次检查不足 DISK_CHECK_INTERVAL 时直接返回。
+        - 2) 计算 (mtime_ns, size) 签名；与记录值一致则返回。
+        - 3) 不一致时：JSON 后端重新加载快照与日志；SQLite 后端仅使缓存失效（查询本身读取数据库）。
+
+        业务关联:
+        - 上游: snapshot。
+        - 下游: 用户手动编辑或其他进程写入清单后，前端展示能够跟上。
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_disk_check < self.DISK_CHECK_INTERVAL:
+                return
+            self._last_disk_check = now
+            sig = self._storage_sig()
+            if sig == self._disk_sig:
+                return
+            if not self._store:
+                self._journal_ops = 0
+                self.manifest = self._load_manifest()
+            self._changed()
+
+    def snapshot(self):
+        """
+        功能定位:
+        - 返回已安装语音包的只读快照，供 init_app_state 等高频读取方使用。
+
+        输入输出:
+        - 参数: 无
+        - 返回:
+          - dict，{"version": int, "installed_mods": tuple[str], "installed_set": frozenset[str]}。
+        - 外部资源/依赖: 无（缓存命中时）；必要时读取 self.manifest 或 SQLite mods 表。
+
+        实现逻辑:
+        - 1) 调用 _refresh_if_changed 处理外部修改。
+        - 2) 缓存版本与当前 _version 一致时直接返回缓存；否则重建并缓存。
+
+        业务关联:
+        - 上游: list_installed_mods/is_installed、core_logic.get_installed_mods。
+        - 下游: 前端已安装标记。
+        """
+        self._refresh_if_changed()
+        with self._lock:
+            cache = self._snapshot_cache
+            if cache is None or cache["version"] != self._version:
+                if self._store:
+                    names = tuple(self._store.list_mods())
+                else:
+                    names = tuple(self.manifest.get("installed_mods", {}).keys())
+                cache = {"version": self._version, "installed_mods": names, "installed_set": frozenset(names)}
+                self._snapshot_cache = cache
+            return cache
+
+    def is_installed(self, mod_name):
+        """O(1) 判断语音包是否在安装清单中。"""
+        return mod_name in self.snapshot()["installed_set"]
+
+    def _migrate_json_to_sqlite(self):
+        """
+        功能定位:
+        - 首次启用 SQLite 后端时，将已有 JSON 清单（快照 + 日志）导入数据库。
+
+        输入输出:
+        - 参数: 无
+        - 返回: None
+        - 外部资源/依赖:
+          - 文件: self.manifest_file、self.journal_file（读取后改名/删除）、self.db_file（写入）
+
+        实现逻辑:
+        - 1) 数据库 meta 已标记迁移完成则直接返回。
+        - 2) 存在 JSON 清单时加载并整体导入，然后将快照改名为 .manifest.json.migrated 留作备份、删除日志。
+        - 3) 写入迁移完成标记。
+
+        业务关联:
+        - 上游: __init__。
+        - 下游: 迁移后冲突检测与已安装列表由数据库提供，用户无感知。
+        """
+        if self._store.get_meta("migrated_from_json"):
+            return
+        if self.manifest_file.exists() or self.journal_file.exists():
+            data = self._load_manifest()
+            self._store.import_manifest(data)
+            try:
+                if self.manifest_file.exists():
+                    os.replace(self.manifest_file, self.manifest_file.with_name(self.manifest_file.name + ".migrated"))
+                if self.journal_file.exists():
+                    self.journal_file.unlink()
+            except Exception as e:
+                print(f"迁移后清理 JSON 清单失败: {e}")
+            print(f"已将 JSON 安装清单迁移到 SQLite: {len(data.get('installed_mods') or {})} 个语音包")
+        self._store.set_meta("migrated_from_json", datetime.now().isoformat())
+
+    def storage_files(self):
+        """返回清单自身占用的文件路径（还原清空 sound/mod 时需跳过，由 clear_manifest 负责处理）。"""
+        if self.backend == "sqlite":
+            return [self.db_file, self.db_file.with_name(self.db_file.name + "-wal"),
+                    self.db_file.with_name(self.db_file.name + "-shm")]
+        return [self.manifest_file, self.journal_file]
     
     def _load_manifest(self):
         """
         功能定位:
-        - 从 manifest_file 读取清单数据到内存。
+        - 从快照与追加日志恢复清单数据到内存。
 
         输入输出:
         - 参数: 无
         - 返回:
-          - dict，清单数据结构；读取失败时返回空结构。
+          - dict，清单数据结构；快照不存在或无法解析时以空结构为基础继续重放日志。
         - 外部资源/依赖:
-          - 文件: self.manifest_file（读取）
+          - 文件: self.manifest_file、self.journal_file（读取）
 
         实现逻辑:
-        - 1) 若文件存在则尝试 json.load。
-        - 2) 读取或解析失败时返回空清单结构。
+        - 1) 读取快照；快照通过原子替换写入，正常情况下不会出现半截内容。
+        - 2) 逐行解析日志：序号不大于快照 journal_seq 的行已包含在快照中，跳过；
+             无法解析的行（崩溃时写了一半）及其之后的内容视为未提交，停止重放。
+        - 3) 存在未提交内容时立即压缩，把日志修复为干净状态。
 
         业务关联:
         - 上游: __init__。
         - 下游: check_conflicts/record_installation/remove_mod_record 等方法使用该结构。
         """
+        manifest = _empty_manifest()
         if self.manifest_file.exists():
             try:
                 with open(self.manifest_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                return {"installed_mods": {}, "file_map": {}}
-        return {"installed_mods": {}, "file_map": {}}
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    manifest["installed_mods"] = data.get("installed_mods") or {}
+                    manifest["file_map"] = data.get("file_map") or {}
+                    manifest["journal_seq"] = int(data.get("journal_seq") or 0)
+            except Exception as e:
+                print(f"清单快照读取失败，将仅依据日志恢复: {e}")
+
+        torn = False
+        if self.journal_file.exists():
+            try:
+                with open(self.journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            entry = json.loads(line)
+                            seq = int(entry["seq"])
+                        except Exception:
+                            torn = True
+                            break
+                        if seq <= manifest["journal_seq"]:
+                            continue
+                        self._apply(manifest, entry)
+                        manifest["journal_seq"] = seq
+                        self._journal_ops += 1
+            except Exception as e:
+                print(f"清单日志读取失败: {e}")
+
+        if torn:
+            self.manifest = manifest
+            self._save_manifest()
+        return manifest
+
+    @staticmethod
+    def _apply(manifest, entry):
+        """
+        功能定位:
+        - 将一条变更（record/remove）应用到清单结构上；加载重放与运行时写入共用同一逻辑。
+
+        输入输出:
+        - 参数:
+          - manifest: dict，清单结构（原地修改）。
+          - entry: dict，日志条目。
+        - 返回: None
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - record: 写入 installed_mods[mod] 并把每个文件名的所有权指向 mod。
+        - remove: 仅在所有权仍指向 mod 时移除映射，然后删除 installed_mods[mod]。
+        - reconcile: 移除缺失文件的所有权（无剩余文件的语音包一并移除），并更新被修改文件的 size/mtime。
+
+        业务关联:
+        - 上游: _load_manifest、_commit。
+        - 下游: 内存中的 installed_mods/file_map。
+        """
+        op = entry.get("op")
+        mod_name = entry.get("mod")
+        if op == "record":
+            files = list(entry.get("files") or [])
+            manifest["installed_mods"][mod_name] = {
+                "files": files,
+                "install_time": entry.get("install_time", "")
+            }
+            if entry.get("file_meta"):
+                manifest["installed_mods"][mod_name]["file_meta"] = entry["file_meta"]
+            # 更新文件名所有权映射（file_name -> mod_name）
+            for file_name in files:
+                manifest["file_map"][file_name] = mod_name
+        elif op == "remove":
+            record = manifest["installed_mods"].pop(mod_name, None)
+            if record:
+                # 仅在所有权仍指向当前语音包时，移除 file_map 映射
+                for file_name in record.get("files", []):
+                    if manifest["file_map"].get(file_name) == mod_name:
+                        del manifest["file_map"][file_name]
+        elif op == "reconcile":
+            # 缺失文件：移除所有权及所属语音包中的记录；文件全部缺失的语音包视为已卸载
+            for file_name in entry.get("drop") or []:
+                owner = manifest["file_map"].pop(file_name, None)
+                record = manifest["installed_mods"].get(owner)
+                if not record:
+                    continue
+                record["files"] = [f for f in record.get("files", []) if f != file_name]
+                (record.get("file_meta") or {}).pop(file_name, None)
+                if not any(manifest["file_map"].get(f) == owner for f in record["files"]):
+                    manifest["installed_mods"].pop(owner, None)
+            # 被修改文件：以磁盘当前状态作为新的基线
+            for file_name, meta in (entry.get("meta") or {}).items():
+                record = manifest["installed_mods"].get(manifest["file_map"].get(file_name))
+                if record is not None:
+                    record.setdefault("file_meta", {}).setdefault(file_name, {}).update(meta)
+
+    def _commit(self, entry):
+        """
+        功能定位:
+        - 应用一条变更到内存清单，并以追加日志的方式持久化。
+
+        输入输出:
+        - 参数:
+          - entry: dict，不含 seq 的日志条目。
+        - 返回: None
+        - 外部资源/依赖:
+          - 文件: self.journal_file（追加写入 + fsync）
+
+        实现逻辑:
+        - 1) 分配递增序号并应用到内存。
+        - 2) 追加一行 JSON 并 fsync，保证返回时变更已落盘。
+        - 3) 达到压缩阈值时调用 _save_manifest 重写快照并清空日志。
+
+        业务关联:
+        - 上游: record_installation/remove_mod_record。
+        - 下游: 日志文件与快照文件。
+        """
+        with self._lock:
+            seq = int(self.manifest.get("journal_seq") or 0) + 1
+            entry = dict(entry, seq=seq)
+            self._apply(self.manifest, entry)
+            self.manifest["journal_seq"] = seq
+            try:
+                self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+                line = json.dumps(entry, ensure_ascii=False) + "\n"
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_ops += 1
+                journal_size = self.journal_file.stat().st_size
+            except Exception as e:
+                print(f"无法写入清单日志，改为直接保存快照: {e}")
+                self._save_manifest()
+                return
+
+            if self._journal_ops >= self.COMPACT_EVERY_OPS or journal_size >= self.COMPACT_JOURNAL_BYTES:
+                self._save_manifest()
     
     def _save_manifest(self):
         """
         功能定位:
-        - 将内存中的 self.manifest 持久化写入 manifest_file。
+        - 压缩：将内存中的 self.manifest 作为快照原子写入 manifest_file，并清空追加日志。
 
         输入输出:
         - 参数: 无
         - 返回: None
         - 外部资源/依赖:
           - 目录: self.manifest_file.parent（必要时创建）
-          - 文件: self.manifest_file（写入）
+          - 文件: <manifest_file>.tmp（写入后替换）、self.manifest_file、self.journal_file（清空）
 
         实现逻辑:
         - 1) 确保父目录存在。
-        - 2) 以 UTF-8 编码写入 JSON（缩进 2，保持中文可读）。
+        - 2) 以 UTF-8 编码写入临时文件（缩进 2，保持中文可读），flush + fsync 后 os.replace 原子替换快照。
+        - 3) 快照已包含 journal_seq 之前的全部变更，此时再清空日志；清空前崩溃也只会在重放时跳过旧行。
 
         业务关联:
-        - 上游: record_installation/remove_mod_record/clear_manifest。
+        - 上游: _commit 达到压缩阈值、_load_manifest 修复日志。
         - 下游: 为后续冲突检测与状态恢复提供落盘数据。
         """
-        try:
-            self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.manifest_file, 'w', encoding='utf-8') as f:
-                json.dump(self.manifest, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"无法保存清单文件: {e}")
+        with self._lock:
+            try:
+                self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.manifest, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.manifest_file)
+            except Exception as e:
+                print(f"无法保存清单文件: {e}")
+                return
+
+            try:
+                with open(self.journal_file, 'w', encoding='utf-8') as f:
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_ops = 0
+            except Exception as e:
+                print(f"无法清空清单日志: {e}")
     
     def check_conflicts(self, mod_name, files_to_install):
         """
@@ -144,19 +690,26 @@ class ManifestManager:
         - 外部资源/依赖: self.manifest（内存结构）
 
         实现逻辑:
-        - 1) 遍历 files_to_install。
-        - 2) 若 file_name 存在于 file_map 且 existing_mod != mod_name，则记录为冲突。
-        - 3) 返回冲突列表。
+        - 1) SQLite 后端委托带索引的批量查询。
+        - 2) JSON 后端先对 file_map 键集合与 files_to_install 求交集，无交集直接返回空列表。
+        - 3) 按 files_to_install 顺序输出交集中 existing_mod != mod_name 的冲突记录。
 
         业务关联:
         - 上游: main.py 在安装前调用以提示用户可能的覆盖关系。
         - 下游: 前端根据返回列表展示冲突明细并决定是否继续安装。
         """
-        conflicts = []
+        if self._store:
+            return self._store.conflicts(mod_name, files_to_install)
+
         file_map = self.manifest.get("file_map", {})
-        
+        # 先求与已占用文件名的交集，只对交集内的文件名构造冲突记录
+        taken = file_map.keys() & set(files_to_install)
+        if not taken:
+            return []
+
+        conflicts = []
         for file_name in files_to_install:
-            if file_name in file_map:
+            if file_name in taken:
                 existing_mod = file_map[file_name]
                 if existing_mod != mod_name:
                     conflicts.append({
@@ -166,7 +719,7 @@ class ManifestManager:
                     })
         return conflicts
     
-    def record_installation(self, mod_name, installed_files):
+    def record_installation(self, mod_name, installed_files, file_details=None):
         """
         功能定位:
         - 将某个语音包的安装结果写入清单（安装文件名列表与文件所有权映射）。
@@ -175,29 +728,36 @@ class ManifestManager:
         - 参数:
           - mod_name: str，语音包名称。
           - installed_files: list[str]，本次安装写入到 sound/mod 的目标文件名列表。
+          - file_details: dict[str, dict] | None，文件名 -> {size, mtime, hash, method}，可选。
         - 返回: None
         - 外部资源/依赖:
-          - 文件: self.manifest_file（写入）
+          - 文件: self.journal_file（追加写入）或 self.db_file（事务写入）
 
         实现逻辑:
-        - 1) 写入 installed_mods[mod_name]，包含 files 与 install_time。
-        - 2) 将 installed_files 中每个 file_name 写入 file_map[file_name]=mod_name。
-        - 3) 调用 _save_manifest 落盘保存。
+        - 1) SQLite 后端：单个事务写入 mods/files/events。
+        - 2) JSON 后端：构造 record 日志条目（files、install_time、file_meta），
+             由 _commit 写入 installed_mods[mod_name] 与 file_map[file_name]=mod_name，并追加到日志落盘。
 
         业务关联:
         - 上游: core_logic.install_from_library 在复制完成后调用。
         - 下游: 为后续冲突检测与还原清理提供依据。
         """
-        self.manifest["installed_mods"][mod_name] = {
-            "files": installed_files,
-            "install_time": datetime.now().isoformat()
+        install_time = datetime.now().isoformat()
+        if self._store:
+            self._store.record_installation(mod_name, list(installed_files), install_time, file_details)
+            self._changed()
+            return
+
+        entry = {
+            "op": "record",
+            "mod": mod_name,
+            "files": list(installed_files),
+            "install_time": install_time
         }
-        
-        # 更新文件名所有权映射（file_name -> mod_name）
-        for file_name in installed_files:
-            self.manifest["file_map"][file_name] = mod_name
-        
-        self._save_manifest()
+        if file_details:
+            entry["file_meta"] = {name: file_details[name] for name in installed_files if name in file_details}
+        self._commit(entry)
+        self._changed()
     
     def remove_mod_record(self, mod_name):
         """
@@ -209,50 +769,163 @@ class ManifestManager:
           - mod_name: str，目标语音包名称。
         - 返回: None
         - 外部资源/依赖:
-          - 文件: self.manifest_file（写入）
+          - 文件: self.journal_file（追加写入）
 
         实现逻辑:
-        - 1) 从 installed_mods 取出该语音包记录的 files 列表。
-        - 2) 对每个 file_name，仅当 file_map[file_name] 仍等于 mod_name 时才删除映射。
-        - 3) 删除 installed_mods[mod_name] 并落盘保存。
+        - 1) 语音包不在清单中时直接返回。
+        - 2) 由 _commit 应用 remove 条目：仅当 file_map[file_name] 仍等于 mod_name 时才删除映射，
+             随后删除 installed_mods[mod_name]，并追加到日志落盘。
 
         业务关联:
         - 上游: 卸载语音包或还原纯净流程。
         - 下游: 避免冲突检测仍引用已移除语音包的记录。
         """
+        if self._store:
+            self._store.remove_mod(mod_name)
+            self._changed()
+            return
         if mod_name in self.manifest["installed_mods"]:
-            files = self.manifest["installed_mods"][mod_name].get("files", [])
-            
-            # 仅在所有权仍指向当前语音包时，移除 file_map 映射
-            for file_name in files:
-                if self.manifest["file_map"].get(file_name) == mod_name:
-                    del self.manifest["file_map"][file_name]
-            
-            del self.manifest["installed_mods"][mod_name]
-            self._save_manifest()
+            self._commit({"op": "remove", "mod": mod_name})
+            self._changed()
             
     def clear_manifest(self):
         """
         功能定位:
-        - 清空内存中的清单结构，并尝试删除清单文件。
+        - 清空内存中的清单结构，并尝试删除清单快照与日志文件。
 
         输入输出:
         - 参数: 无
         - 返回: None
         - 外部资源/依赖:
-          - 文件: self.manifest_file（删除）
+          - 文件: self.manifest_file、self.journal_file（删除）
 
         实现逻辑:
         - 1) 重置 self.manifest 为初始空结构。
-        - 2) 若 manifest_file 存在则尝试删除。
+        - 2) 若快照或日志存在则尝试删除。
+        - 3) SQLite 后端：清空 mods/files 表并记录一条 clear 事件（历史保留）。
 
         业务关联:
         - 上游: core_logic.restore_game 还原纯净流程调用。
         - 下游: 后续安装将从空清单开始记录。
         """
-        self.manifest = {"installed_mods": {}, "file_map": {}}
-        if self.manifest_file.exists():
-            try:
-                self.manifest_file.unlink()
-            except:
-                pass
+        if self._store:
+            self._store.clear()
+            self._changed()
+            return
+        with self._lock:
+            self.manifest = _empty_manifest()
+            self._journal_ops = 0
+            for path in (self.manifest_file, self.journal_file):
+                if path.exists():
+                    try:
+                        path.unlink()
+                    except:
+                        pass
+        self._changed()
+
+    def list_installed_mods(self):
+        """
+        功能定位:
+        - 返回当前清单中已安装的语音包名称列表。
+
+        输入输出:
+        - 参数: 无
+        - 返回: list[str]
+        - 外部资源/依赖: snapshot 缓存
+
+        实现逻辑:
+        - 由 snapshot 缓存返回副本，未变化时不访问磁盘或数据库。
+
+        业务关联:
+        - 上游: core_logic.get_installed_mods。
+        - 下游: 前端已安装标记。
+        """
+        return list(self.snapshot()["installed_mods"])
+
+    def _owned_files(self):
+        """返回 {文件名: (所属语音包, 记录的 size/mtime/hash)}，仅包含当前仍归属某语音包的文件名。"""
+        if self._store:
+            return self._store.owned_files()
+        installed = self.manifest.get("installed_mods", {})
+        result = {}
+        for file_name, owner in self.manifest.get("file_map", {}).items():
+            meta = ((installed.get(owner) or {}).get("file_meta") or {}).get(file_name) or {}
+            result[file_name] = (owner, meta)
+        return result
+
+    def reconcile(self, repair=True):
+        """
+        功能定位:
+        - 比对 sound/mod 实际文件与安装清单，发现其他工具或游戏造成的增删改，并可修复清单。
+
+        输入输出:
+        - 参数:
+          - repair: bool，是否将结果写回清单。
+        - 返回:
+          - dict，{"orphaned": list[str], "missing": list[str], "modified": list[str], "checked": int, "elapsed_ms": float}
+            - orphaned: 磁盘上存在但清单中无所有者的文件
+            - missing: 清单中有所有者但磁盘上已不存在的文件
+            - modified: size/mtime 与清单记录不一致的文件
+        - 外部资源/依赖: <game_root>/sound/mod（os.scandir 单层遍历，不读取文件内容）
+
+        实现逻辑:
+        - 1) os.scandir 一次性取得 sound/mod 下文件的 size/mtime（Windows 上来自目录项，无需逐个 stat）；
+             跳过清单自身文件、写入临时文件、迁移到 SQLite 后保留的 .manifest.json.migrated 备份与目录。
+        - 2) 与 _owned_files 做集合差得到孤立与缺失；对交集比较已记录的 size/mtime。
+        - 3) 未记录 size/mtime 的旧清单条目：仅补齐基线，不计为被修改。
+        - 4) repair 时写入一条 reconcile 变更：缺失文件移除所有权，被修改/补齐基线的文件更新 size/mtime；
+             孤立文件来源未知，仅报告不认领。
+
+        业务关联:
+        - 上游: core_logic.validate_game_path 首次加载清单时（启动）调用。
+        - 下游: 冲突检测与已安装列表反映 sound/mod 的真实状态。
+        """
+        t0 = time.perf_counter()
+        mod_dir = self.manifest_file.parent
+        skip = {p.name for p in self.storage_files()}
+        skip.add(self.manifest_file.name + ".tmp")
+        skip.add(self.manifest_file.name + ".migrated")
+        on_disk = {}
+        try:
+            with os.scandir(mod_dir) as it:
+                for entry in it:
+                    if entry.name in skip or not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    on_disk[entry.name] = (st.st_size, st.st_mtime)
+        except FileNotFoundError:
+            pass
+
+        owned = self._owned_files()
+        orphaned = sorted(name for name in on_disk if name not in owned)
+        missing = sorted(name for name in owned if name not in on_disk)
+        modified = []
+        baseline = {}
+        for name, (owner, meta) in owned.items():
+            disk = on_disk.get(name)
+            if disk is None:
+                continue
+            size, mtime = disk
+            if meta.get("size") is None or meta.get("mtime") is None:
+                baseline[name] = {"size": size, "mtime": mtime}
+                continue
+            if meta["size"] == size and abs(float(meta["mtime"]) - mtime) < 1e-3:
+                continue
+            modified.append(name)
+            baseline[name] = {"size": size, "mtime": mtime}
+        modified.sort()
+
+        if repair and (missing or baseline):
+            if self._store:
+                self._store.apply_reconcile(missing, baseline)
+            else:
+                self._commit({"op": "reconcile", "drop": missing, "meta": baseline})
+            self._changed()
+
+        return {
+            "orphaned": orphaned,
+            "missing": missing,
+            "modified": modified,
+            "checked": len(on_disk),
+            "elapsed_ms": (time.perf_counter() - t0) * 1000.0,
+        }
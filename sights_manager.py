@@ -27,9 +27,24 @@
 import base64
 import os
 import shutil
-import zipfile
 from pathlib import Path
 
+from zip_extractor import ON_UNSAFE_RAISE, DiskSpaceError, ZipExtractor, allocated_size, check_disk_space
+
+# 炮镜包中禁止出现的可执行/脚本类扩展名
+BLOCKED_EXTENSIONS = {
+    ".exe",
+    ".dll",
+    ".bat",
+    ".cmd",
+    ".ps1",
+    ".vbs",
+    ".js",
+    ".jar",
+    ".msi",
+    ".com",
+}
+
 
 class SightsManager:
     """
@@ -63,6 +78,7 @@ class SightsManager:
         实现逻辑:
         - 若未提供 log_callback，则使用空函数作为默认实现。
         - 初始化用户路径与扫描缓存为 None。
+        - 创建 ZIP 解压引擎（炮镜策略：禁止 BLOCKED_EXTENSIONS，路径穿越直接报错，保留原始成员名）。
 
         业务关联:
         - 上游: main.py 创建管理器实例。
@@ -71,6 +87,12 @@ class SightsManager:
         self._log = log_callback or (lambda *_: None)
         self._usersights_path = None
         self._cache = None
+        self._zip_extractor = ZipExtractor(
+            self._log,
+            on_unsafe=ON_UNSAFE_RAISE,
+            blocked_ext=BLOCKED_EXTENSIONS,
+            decode_names=False,
+        )
 
     
     def set_usersights_path(self, path: str | Path):
@@ -411,9 +433,10 @@ class SightsManager:
           - 临时目录: <UserSights>/.__tmp_extract__<zip_stem>（写入并清理）
 
         实现逻辑:
-        - 1) 校验 UserSights 已设置且存在，校验 zip_path 合法。
-        - 2) 在临时目录中逐文件解压成员，并限制成员扩展名不属于 blocked_ext。
-        - 3) 校验解压目标路径必须位于临时目录内部，避免生成临时目录外的文件。
+        - 1) 校验 UserSights 已设置且存在，校验 zip_path 合法，并按未压缩大小做磁盘空间预检。
+        - 2) 通过 ZipExtractor 解压到临时目录（炮镜策略）：成员扩展名属于 BLOCKED_EXTENSIONS
+             或路径位于临时目录之外时，在写入任何文件前抛出 ValueError。
+        - 3) 成员名保持 zipfile 原始解码结果，不做多编码还原。
         - 4) 解压完成后统计临时目录顶层条目：
            - 若只有一个顶层目录，则使用该目录名作为最终目标目录名。
            - 否则使用 ZIP stem 作为最终目标目录名，并将顶层内容移动进去。
@@ -433,83 +456,24 @@ class SightsManager:
         usersights_dir = self._usersights_path
         usersights_dir.mkdir(parents=True, exist_ok=True)
 
-        blocked_ext = {
-            ".exe",
-            ".dll",
-            ".bat",
-            ".cmd",
-            ".ps1",
-            ".vbs",
-            ".js",
-            ".jar",
-            ".msi",
-            ".com",
-        }
+        # 磁盘空间预检：旧目录在解压完成后才被替换，因此不计入可用空间
+        try:
+            check_disk_space(usersights_dir, allocated_size(self._zip_extractor.uncompressed_sizes(zip_path)))
+        except DiskSpaceError:
+            raise
+        except Exception as e:
+            self._log(f"[WARN] 炮镜解压磁盘空间检查失败（已跳过）: {e}", "WARN")
 
         tmp_dir = usersights_dir / f".__tmp_extract__{zip_path.stem}"
         if tmp_dir.exists():
             shutil.rmtree(tmp_dir)
         tmp_dir.mkdir(parents=True, exist_ok=True)
 
-        def _is_within(base_dir: Path, target: Path) -> bool:
-            """
-            功能定位:
-            - 判断目标路径是否位于指定基准目录内部（含目录自身）。
-
-            输入输出:
-            - 参数:
-              - base_dir: Path，基准目录。
-              - target: Path，目标路径。
-            - 返回:
-              - bool，位于基准目录内返回 True。
-            - 外部资源/依赖: 路径解析
-
-            实现逻辑:
-            - resolve 后比较前缀关系。
-
-            业务关联:
-            - 上游: import_sights_zip 解压成员写入前调用。
-            - 下游: 限制临时解压写入范围。
-            """
-            try:
-                base = base_dir.resolve()
-                t = target.resolve()
-                return base == t or str(t).startswith(str(base) + os.sep)
-            except Exception:
-                return False
-
         try:
             if progress_callback:
                 progress_callback(1, f"准备解压到 UserSights: {zip_path.name}")
 
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                members = [m for m in zf.infolist() if not m.is_dir()]
-                total = max(len(members), 1)
-                extracted = 0
-
-                for m in members:
-                    filename = m.filename
-                    if not filename or "__MACOSX" in filename or "desktop.ini" in filename.lower():
-                        continue
-                    if filename.endswith("/"):
-                        continue
-
-                    ext = Path(filename).suffix.lower()
-                    if ext in blocked_ext:
-                        raise ValueError(f"检测到不允许的文件类型: {filename}")
-
-                    target_path = (tmp_dir / filename)
-                    if not _is_within(tmp_dir, target_path):
-                        raise ValueError(f"压缩包路径不安全: {filename}")
-
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    with zf.open(m, "r") as src, open(target_path, "wb") as dst:
-                        shutil.copyfileobj(src, dst, length=1024 * 1024)
-
-                    extracted += 1
-                    if progress_callback:
-                        pct = 2 + int((extracted / total) * 90)
-                        progress_callback(pct, f"解压中: {Path(filename).name}")
+            self._zip_extractor.extract(zip_path, tmp_dir, progress_callback=progress_callback, base_progress=2, share_progress=90)
 
             top_level = [
                 p
@@ -31,6 +31,11 @@ import zipfile
 import base64
 from pathlib import Path
 
+from zip_extractor import BlockedMemberError, DiskSpaceError, ZipExtractor, allocated_size, check_disk_space, tree_size
+
+# 涂装包仅允许的文件扩展名
+ALLOWED_EXTENSIONS = {'.dds', '.blk', '.tga'}
+
 
 class SkinsManager:
     """
@@ -63,6 +68,7 @@ class SkinsManager:
         实现逻辑:
         - 若未提供 log_callback，则使用空函数作为默认实现。
         - 初始化扫描缓存为 None。
+        - 创建 ZIP 解压引擎（涂装策略：仅允许 ALLOWED_EXTENSIONS，路径穿越成员跳过）。
 
         业务关联:
         - 上游: main.py 创建管理器实例。
@@ -70,6 +76,7 @@ class SkinsManager:
         """
         self._log = log_callback or (lambda *_args, **_kwargs: None)
         self._cache = None
+        self._zip_extractor = ZipExtractor(self._log, allowed_ext=ALLOWED_EXTENSIONS)
 
 
     def get_userskins_dir(self, game_path: str | Path) -> Path:
@@ -186,7 +193,7 @@ class SkinsManager:
         实现逻辑:
         - 1) 校验 ZIP 文件存在与扩展名。
         - 2) 遍历 ZIP 成员，校验仅包含允许扩展名（.dds/.blk/.tga）。
-        - 3) 创建临时解压目录并执行安全解压（含路径边界校验）。
+        - 3) 按未压缩大小做磁盘空间预检（覆盖导入时计入将删除的旧目录），创建临时解压目录并通过 ZipExtractor 执行安全解压（含路径边界校验）。
         - 4) 将解压内容整理到目标目录：若只有一个顶层文件夹则合并其内容，否则保持多项结构。
         - 5) 清理临时目录，失效扫描缓存。
 
@@ -198,22 +205,15 @@ class SkinsManager:
         if not zip_path.exists() or zip_path.suffix.lower() != ".zip":
             raise ValueError("请选择有效的 .zip 文件")
 
-        # 仅允许导入涂装相关文件扩展名
-        ALLOWED_EXTENSIONS = {'.dds', '.blk', '.tga'}
+        # 仅允许导入涂装相关文件扩展名（解压计划阶段校验，不写入任何文件）
+        userskins_dir = self.get_userskins_dir(game_path)
         invalid_files = []
-        
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            for member in zf.infolist():
-                if member.is_dir():
-                    continue
-                filename = member.filename
-                if '__MACOSX' in filename or 'desktop.ini' in filename.lower():
-                    continue
-                
-                ext = Path(filename).suffix.lower()
-                if ext and ext not in ALLOWED_EXTENSIONS:
-                    invalid_files.append(filename)
-        
+        try:
+            with zipfile.ZipFile(zip_path, 'r') as zf:
+                self._zip_extractor.plan(zf, userskins_dir)
+        except BlockedMemberError as e:
+            invalid_files = e.members
+
         if invalid_files:
             file_list = '\n'.join(f'  • {f}' for f in invalid_files[:10])
             if len(invalid_files) > 10:
@@ -229,7 +229,6 @@ class SkinsManager:
                 f"💡 提示：请检查压缩包内容，确保只包含涂装相关文件。"
             )
 
-        userskins_dir = self.get_userskins_dir(game_path)
         userskins_dir.mkdir(parents=True, exist_ok=True)
 
         target_name = zip_path.stem
@@ -237,9 +236,10 @@ class SkinsManager:
         if target_dir.exists():
             if not overwrite:
                 raise FileExistsError(f"已存在同名涂装文件夹: {target_name}")
+            self._check_disk_space(zip_path, userskins_dir, replaced_dir=target_dir)
             shutil.rmtree(target_dir)
-
-        self._check_disk_space(zip_path, userskins_dir)
+        else:
+            self._check_disk_space(zip_path, userskins_dir)
 
         tmp_dir = userskins_dir / f".__tmp_extract__{target_name}"
         if tmp_dir.exists():
@@ -250,7 +250,7 @@ class SkinsManager:
             if progress_callback:
                 progress_callback(1, f"准备解压到 UserSkins: {zip_path.name}")
 
-            self._extract_zip_safely(zip_path, tmp_dir, progress_callback=progress_callback, base_progress=2, share_progress=85)
+            self._zip_extractor.extract(zip_path, tmp_dir, progress_callback=progress_callback, base_progress=2, share_progress=85)
 
             top_level = [p for p in tmp_dir.iterdir() if p.name not in ("__MACOSX",) and p.name != "desktop.ini"]
             if len(top_level) == 1 and top_level[0].is_dir():
@@ -502,159 +502,36 @@ class SkinsManager:
         except Exception:
             return ""
 
-    def _check_disk_space(self, zip_path: Path, target_dir: Path):
+    def _check_disk_space(self, zip_path: Path, target_dir: Path, replaced_dir: Path | None = None):
         """
         功能定位:
-        - 基于 ZIP 文件大小估算解压所需空间，并与目标盘剩余空间进行比较。
+        - 基于 ZIP 中央目录记录的未压缩大小，校验目标盘剩余空间是否足够。
 
         输入输出:
         - 参数:
           - zip_path: Path，ZIP 文件路径。
-          - target_dir: Path，目标目录（用于确定盘符）。
+          - target_dir: Path，目标目录（用于确定所在磁盘）。
+          - replaced_dir: Path | None，覆盖导入时将在解压前删除的旧涂装目录（其占用空间计为可用）。
         - 返回: None（空间不足时抛出异常）
-        - 外部资源/依赖: shutil.disk_usage
+        - 外部资源/依赖: zip_extractor.check_disk_space
 
         实现逻辑:
-        - 以压缩包大小估算解压后体积，并乘以安全系数作为 required。
-        - 若 free < required 则抛出“磁盘空间不足”异常；其他异常写日志并继续。
+        - required 为各文件未压缩大小按分配单元取整后的总和；freed 为 replaced_dir 的占用。
+        - 空间不足时抛出 DiskSpaceError（“磁盘空间不足”）；其他异常写日志并继续。
 
         业务关联:
         - 上游: import_skin_zip。
         - 下游: 降低导入过程中磁盘空间不足导致的失败概率。
         """
         try:
-            zip_size = zip_path.stat().st_size
-            estimated = zip_size * 3
-            required = estimated * 2
-
-            drive = Path(target_dir).anchor
-            if not drive:
-                drive = str(target_dir)
-
-            total, used, free = shutil.disk_usage(drive)
-            if free < required:
-                free_mb = free / (1024 * 1024)
-                req_mb = required / (1024 * 1024)
-                raise Exception(f"磁盘空间不足 (可用 {free_mb:.0f}MB, 需要 {req_mb:.0f}MB)")
+            required = allocated_size(self._zip_extractor.uncompressed_sizes(zip_path))
+            freed = tree_size(replaced_dir) if replaced_dir is not None else 0
+            check_disk_space(target_dir, required, freed=freed)
+        except DiskSpaceError:
+            raise
         except Exception as e:
-            if "磁盘空间不足" in str(e):
-                raise
             self._log(f"[WARN] 涂装解压磁盘空间检查失败（已跳过）: {e}", "WARN")
 
-    def _extract_zip_safely(self, zip_path: Path, target_dir: Path, progress_callback=None, base_progress=0, share_progress=100):
-        """
-        功能定位:
-        - 将 ZIP 内容解压到临时目录，并执行路径边界校验与进度回调更新。
-
-        输入输出:
-        - 参数:
-          - zip_path: Path，ZIP 文件路径。
-          - target_dir: Path，临时解压目录。
-          - progress_callback: Callable[[int, str], None] | None，进度回调。
-          - base_progress/share_progress: 进度区间参数。
-        - 返回: None
-        - 外部资源/依赖: zipfile、文件系统写入
-
-        实现逻辑:
-        - 1) 遍历成员列表并按节流策略更新 progress_callback。
-        - 2) 对每个成员执行 resolve 后的“必须位于 target_root 内部”校验。
-        - 3) 对文件成员按块写入到目标路径。
-
-        业务关联:
-        - 上游: import_skin_zip。
-        - 下游: 生成临时目录结构，后续再整理到最终涂装目录。
-        """
-        import time
-
-        target_root = Path(target_dir).resolve()
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            file_list = zf.infolist()
-            total_files = len(file_list)
-            last_update = 0.0
-            extracted_bytes = 0
-            total_bytes = 0
-
-            if total_files > 0:
-                for m in file_list:
-                    if m.is_dir():
-                        continue
-                    name = m.filename
-                    if "__MACOSX" in name or "desktop.ini" in name:
-                        continue
-                    try:
-                        total_bytes += int(getattr(m, "file_size", 0) or 0)
-                    except Exception:
-                        pass
-
-            for idx, member in enumerate(file_list):
-                if idx % 50 == 0:
-                    time.sleep(0.001)
-
-                try:
-                    filename = member.filename.encode("cp437").decode("utf-8")
-                except Exception:
-                    try:
-                        filename = member.filename.encode("cp437").decode("gbk")
-                    except Exception:
-                        filename = member.filename
-
-                if "__MACOSX" in filename or "desktop.ini" in filename:
-                    continue
-
-                now = time.monotonic()
-                should_push = (idx == 0) or (idx % 10 == 0) or (idx == total_files - 1)
-                if progress_callback and total_files > 0 and should_push and (now - last_update) >= 0.05:
-                    ratio = idx / total_files
-                    current_percent = base_progress + ratio * share_progress
-                    fname = filename
-                    if len(fname) > 25:
-                        fname = "..." + fname[-25:]
-                    try:
-                        progress_callback(int(current_percent), f"解压中: {fname}")
-                    except Exception:
-                        pass
-                    last_update = now
-
-                full_target_path = (target_dir / filename).resolve()
-                try:
-                    is_inside = os.path.commonpath([str(full_target_path), str(target_root)]) == str(target_root)
-                except Exception:
-                    is_inside = False
-                if not is_inside:
-                    self._log(f"[WARN] 拦截恶意路径穿越文件: {filename}", "WARN")
-                    continue
-
-                target_path = target_dir / filename
-                if member.is_dir():
-                    target_path.mkdir(parents=True, exist_ok=True)
-                    continue
-
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                with zf.open(member) as source, open(target_path, "wb") as target:
-                    while True:
-                        chunk = source.read(8192)
-                        if not chunk:
-                            break
-                        target.write(chunk)
-                        if total_bytes > 0:
-                            extracted_bytes += len(chunk)
-
-                        now = time.monotonic()
-                        if progress_callback and total_files > 0 and (now - last_update) >= 0.2:
-                            if total_bytes > 0:
-                                ratio = extracted_bytes / total_bytes
-                            else:
-                                ratio = idx / total_files
-                            current_percent = base_progress + ratio * share_progress
-                            fname = filename
-                            if len(fname) > 25:
-                                fname = "..." + fname[-25:]
-                            try:
-                                progress_callback(int(current_percent), f"解压中: {fname}")
-                            except Exception:
-                                pass
-                            last_update = now
-
     def _move_tree(self, src: Path, dst: Path):
         """
         功能定位:
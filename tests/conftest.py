@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+"""测试公共配置：将仓库根目录加入导入路径，使测试可直接导入各模块。"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""LibraryManager 测试：导出与重新导入、冷存储归档与恢复。"""
+import json
+import zipfile
+
+import pytest
+
+from library_manager import LibraryManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return _make_manager(tmp_path / "library")
+
+
+def _make_manager(library_dir):
+    """创建使用临时语音包库目录的 LibraryManager（索引文件同样放在临时目录）。"""
+    mgr = LibraryManager(lambda *_args, **_kwargs: None)
+    library_dir.mkdir(parents=True, exist_ok=True)
+    mgr.library_dir = library_dir
+    mgr.index.library_dir = library_dir
+    mgr.index.index_file = library_dir / mgr.index.index_file.name
+    return mgr
+
+
+def _make_mod(library_dir, name, info=None):
+    """在语音包库中创建一个语音包目录，返回 {相对路径: 内容}。"""
+    files = {
+        "sound/mod/aimer_ground.bank": bytes(range(256)) * 40,
+        "sound/mod/aimer_ground.assets.bank": b"assets" * 500,
+        "sound/mod/aimer_radio.bank": b"\x00radio" * 300,
+    }
+    mod_dir = library_dir / name
+    for rel, data in files.items():
+        path = mod_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    if info is not None:
+        # 与导出时规范化的格式一致（UTF-8、缩进 2），导出内容与目录逐字节相同
+        (mod_dir / "info.json").write_text(json.dumps(info, ensure_ascii=False, indent=2), encoding="utf-8")
+    return files
+
+
+def _read_tree(root):
+    return {
+        p.relative_to(root).as_posix(): p.read_bytes()
+        for p in root.rglob("*")
+        if p.is_file() and not p.name.startswith(".")
+    }
+
+
+def test_export_and_reimport_round_trip(manager, tmp_path):
+    info = {"title": "测试语音包", "author": "作者", "custom": [1, 2]}
+    files = _make_mod(manager.library_dir, "Pack")
+    (manager.library_dir / "Pack" / "info.json").write_text(
+        json.dumps(info, ensure_ascii=False), encoding="utf-8-sig"
+    )
+    manager.index.refresh()
+
+    (tmp_path / "out").mkdir()
+    result = manager.export_mod("Pack", tmp_path / "out")
+    archive = tmp_path / "out" / "Pack.zip"
+    assert result["path"] == str(archive)
+    with zipfile.ZipFile(archive) as zf:
+        methods = {m.filename: m.compress_type for m in zf.infolist()}
+        exported_info = json.loads(zf.read("info.json").decode("utf-8"))
+    assert exported_info == info
+    assert methods["sound/mod/aimer_ground.bank"] == zipfile.ZIP_STORED
+    assert methods["info.json"] == zipfile.ZIP_DEFLATED
+
+    other = _make_manager(tmp_path / "other")
+    other.unzip_single_zip(archive)
+    restored = _read_tree(other.library_dir / "Pack")
+    assert {k: v for k, v in restored.items() if k != "info.json"} == files
+    assert json.loads(restored["info.json"].decode("utf-8")) == info
+
+
+def test_export_writes_default_info(manager, tmp_path):
+    _make_mod(manager.library_dir, "Bare")
+    manager.export_mod("Bare", tmp_path / "Bare.zip")
+    with zipfile.ZipFile(tmp_path / "Bare.zip") as zf:
+        info = json.loads(zf.read("info.json").decode("utf-8"))
+    assert info["title"] == "Bare"
+
+
+def test_reimport_of_export_is_duplicate(manager, tmp_path):
+    _make_mod(manager.library_dir, "Pack", info={"title": "Pack"})
+    manager.index.refresh()
+    manager.export_mod("Pack", tmp_path / "Copy.zip")
+
+    manager.unzip_single_zip(tmp_path / "Copy.zip")
+    assert not (manager.library_dir / "Copy").exists()
+
+
+def test_freeze_and_thaw_round_trip(manager):
+    files = _make_mod(manager.library_dir, "Cold", info={"title": "冷存储"})
+    manager.index.refresh()
+    before = _read_tree(manager.library_dir / "Cold")
+
+    result = manager.freeze_mod("Cold")
+    assert not (manager.library_dir / "Cold").exists()
+    assert manager.is_cold("Cold")
+    assert result["archive"] == str(manager.cold_archive_path("Cold"))
+    assert manager.get_mod_details("Cold")["title"] == "冷存储"
+
+    manager.thaw_mod("Cold")
+    assert not manager.is_cold("Cold")
+    assert not manager.cold_archive_path("Cold").exists()
+    after = _read_tree(manager.library_dir / "Cold")
+    assert after == before
+    assert all(after[rel] == data for rel, data in files.items())
+
+
+def test_cold_pack_blocks_reimport(manager, tmp_path):
+    _make_mod(manager.library_dir, "Cold", info={"title": "Cold"})
+    manager.index.refresh()
+    manager.export_mod("Cold", tmp_path / "Cold.zip")
+    manager.export_mod("Cold", tmp_path / "Renamed.zip")
+    manager.freeze_mod("Cold")
+
+    manager.unzip_single_zip(tmp_path / "Cold.zip")
+    manager.unzip_single_zip(tmp_path / "Renamed.zip")
+    assert not (manager.library_dir / "Cold").exists()
+    assert not (manager.library_dir / "Renamed").exists()
+    assert manager.is_cold("Cold")
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""ZipExtractor 测试：成员名编码检测与断点续传。"""
+import zipfile
+
+from zip_extractor import EXTRACT_JOURNAL_NAME, ExtractJournal, ZipExtractor, decode_zip_names
+
+
+class _LegacyZipInfo(zipfile.ZipInfo):
+    """模拟旧版压缩工具：成员名按本地代码页写入且不设置 UTF-8 标志。"""
+
+    codec = "gbk"
+
+    def _encodeFilenameFlags(self):
+        return self.filename.encode(self.codec), self.flag_bits & ~0x800
+
+
+def _write_legacy_zip(path, names, codec):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name in names:
+            info = _LegacyZipInfo(name)
+            info.codec = codec
+            zf.writestr(info, name.encode("utf-8"))
+
+
+def _write_zip(path, members):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+GBK_NAMES = ["语音包/陆战语音/说明.txt", "语音包/无线电/封面.png", "简体中文测试/文件.bank"]
+BIG5_NAMES = ["語音包/陸戰語音/說明.txt", "語音包/無線電/封面.png", "繁體中文測試/檔案.bank"]
+
+
+def test_detects_gbk_names(tmp_path):
+    archive = tmp_path / "gbk.zip"
+    _write_legacy_zip(archive, GBK_NAMES, "gbk")
+    extractor = ZipExtractor()
+    with zipfile.ZipFile(archive) as zf:
+        codec, names = decode_zip_names(zf.infolist())
+        assert codec == "gbk"
+        assert names == GBK_NAMES
+        assert extractor.member_names(zf) == GBK_NAMES
+
+
+def test_detects_big5_names(tmp_path):
+    archive = tmp_path / "big5.zip"
+    _write_legacy_zip(archive, BIG5_NAMES, "big5")
+    with zipfile.ZipFile(archive) as zf:
+        codec, names = decode_zip_names(zf.infolist())
+    assert codec == "cp950"
+    assert names == BIG5_NAMES
+
+
+def test_utf8_names_are_kept(tmp_path):
+    archive = tmp_path / "utf8.zip"
+    _write_zip(archive, {"中文/utf8.bank": b"1"})
+    extractor = ZipExtractor()
+    with zipfile.ZipFile(archive) as zf:
+        assert extractor.member_names(zf) == ["中文/utf8.bank"]
+
+
+def test_name_codepage_matches_detection(tmp_path):
+    archive = tmp_path / "gbk.zip"
+    _write_legacy_zip(archive, GBK_NAMES, "gbk")
+    with zipfile.ZipFile(archive) as zf:
+        assert ZipExtractor().name_codepage(zf) == 936
+        assert ZipExtractor(decode_names=False).name_codepage(zf) is None
+
+
+def test_extract_writes_decoded_names(tmp_path):
+    archive = tmp_path / "gbk.zip"
+    _write_legacy_zip(archive, GBK_NAMES, "gbk")
+    target = tmp_path / "out"
+    ZipExtractor().extract(archive, target)
+    for name in GBK_NAMES:
+        assert (target / name).read_bytes() == name.encode("utf-8")
+
+
+def test_resume_skips_verified_members(tmp_path):
+    members = {f"sound/{i:02d}.bank": bytes([i]) * (1000 + i) for i in range(6)}
+    archive = tmp_path / "pack.zip"
+    _write_zip(archive, members)
+    target = tmp_path / "out"
+    extractor = ZipExtractor()
+
+    first = extractor.extract(archive, target, threads=1, resume=True)
+    assert first["files"] == len(members)
+    assert ExtractJournal.exists(target)
+
+    # 模拟中断：一个成员未写入，一个成员写了一半（大小不符），一个成员内容损坏（大小相同）
+    (target / "sound/00.bank").unlink()
+    (target / "sound/01.bank").write_bytes(b"\x01" * 10)
+    (target / "sound/02.bank").write_bytes(b"\xff" * len(members["sound/02.bank"]))
+
+    second = extractor.extract(archive, target, threads=1, resume=True)
+    assert second["resumed"] == len(members) - 3
+    assert second["files"] == 3
+    for name, data in members.items():
+        assert (target / name).read_bytes() == data
+
+
+def test_resume_restarts_for_other_archive(tmp_path):
+    target = tmp_path / "out"
+    first_archive = tmp_path / "a.zip"
+    _write_zip(first_archive, {"a.bank": b"a" * 100})
+    ZipExtractor().extract(first_archive, target, resume=True)
+
+    other_archive = tmp_path / "b.zip"
+    _write_zip(other_archive, {"a.bank": b"b" * 100})
+    result = ZipExtractor().extract(other_archive, target, resume=True)
+    assert result["resumed"] == 0
+    assert (target / "a.bank").read_bytes() == b"b" * 100
+    header, done = ExtractJournal(target).load()
+    assert header["archive"] == "b.zip"
+    assert set(done) == {"a.bank"}
+
+
+def test_journal_ignores_torn_last_line(tmp_path):
+    archive = tmp_path / "pack.zip"
+    _write_zip(archive, {"a.bank": b"a" * 100, "b.bank": b"b" * 100})
+    target = tmp_path / "out"
+    ZipExtractor().extract(archive, target, threads=1, resume=True)
+    journal_path = target / EXTRACT_JOURNAL_NAME
+    lines = journal_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    journal_path.write_text("".join(lines[:-1]) + lines[-1][: len(lines[-1]) // 2], encoding="utf-8")
+
+    result = ZipExtractor().extract(archive, target, threads=1, resume=True)
+    assert result["resumed"] == 1
+    assert result["files"] == 1
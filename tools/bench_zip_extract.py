@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+ZIP 解压基准脚本：对比旧版逐成员 8KB 复制与共享解压引擎 ZipExtractor 在不同读块/线程配置下的吞吐。
+
+用法:
+    python tools/bench_zip_extract.py [--size-mb 256] [--files 400] [--repeat 3] [--zip 已有压缩包路径]
+
+未指定 --zip 时在临时目录生成合成压缩包：少量大文件 + 大量小文件，内容为半可压缩数据（接近 .bank 音频）。
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# 从仓库根目录导入共享解压引擎
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from zip_extractor import ZipExtractor  # noqa: E402
+
+
+def make_synthetic_zip(zip_path, size_mb, file_count):
+    """生成合成压缩包：约 80% 体积集中在 1/20 的文件中。"""
+    total = size_mb * 1024 * 1024
+    big_count = max(1, file_count // 20)
+    small_count = max(0, file_count - big_count)
+    big_size = int(total * 0.8) // big_count
+    small_size = int(total * 0.2) // max(1, small_count)
+    block = os.urandom(64 * 1024)
+
+    def _payload(size):
+        # 一半随机一半重复，压缩率与音频资源相近
+        out = bytearray()
+        while len(out) < size:
+            out += block[: 32 * 1024] + b"\0" * (32 * 1024)
+        return bytes(out[:size])
+
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for i in range(big_count):
+            zf.writestr(f"语音包/sound/big_{i:03d}.bank", _payload(big_size))
+        for i in range(small_count):
+            zf.writestr(f"语音包/sound/small/{i // 100:02d}/small_{i:05d}.bank", _payload(small_size))
+
+
+def legacy_extract(zip_path, target_dir):
+    """旧实现：逐成员 resolve 校验、8KB 读块、每 50 个成员 sleep(0.001)。"""
+    target_root = Path(target_dir).resolve()
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        for idx, member in enumerate(zf.infolist()):
+            if idx % 50 == 0:
+                time.sleep(0.001)
+            full = (Path(target_dir) / member.filename).resolve()
+            if os.path.commonpath([str(full), str(target_root)]) != str(target_root):
+                continue
+            target_path = Path(target_dir) / member.filename
+            if member.is_dir():
+                target_path.mkdir(parents=True, exist_ok=True)
+                continue
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(member) as src, open(target_path, "wb") as dst:
+                while True:
+                    chunk = src.read(8192)
+                    if not chunk:
+                        break
+                    dst.write(chunk)
+
+
+def run_case(label, func, zip_path, work_dir, repeat, total_bytes):
+    best = None
+    for _ in range(repeat):
+        target = Path(work_dir) / "out"
+        if target.exists():
+            shutil.rmtree(target)
+        target.mkdir(parents=True)
+        t0 = time.perf_counter()
+        func(zip_path, target)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    mbps = total_bytes / (1024 * 1024) / best if best else 0.0
+    print(f"{label:<28} {best:8.3f}s  {mbps:8.1f} MB/s")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ZIP 解压基准")
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--files", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--zip", default=None)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="aimerwt_bench_")
+    try:
+        if args.zip:
+            zip_path = Path(args.zip)
+        else:
+            zip_path = Path(work_dir) / "synthetic.zip"
+            print(f"生成合成压缩包: {args.size_mb}MB / {args.files} 个文件 ...")
+            make_synthetic_zip(zip_path, args.size_mb, args.files)
+
+        with zipfile.ZipFile(zip_path) as zf:
+            total_bytes = sum(m.file_size for m in zf.infolist())
+        print(f"压缩包: {zip_path.name}  未压缩 {total_bytes / 1024 / 1024:.1f}MB  CPU {os.cpu_count()}\n")
+
+        cases = [
+            ("旧实现 (8KB, sleep)", legacy_extract),
+            ("引擎 64KB 单线程", lambda z, t: ZipExtractor(chunk_size=64 * 1024).extract(z, t, threads=1)),
+            ("引擎 1MB 单线程", lambda z, t: ZipExtractor().extract(z, t, threads=1)),
+            ("引擎 1MB 2 线程", lambda z, t: ZipExtractor(parallel_min_bytes=0).extract(z, t, threads=2)),
+            ("引擎 1MB 自动线程", lambda z, t: ZipExtractor(parallel_min_bytes=0).extract(z, t)),
+        ]
+        for label, func in cases:
+            run_case(label, func, zip_path, work_dir, args.repeat, total_bytes)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
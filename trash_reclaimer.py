@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+回收站清理模块：以“先重命名、后台删除”的方式快速清空目录。
+
+功能定位:
+- 将待删除的文件/目录通过 os.rename 移入同一卷上的回收目录，使用户可见的清空操作近似 O(1) 完成。
+- 在后台线程中并行删除回收目录中的内容；回收目录落盘保存，应用重启后可继续清理。
+
+输入输出:
+- 输入: 待删除的路径列表、回收目录根路径、日志回调、删除函数。
+- 输出: 移入回收站的结果统计；后台删除通过日志回调输出汇总。
+- 外部资源/依赖:
+  - 目录: <trash_root>/<批次目录>（创建/删除）
+  - 系统能力: os.rename（同卷原子重命名）、concurrent.futures 线程池
+
+实现逻辑:
+- 1) move_to_trash 为本次操作创建批次目录，逐项 rename 进入批次目录；rename 失败的条目交由调用方处理。
+- 2) reclaim_async 启动后台线程，遍历回收目录下所有批次，使用线程池并行删除其中的条目，最后移除空批次目录。
+- 3) resume 在启动或校验路径时调用：回收目录非空即继续清理上次未完成的批次。
+
+业务关联:
+- 上游: core_logic.CoreService.restore_game（还原纯净模式）。
+- 下游: 游戏目录 sound 下的回收目录内容被最终删除。
+"""
+import os
+import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 回收目录名称：位于 sound/mod 同级目录，保证与 sound/mod 处于同一卷
+TRASH_DIR_NAME = ".aimerwt_trash"
+
+
+def remove_path(path_obj):
+    """
+    功能定位:
+    - 删除文件或目录（包含只读文件的处理）。
+
+    输入输出:
+    - 参数:
+      - path_obj: str | Path，目标路径。
+    - 返回: None
+    - 外部资源/依赖: 文件系统、stat（处理只读属性）
+
+    实现逻辑:
+    - 1) 若为文件/符号链接，优先 unlink；PermissionError 时尝试 chmod 可写后再删。
+    - 2) 若为目录，使用 shutil.rmtree；onerror 回调中尝试 chmod 可写后重试。
+    - 3) 删除失败时抛出异常给调用方处理。
+
+    业务关联:
+    - 上游: TrashReclaimer 后台删除、CoreService 重命名失败时的就地删除。
+    - 下游: 实际移除文件系统条目。
+    """
+    p = Path(path_obj)
+    if p.is_file() or p.is_symlink():
+        try:
+            p.unlink()
+            return
+        except PermissionError:
+            try:
+                os.chmod(p, stat.S_IWRITE)
+            except Exception:
+                pass
+            p.unlink()
+            return
+    if p.is_dir():
+        def _onerror(func, path, exc_info):
+            try:
+                os.chmod(path, stat.S_IWRITE)
+            except Exception:
+                pass
+            func(path)
+
+        shutil.rmtree(p, onerror=_onerror)
+
+
+class TrashReclaimer:
+    """
+    功能定位:
+    - 管理回收目录的写入与后台并行回收。
+
+    输入输出:
+    - 输入: 日志回调（message, level）、并行删除线程数。
+    - 输出: move_to_trash 的统计结果；后台清理的日志。
+    - 外部资源/依赖: 回收目录、线程池。
+
+    实现逻辑:
+    - _running 记录正在清理的回收目录；同一目录重复请求时只设置 _pending 标记，由当前线程再跑一轮。
+
+    业务关联:
+    - 上游: CoreService。
+    - 下游: 文件系统删除。
+    """
+
+    def __init__(self, log_callback=None, max_workers=4):
+        self._log = log_callback or (lambda *_args, **_kwargs: None)
+        self._max_workers = max(1, int(max_workers))
+        self._lock = threading.Lock()
+        self._running = set()
+        self._pending = set()
+
+    def move_to_trash(self, items, trash_root):
+        """
+        功能定位:
+        - 将条目重命名到回收目录的新批次中。
+
+        输入输出:
+        - 参数:
+          - items: Iterable[str | Path]，待移除的条目（必须与 trash_root 位于同一卷）。
+          - trash_root: Path，回收目录根路径。
+        - 返回:
+          - tuple[int, list[Path]]，(成功移入数量, 重命名失败的条目列表)。
+        - 外部资源/依赖: os.rename
+
+        实现逻辑:
+        - 1) 首次成功移动前创建批次目录（时间戳 + 序号，避免重名）。
+        - 2) 对每个条目执行 os.rename；失败（如文件被占用、跨卷）时记录到失败列表。
+
+        业务关联:
+        - 上游: CoreService.restore_game。
+        - 下游: 失败条目由调用方就地删除；成功条目等待 reclaim_async 回收。
+        """
+        trash_root = Path(trash_root)
+        batch_dir = None
+        moved = 0
+        failed = []
+        for item in items:
+            item = Path(item)
+            try:
+                if batch_dir is None:
+                    batch_dir = self._new_batch_dir(trash_root)
+                os.rename(item, batch_dir / item.name)
+                moved += 1
+            except OSError:
+                failed.append(item)
+        return moved, failed
+
+    def _new_batch_dir(self, trash_root):
+        trash_root.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        idx = 0
+        while True:
+            batch_dir = trash_root / f"{stamp}_{idx}"
+            try:
+                batch_dir.mkdir()
+                return batch_dir
+            except FileExistsError:
+                idx += 1
+
+    def resume(self, trash_root):
+        """
+        功能定位:
+        - 若回收目录中存在上次未清理完的批次，则启动后台回收。
+
+        输入输出:
+        - 参数:
+          - trash_root: Path，回收目录根路径。
+        - 返回: None
+        - 外部资源/依赖: 文件系统（存在性检查）
+
+        实现逻辑:
+        - 回收目录存在且非空时调用 reclaim_async。
+
+        业务关联:
+        - 上游: CoreService.validate_game_path（应用启动/路径切换）。
+        - 下游: 后台删除残留内容。
+        """
+        trash_root = Path(trash_root)
+        try:
+            if trash_root.is_dir() and any(os.scandir(trash_root)):
+                self.reclaim_async(trash_root)
+        except OSError:
+            pass
+
+    def reclaim_async(self, trash_root):
+        """
+        功能定位:
+        - 在后台守护线程中回收指定回收目录。
+
+        输入输出:
+        - 参数:
+          - trash_root: Path，回收目录根路径。
+        - 返回: None
+        - 外部资源/依赖: threading
+
+        实现逻辑:
+        - 同一回收目录已有线程运行时仅标记 _pending；否则启动新线程执行 _reclaim_loop。
+
+        业务关联:
+        - 上游: restore_game 完成重命名后调用；resume 调用。
+        - 下游: _reclaim_loop。
+        """
+        key = str(Path(trash_root))
+        with self._lock:
+            if key in self._running:
+                self._pending.add(key)
+                return
+            self._running.add(key)
+
+        t = threading.Thread(target=self._reclaim_loop, args=(Path(trash_root),))
+        t.daemon = True
+        t.start()
+
+    def _reclaim_loop(self, trash_root):
+        key = str(trash_root)
+        try:
+            while True:
+                self._reclaim_once(trash_root)
+                with self._lock:
+                    if key not in self._pending:
+                        self._running.discard(key)
+                        return
+                    self._pending.discard(key)
+        except Exception as e:
+            with self._lock:
+                self._running.discard(key)
+                self._pending.discard(key)
+            self._log(f"后台清理回收目录失败: {e}", "WARN")
+
+    def _reclaim_once(self, trash_root):
+        """
+        功能定位:
+        - 并行删除回收目录下所有批次中的条目，并移除空的批次目录与回收目录。
+
+        输入输出:
+        - 参数:
+          - trash_root: Path，回收目录根路径。
+        - 返回: None
+        - 外部资源/依赖: ThreadPoolExecutor、remove_path
+
+        实现逻辑:
+        - 1) 收集所有批次目录下的一级条目。
+        - 2) 线程池并行执行 remove_path，统计失败数量（失败条目保留到下次启动再试）。
+        - 3) 尝试 rmdir 批次目录与回收目录（非空时忽略）。
+
+        业务关联:
+        - 上游: _reclaim_loop。
+        - 下游: 文件系统删除。
+        """
+        if not trash_root.is_dir():
+            return
+        batches = [Path(e.path) for e in os.scandir(trash_root) if e.is_dir(follow_symlinks=False)]
+        entries = []
+        for batch in batches:
+            try:
+                entries.extend(Path(e.path) for e in os.scandir(batch))
+            except OSError:
+                continue
+        if not entries and not batches:
+            return
+
+        t0 = time.monotonic()
+        failed = 0
+        if entries:
+            def _remove(p):
+                try:
+                    remove_path(p)
+                    return True
+                except Exception:
+                    return False
+
+            with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                for ok in pool.map(_remove, entries):
+                    if not ok:
+                        failed += 1
+
+        for batch in batches:
+            try:
+                batch.rmdir()
+            except OSError:
+                pass
+        try:
+            trash_root.rmdir()
+        except OSError:
+            pass
+
+        dt = time.monotonic() - t0
+        if failed:
+            self._log(f"后台清理完成，{failed} 项删除失败，将在下次启动时重试", "WARN")
+        elif entries:
+            self._log(f"后台清理完成: 已回收 {len(entries)} 项 ({dt:.1f}s)", "INFO")
@@ -153,6 +153,43 @@ const app = {
         }
     },
 
+    // --- 导入设置 ---
+    async loadImportSettings() {
+        const settings = await pywebview.api.get_import_settings();
+        this.applyImportSettingsUI(settings);
+    },
+
+    applyImportSettingsUI(settings) {
+        const select = document.getElementById('import-filter-select');
+        const input = document.getElementById('import-patterns-input');
+        if (!select || !input || !settings) return;
+        select.value = settings.mode;
+        input.value = (settings.patterns || []).join(', ');
+        // 全部解压时通配符不起作用
+        input.disabled = settings.mode !== 'voice';
+    },
+
+    async saveImportSettings() {
+        const select = document.getElementById('import-filter-select');
+        const input = document.getElementById('import-patterns-input');
+        if (!select || !input) return;
+        const settings = await pywebview.api.set_import_settings(select.value, input.value);
+        this.applyImportSettingsUI(settings);
+    },
+
+    // 导入时因筛选未解压的文件
+    async showSkippedFiles(modId) {
+        const files = await pywebview.api.get_skipped_files(modId);
+        if (!files || files.length === 0) return;
+        const total = files.reduce((sum, f) => sum + (f.size || 0), 0);
+        const names = files.slice(0, 10).map(f => f.name);
+        if (files.length > 10) names.push(`... 共 ${files.length} 个`);
+        this.showAlert(
+            '导入时跳过的文件',
+            `按导入设置未解压 ${files.length} 个文件（${this._formatBytes(total)}）：${names.join('、')}。如需保留，请在设置页调整导入设置后重新导入。`
+        );
+    },
+
     async onThemeChange(filename) {
         if (filename === 'default.json') {
             this.resetTheme();
@@ -1541,7 +1578,7 @@ const app = {
 
     createModCard(mod) {
         const div = document.createElement('div');
-        div.className = 'card mod-card';
+        div.className = mod.cold ? 'card mod-card cold' : 'card mod-card';
         div.dataset.id = mod.id; // 添加 ID 标识，方便动画定位
 
         const imgUrl = mod.cover_url || '';
@@ -1601,9 +1638,40 @@ const app = {
 
         const noteText = mod.note || '暂无留言';
 
+        // 导入筛选跳过的文件：点击查看明细
+        const skippedHtml = mod.skipped_count > 0
+            ? `<span class="mod-skipped-link" onclick="app.showSkippedFiles('${mod.id}')" title="查看导入时跳过的文件" style="margin-left:6px; cursor:pointer; text-decoration:underline;"><i class="ri-filter-3-line"></i> 已跳过 ${mod.skipped_count} 个文件</span>`
+            : '';
+
         // 判断该语音包是否为当前已生效项
         const isInstalled = app.installedModIds && app.installedModIds.includes(mod.id);
 
+        // 冲突徽标：语音包库索引给出的同名 .bank 语音包中，当前已安装的那些
+        const conflictInstalled = (mod.conflicts_with || []).filter(id =>
+            id !== mod.id && app.installedModIds && app.installedModIds.includes(id)
+        );
+        const conflictBadge = conflictInstalled.length > 0
+            ? `<span class="mod-conflict-badge" title="与已安装的 ${conflictInstalled.join('、')} 存在同名文件，安装将覆盖" style="margin-left:6px; color:#e6a23c; flex-shrink:0;"><i class="ri-error-warning-line"></i></span>`
+            : '';
+
+        // 冷存储：目录已打包为单个归档，卡片显示徽标，悬停操作由“归档”变为“恢复”；复制国籍文件与导出需要目录，冷存储时不提供
+        const isCold = !!mod.cold;
+        const coldBadge = isCold
+            ? `<span class="mod-cold-badge" title="已归档到冷存储，安装时直接从归档读取" style="margin-left:6px; color:#409eff; flex-shrink:0;"><i class="ri-inbox-archive-line"></i></span>`
+            : '';
+        const copyActionHtml = isCold ? '' : `
+            <button class="mod-copy-action" title="复制国籍文件">
+                <i class="ri-file-copy-line"></i>
+            </button>`;
+        const exportActionHtml = isCold ? '' : `
+            <button class="mod-copy-action mod-export-action slot-3" title="导出为 ZIP">
+                <i class="ri-download-2-line"></i>
+            </button>`;
+        const coldActionHtml = `
+            <button class="mod-copy-action mod-cold-action${isCold ? '' : ' slot-2'}" title="${isCold ? '从冷存储恢复为文件夹' : '归档到冷存储'}">
+                <i class="${isCold ? 'ri-inbox-unarchive-line' : 'ri-inbox-archive-line'}"></i>
+            </button>`;
+
         // 根据状态决定按钮样式和图标
         // 已安装: active 样式, check 图标, title="当前已加载"
         // 未安装: 普通样式, play-circle 图标, title="加载此语音包"
@@ -1628,6 +1696,9 @@ const app = {
 
                 <div class="mod-title-row">
                     <div class="mod-title" title="${mod.title}">${mod.title}</div>
+                    ${coldBadge}
+                    ${conflictBadge}
+                    ${this._verifyBadgeHtml(mod.id)}
                 </div>
 
                 <div class="mod-author-row">
@@ -1646,6 +1717,7 @@ const app = {
                 
                 <div style="font-size:11px; color:var(--text-log); opacity:0.6; margin-bottom:8px; display:flex; align-items:center; gap:4px;">
                     <i class="ri-time-line"></i> 更新于: ${updateDate}
+                    ${skippedHtml}
                 </div>
 
                 <div class="mod-note">
@@ -1654,9 +1726,9 @@ const app = {
                 </div>
             </div>
 
-            <button class="mod-copy-action" title="复制国籍文件">
-                <i class="ri-file-copy-line"></i>
-            </button>
+            ${copyActionHtml}
+            ${coldActionHtml}
+            ${exportActionHtml}
 
             <div class="mod-actions-col">
                 <div class="action-icon action-btn-del" onclick="app.deleteMod('${mod.id}')" title="删除语音包">
@@ -1692,6 +1764,14 @@ const app = {
                 app.openCopyCountryModal(copyBtn.dataset.modId, copyBtn.dataset.modTitle);
             };
         }
+        const coldBtn = div.querySelector('.mod-cold-action');
+        if (coldBtn) {
+            coldBtn.onclick = () => app.toggleColdMod(mod.id, isCold);
+        }
+        const exportBtn = div.querySelector('.mod-export-action');
+        if (exportBtn) {
+            exportBtn.onclick = () => app.exportMod(mod.id);
+        }
         const noteEl = div.querySelector('.mod-note');
         if (noteEl) noteEl.dataset.note = noteText;
         return div;
@@ -1809,6 +1889,102 @@ const app = {
         pywebview.api.import_zips();
     },
 
+    importFolders() {
+        app.closeModal('modal-import');
+        // 硬链接导入：源文件夹保留，同盘不占额外空间；跨盘或不支持硬链接时由后端改为复制
+        pywebview.api.import_folders(null, 'link');
+    },
+
+    // --- 压缩包预览 ---
+    // 不解压读取压缩包目录与元数据，确认内容后再导入
+    async previewArchive() {
+        app.closeModal('modal-import');
+        const res = await pywebview.api.inspect_archive();
+        if (!res || !res.success) {
+            if (res && !res.canceled) this.showAlert('错误', `预览失败: ${res.msg || '未知错误'}`, 'error');
+            return;
+        }
+        const info = res.info;
+        this.previewInfo = info;
+
+        document.getElementById('archive-preview-file').textContent = info.path;
+        const cover = document.getElementById('archive-preview-cover');
+        cover.src = info.cover_url || 'assets/card_image.png';
+        cover.onerror = () => { cover.style.visibility = 'hidden'; };
+        cover.style.visibility = '';
+        document.getElementById('archive-preview-title').textContent = info.title || info.name;
+
+        const langs = Array.isArray(info.language) ? info.language : (info.language ? [info.language] : []);
+        const metaRows = [
+            `<i class="ri-user-3-line"></i> ${this._escapeHtml(info.author)} · v${this._escapeHtml(String(info.version || '1.0').replace(/^v/i, ''))}`
+                + (langs.length ? ` · ${this._escapeHtml(langs.join('/'))}` : ''),
+            `<i class="ri-hard-drive-2-line"></i> ${String(info.format || '').toUpperCase()} ${this._formatBytes(info.archive_size)}`
+                + `，解压后 ${this._formatBytes(info.uncompressed_size)}`,
+            `<i class="ri-file-list-3-line"></i> ${info.file_count} 个文件，其中 ${info.bank_count} 个 .bank`,
+        ];
+        document.getElementById('archive-preview-meta').innerHTML = metaRows.join('<br>');
+
+        let tagsHtml = '';
+        const caps = info.capabilities || {};
+        if (typeof UI_CONFIG !== 'undefined') {
+            for (const [key, conf] of Object.entries(UI_CONFIG.tagMap)) {
+                if (caps[key]) tagsHtml += `<span class="tag ${conf.cls}">${conf.text}</span>`;
+            }
+        }
+        document.getElementById('archive-preview-tags').innerHTML = tagsHtml;
+
+        const warnings = [];
+        if (info.encrypted) warnings.push('<i class="ri-lock-line"></i> 压缩包已加密，导入时需要输入密码');
+        if (info.target_exists) warnings.push(`<i class="ri-error-warning-line"></i> 语音包库中已存在同名语音包 [${this._escapeHtml(info.name)}]`);
+        if (!info.has_info) warnings.push('<i class="ri-information-line"></i> 未找到 info.json，将使用默认信息');
+        document.getElementById('archive-preview-warnings').innerHTML = warnings.join('<br>');
+
+        const folders = info.folders || [];
+        document.getElementById('archive-preview-folders').innerHTML = folders.length
+            ? folders.map(f => `
+                <label style="display:flex; align-items:center; gap:6px; margin-bottom:2px; cursor:pointer;">
+                    <input type="checkbox" class="archive-preview-folder" value="${this._escapeHtml(f.path)}" checked>
+                    <span>${this._escapeHtml(f.path)}</span>
+                </label>`).join('')
+            : '<div style="color:#888;">⚠️ 未检测到有效语音包文件夹 (不含 .bank 文件)</div>';
+
+        // 直接安装只支持 ZIP（按中央目录流式写入 sound/mod）
+        const installBtn = document.getElementById('archive-preview-install');
+        installBtn.style.display = (info.format === 'zip' && folders.length) ? '' : 'none';
+
+        const modal = document.getElementById('modal-archive-preview');
+        modal.classList.remove('hiding');
+        modal.classList.add('show');
+    },
+
+    importPreviewedArchive() {
+        if (!this.previewInfo) return;
+        app.closeModal('modal-archive-preview');
+        pywebview.api.import_selected_zip(this.previewInfo.path);
+    },
+
+    async installPreviewedArchive() {
+        if (!this.previewInfo) return;
+        if (!this.currentGamePath) {
+            app.showAlert("提示", "请先设置游戏路径！");
+            return;
+        }
+        const selection = Array.from(document.querySelectorAll('#archive-preview-folders .archive-preview-folder:checked'))
+            .map(el => el.value);
+        if (selection.length === 0) {
+            app.showAlert("提示", "请至少选择一个文件夹！");
+            return;
+        }
+        if (typeof MinimalistLoading !== 'undefined') {
+            MinimalistLoading.show(false, "正在准备安装...");
+        }
+        // 将数组参数序列化为 JSON 字符串传递给后端；未能启动任务时（如游戏路径失效）收起加载组件，原因见日志
+        const started = await pywebview.api.install_archive(this.previewInfo.path, JSON.stringify(selection));
+        if (!started && typeof MinimalistLoading !== 'undefined') MinimalistLoading.hide();
+        app.closeModal('modal-archive-preview');
+        app.switchTab('home'); // 跳转回主页看日志
+    },
+
     openFolder(type) {
         if (type === 'game' || type === 'userskins') {
             if (!this.currentGamePath) {
@@ -1883,6 +2059,27 @@ const app = {
         }
     },
 
+    // 导出：后端弹出保存对话框，导出在后台任务中执行
+    exportMod(modId) {
+        pywebview.api.export_mod(modId);
+    },
+
+    // --- 冷存储 ---
+    // 归档/恢复在后台任务中执行，完成后由后端刷新列表
+    async toggleColdMod(modId, isCold) {
+        if (isCold) {
+            pywebview.api.thaw_mod(modId);
+            return;
+        }
+        const yes = await app.confirm(
+            '归档确认',
+            `将语音包 <strong>[${modId}]</strong> 打包归档到冷存储并删除原目录？<br>归档后仍可直接安装，也可随时恢复。`,
+            false,
+            '归档'
+        );
+        if (yes) pywebview.api.freeze_mod(modId);
+    },
+
     // --- 安装模态框 ---
     // openInstallModal 的实现在文件末尾，使用 modCache
 
@@ -1902,6 +2099,70 @@ const app = {
         console.log("Restore Success");
         this.installedModIds = [];
         if (this.modCache) this.renderList(this.modCache);
+    },
+
+    // 语音包库索引后台刷新完成：只拉取冲突关系并重绘卡片，不重新读取整个语音包列表
+    async onLibraryIndexUpdated() {
+        if (!this.modCache || this.modCache.length === 0) return;
+        try {
+            const conflicts = await pywebview.api.get_library_conflicts();
+            this.modCache.forEach(mod => {
+                mod.conflicts_with = (conflicts && conflicts[mod.id]) || [];
+            });
+            this.renderList(this.modCache);
+        } catch (e) {
+            console.error('刷新冲突关系失败', e);
+        }
+    },
+
+    // --- 语音包库去重 ---
+    // 内容相同的 .bank 文件合并为硬链接，结果与回收空间写入日志
+    async dedupeLibrary() {
+        const yes = await app.confirm(
+            '去重确认',
+            '将查找不同语音包之间内容完全相同的 .bank 文件，并合并为同一份数据（硬链接）以释放磁盘空间。<br>' +
+            '合并后这些文件共享数据，请勿直接修改语音包库中的 .bank 文件。',
+            false,
+            '开始去重'
+        );
+        if (yes) pywebview.api.dedupe_library(false);
+    },
+
+    // --- 语音包库健康检查 ---
+    verifyResults: {},
+
+    verifyLibrary() {
+        this.verifyResults = {};
+        document.querySelectorAll('.mod-verify-badge').forEach(el => el.remove());
+        if (window.MinimalistLoading) MinimalistLoading.show(false, '正在检查语音包库...');
+        pywebview.api.verify_library();
+    },
+
+    // 健康检查徽标：仅对存在问题的语音包显示，悬停列出问题文件
+    _verifyBadgeHtml(modId) {
+        const result = this.verifyResults[modId];
+        if (!result || result.status === 'ok') return '';
+        const isError = result.status === 'error';
+        const issues = (result.issues || []).filter(issue => issue.level !== 'info');
+        const lines = issues.slice(0, 8).map(issue => `${issue.file}: ${issue.msg}`);
+        if (issues.length > 8) lines.push(`... 共 ${issues.length} 项`);
+        const head = isError ? '存在损坏文件，建议重新导入' : '存在可疑文件';
+        const title = this._escapeHtml([head, ...lines].join('\n'));
+        const color = isError ? '#EF4444' : '#e6a23c';
+        const icon = isError ? 'ri-close-circle-line' : 'ri-alert-line';
+        return `<span class="mod-verify-badge" title="${title}" style="margin-left:6px; color:${color}; flex-shrink:0;"><i class="${icon}"></i></span>`;
+    },
+
+    // 后端逐个语音包推送检查结果：记录结论并就地更新对应卡片的徽标，不重绘整个列表
+    onLibraryVerifyResult(result) {
+        if (!result || !result.mod) return;
+        this.verifyResults[result.mod] = result;
+        const card = document.querySelector(`.mod-card[data-id="${CSS.escape(result.mod)}"]`);
+        const row = card && card.querySelector('.mod-title-row');
+        if (!row) return;
+        const old = row.querySelector('.mod-verify-badge');
+        if (old) old.remove();
+        row.insertAdjacentHTML('beforeend', this._verifyBadgeHtml(result.mod));
     }
 };
 
@@ -2251,6 +2512,9 @@ app.init = async function () { // 覆盖之前的 init 实现以插入 checkDisc
             themeBtn.innerHTML = '<i class="ri-sun-line"></i>';
         }
 
+        // 导入设置
+        this.loadImportSettings();
+
         // 加载主题列表并应用上次的选择
         await this.loadThemeList();
         if (state.active_theme && state.active_theme !== 'default.json') {
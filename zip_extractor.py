@@ -0,0 +1,1022 @@
+# -*- coding: utf-8 -*-
+"""
+ZIP 解压引擎模块：语音包库、涂装、炮镜三条导入路径共用的安全解压实现。
+
+功能定位:
+- 统一成员名解码（整包检测一次编码，识别 UTF-8 标志位与 Unicode Path 扩展字段）、无效项过滤、路径穿越拦截、扩展名策略、密码异常转换与进度回调。
+- 以较大的可调读块复制成员数据，按时间节流进度；大压缩包可按成员拆分到多个线程并行解压。
+- 可选的逐成员断点日志（ExtractJournal）：中断后再次解压同一压缩包时，校验并跳过已完整写入的成员。
+
+输入输出:
+- 输入: ZIP 路径、目标目录、密码、进度回调与策略选项（穿越处理方式、允许/禁止扩展名、名称解码）。
+- 输出: 解压到目标目录的文件；返回统计字典；按策略抛出异常或写日志。
+- 外部资源/依赖:
+  - 文件系统: 创建目录并写入解压文件
+  - zipfile: 读取 ZIP 成员（多线程模式下每个线程使用独立的 ZipFile 句柄）
+
+实现逻辑:
+- 1) plan 阶段只读取中央目录：解码名称、过滤、校验路径边界与扩展名，在写入任何文件之前暴露策略违规与缺少密码。
+- 2) 路径边界校验基于一次 resolve 的 target_root 与 normpath 字符串比较，不再对每个成员做文件系统 resolve。
+- 3) 写入阶段单线程顺序写入，或大文件优先分发到多个线程；进度按已写入字节数汇总并按时间节流。
+
+业务关联:
+- 上游: library_manager.LibraryManager、skins_manager.SkinsManager、sights_manager.SightsManager。
+- 下游: 各导入流程的临时目录或目标目录。
+"""
+import json
+import os
+import shutil
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+# 默认读块大小：1MB 时 zlib 解压与磁盘写入的调用次数足够少，8KB 时 Python 层往返占比明显
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# 多线程解压阈值：未压缩总量低于该值时线程开销大于收益
+PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+# 进度回调最小间隔（秒）
+PROGRESS_INTERVAL = 0.2
+
+# 文件系统分配单元（字节）：小文件按整簇占用空间，预检时按此向上取整
+DISK_CLUSTER = 4096
+
+# 路径穿越处理方式：skip 写日志并跳过该成员；raise 抛出 UnsafeArchiveError
+ON_UNSAFE_SKIP = "skip"
+ON_UNSAFE_RAISE = "raise"
+
+# 逐成员解压断点日志：写在目标目录内，导入完成后删除；目录中存在该文件即表示导入未完成
+EXTRACT_JOURNAL_NAME = ".aimer_extract.journal"
+
+
+class ArchivePasswordRequired(Exception):
+    """表示压缩包需要密码。"""
+    pass
+
+
+class ArchivePasswordIncorrect(Exception):
+    """表示提供的压缩包密码不正确。"""
+    pass
+
+
+class UnsafeArchiveError(ValueError):
+    """表示压缩包成员路径不安全（路径穿越）。"""
+    pass
+
+
+class DiskSpaceError(Exception):
+    """表示目标磁盘剩余空间不足以完成解压。"""
+    pass
+
+
+class BlockedMemberError(ValueError):
+    """表示压缩包包含策略不允许的文件类型；members 为违规成员名列表。"""
+
+    def __init__(self, members):
+        self.members = list(members)
+        super().__init__(f"检测到不允许的文件类型: {self.members[0] if self.members else ''}")
+
+
+# 成员名候选编码：UTF-8 之外为简体（GBK）与繁体（CP950）压缩工具的常见本地编码
+NAME_CODECS = ("gbk", "cp950")
+# 编码评分的抽样名称数上限
+NAME_SCORE_SAMPLE = 256
+# 成员名编码 -> 7z -mcp 代码页（加密 ZIP 交给 7z 解压时与 decode_zip_names 的检测结果保持一致）
+SEVEN_ZIP_CODEPAGES = {"utf-8": 65001, "gbk": 936, "cp950": 950, "cp437": 437}
+# Info-ZIP Unicode Path 扩展字段（版本 1 + 原始名称 CRC32 + UTF-8 名称）
+UNICODE_PATH_EXTRA_ID = 0x7075
+
+
+def _unicode_path_extra(member, raw):
+    """读取成员的 Info-ZIP Unicode Path 扩展字段；字段缺失、版本不符或 CRC 与原始名称不一致时返回 None。"""
+    extra = member.extra or b""
+    i = 0
+    while i + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[i:i + 4])
+        data = extra[i + 4:i + 4 + size]
+        i += 4 + size
+        if header_id != UNICODE_PATH_EXTRA_ID or len(data) < 5 or data[0] != 1:
+            continue
+        if struct.unpack("<I", data[1:5])[0] != zlib.crc32(raw):
+            return None
+        try:
+            return data[5:].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+    return None
+
+
+def _codec_score(text, codec):
+    """
+    估计一段解码结果在该编码下“像真实文本”的程度：
+    GBK 以 GB2312 常用字为准，CP950 以 Big5 常用字区（0xA440-0xC67E）为准；命中 +1，其余非 ASCII 字符 -1。
+    """
+    score = 0
+    for ch in text:
+        if ch < "\x80":
+            continue
+        try:
+            if codec == "gbk":
+                ch.encode("gb2312")
+                score += 1
+                continue
+            code = int.from_bytes(ch.encode("big5"), "big")
+            score += 1 if 0xA440 <= code <= 0xC67E else -1
+            continue
+        except UnicodeEncodeError:
+            pass
+        score -= 1
+    return score
+
+
+def detect_name_codec(raw_names):
+    """
+    功能定位:
+    - 为整个压缩包选定一个成员名编码，避免逐成员异常回退造成同一压缩包内混用编码。
+
+    输入输出:
+    - 参数:
+      - raw_names: Iterable[bytes]，未设置 UTF-8 标志且无 Unicode Path 扩展字段的成员原始名称。
+    - 返回:
+      - str，编码名称；"cp437" 表示无法确定（保持 zipfile 的默认解码）。
+
+    实现逻辑:
+    - 1) 全部为 ASCII 或全部可按 UTF-8 严格解码时返回 utf-8（随机本地编码字节恰好满足 UTF-8 的概率极低）。
+    - 2) 否则对 NAME_CODECS 逐一解码：先比较可成功解码的名称数，再比较抽样名称的 _codec_score 总分。
+    """
+    names = [r for r in raw_names if not r.isascii()]
+    if not names:
+        return "utf-8"
+    try:
+        for r in names:
+            r.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+
+    # 逐字符评分只在均匀抽取的样本上进行，成员数很多时检测成本保持恒定
+    step = max(1, len(names) // NAME_SCORE_SAMPLE)
+    sample = names[::step]
+    best = None
+    for codec in NAME_CODECS:
+        ok = 0
+        for r in names:
+            try:
+                r.decode(codec)
+                ok += 1
+            except UnicodeDecodeError:
+                pass
+        if not ok:
+            continue
+        score = 0
+        for r in sample:
+            try:
+                score += _codec_score(r.decode(codec), codec)
+            except UnicodeDecodeError:
+                pass
+        if best is None or (ok, score) > best[0]:
+            best = ((ok, score), codec)
+    return best[1] if best else "cp437"
+
+
+def decode_zip_names(members):
+    """
+    功能定位:
+    - 生成与 members 顺序一致的成员名表。
+
+    输入输出:
+    - 参数:
+      - members: list[zipfile.ZipInfo]。
+    - 返回:
+      - tuple[str, list[str]]，(本地编码名称, 成员名列表)。
+
+    实现逻辑:
+    - 1) 通用标志位 bit 11 已置位：zipfile 已按 UTF-8 解码，直接使用。
+    - 2) 存在有效的 Unicode Path 扩展字段：使用其中的 UTF-8 名称。
+    - 3) 其余成员取原始字节（orig_filename 按 cp437 还原），整包只检测一次编码后统一解码；
+         解码先于反斜杠替换，避免 GBK/Big5 双字节中的 0x5C 被误当作路径分隔符。
+    """
+    names = [None] * len(members)
+    pending = []
+    for i, m in enumerate(members):
+        if m.flag_bits & 0x800:
+            names[i] = m.filename
+            continue
+        try:
+            raw = m.orig_filename.encode("cp437")
+        except UnicodeEncodeError:
+            names[i] = m.filename
+            continue
+        unicode_name = _unicode_path_extra(m, raw) if m.extra else None
+        if unicode_name is not None:
+            names[i] = unicode_name.replace("\\", "/")
+            continue
+        pending.append((i, raw))
+
+    codec = detect_name_codec(raw for _i, raw in pending) if pending else "utf-8"
+    for i, raw in pending:
+        if codec == "cp437":
+            names[i] = members[i].filename
+            continue
+        try:
+            names[i] = raw.decode(codec).replace("\\", "/")
+        except UnicodeDecodeError:
+            names[i] = members[i].filename
+    return codec, names
+
+
+def is_junk_member(name):
+    """判断成员是否为系统生成的无效项（__MACOSX 资源分支、desktop.ini）。"""
+    return "__MACOSX" in name or "desktop.ini" in name.lower()
+
+
+def allocated_size(sizes, cluster=DISK_CLUSTER):
+    """按文件系统分配单元向上取整后累加文件大小，得到写入这些文件实际占用的字节数。"""
+    total = 0
+    for size in sizes:
+        size = int(size or 0)
+        total += ((size + cluster - 1) // cluster) * cluster
+    return total
+
+
+def tree_size(path):
+    """统计文件或目录（递归）占用的字节数（按分配单元取整）；路径不存在返回 0。"""
+    path = str(path)
+    if os.path.isfile(path):
+        return allocated_size([os.path.getsize(path)])
+    sizes = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            sizes.append(entry.stat(follow_symlinks=False).st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return allocated_size(sizes)
+
+
+def check_disk_space(target_dir, required, freed=0, reserved=0):
+    """
+    功能定位:
+    - 导入前的磁盘空间预检（语音包库、涂装、炮镜导入共用）。
+
+    输入输出:
+    - 参数:
+      - target_dir: str | Path，写入目标目录（可不存在，取最近的已存在上级目录所在磁盘）。
+      - required: int，将写入的字节数（通常为 allocated_size(未压缩大小列表)）。
+      - freed: int，写入前会被删除的既有文件字节数（覆盖导入时先删除的旧目录）。
+      - reserved: int，并行导入中其他任务已预占的字节数。
+    - 返回:
+      - int，可用空间（字节）。
+    - 外部资源/依赖: shutil.disk_usage
+
+    实现逻辑:
+    - free + freed - reserved < required 时抛出 DiskSpaceError（消息以“磁盘空间不足”开头，兼容上层的字符串判断）。
+
+    业务关联:
+    - 上游: LibraryManager.unzip_single_zip/unzip_zips_to_library、SkinsManager.import_skin_zip、SightsManager.import_sights_zip。
+    - 下游: 空间不足时在写入任何文件之前终止导入。
+    """
+    probe = Path(target_dir)
+    while not probe.exists() and probe.parent != probe:
+        probe = probe.parent
+    free = shutil.disk_usage(str(probe)).free
+    need = max(0, int(required) - int(freed))
+    if free - int(reserved) < need:
+        free_mb = max(0, free - int(reserved)) / (1024 * 1024)
+        req_mb = need / (1024 * 1024)
+        raise DiskSpaceError(f"磁盘空间不足 (可用 {free_mb:.0f}MB, 需要 {req_mb:.0f}MB)")
+    return free
+
+
+def archive_identity(archive_path):
+    """返回压缩包身份（文件名、大小、mtime_ns），用于判断断点日志是否属于同一个压缩包。"""
+    st = os.stat(archive_path)
+    return {"archive": Path(archive_path).name, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def file_crc32(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """按块计算文件内容的 CRC32（与 ZIP 中央目录中的 CRC 可直接比较）。"""
+    crc = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+    return crc & 0xFFFFFFFF
+
+
+class ExtractJournal:
+    """
+    功能定位:
+    - 目标目录内的逐成员解压断点日志，使中断（崩溃、退出、异常）后的导入可以从断点继续。
+
+    输入输出:
+    - 输入: 目标目录、压缩包路径、已写完的成员 (名称, 大小, CRC32)。
+    - 输出: <target_dir>/.aimer_extract.journal（首行为压缩包身份，其后每行一个已写完的成员）。
+    - 外部资源/依赖: 文件系统追加写入。
+
+    实现逻辑:
+    - 1) begin 读取已有日志：首行身份与当前压缩包一致时沿用已完成成员表并追加；否则重写头部。
+    - 2) record 在成员文件完整写入并关闭后追加一行并 flush（不逐行 fsync）：进程崩溃不会丢失已 flush 的行，
+         断电等情况下日志与文件内容可能不一致，由续传时的大小与 CRC 校验兜底。
+    - 3) 末尾写了一半的行解析失败时忽略，对应成员按未完成处理。
+
+    业务关联:
+    - 上游: ZipExtractor.extract（resume=True）、LibraryManager 导入流程。
+    - 下游: 续传时跳过已校验的成员；导入完成后由调用方 discard。
+    """
+
+    def __init__(self, target_dir):
+        self.path = Path(target_dir) / EXTRACT_JOURNAL_NAME
+        self._lock = threading.Lock()
+        self._file = None
+
+    @staticmethod
+    def exists(target_dir):
+        """判断目标目录中是否存在断点日志（即该目录是一次未完成的导入）。"""
+        return (Path(target_dir) / EXTRACT_JOURNAL_NAME).is_file()
+
+    def load(self):
+        """读取日志，返回 (压缩包身份 dict | None, {成员名: (大小, CRC32)})；日志缺失或首行不是身份时返回 (None, {})。"""
+        header = None
+        done = {}
+        try:
+            f = open(self.path, "r", encoding="utf-8")
+        except OSError:
+            return None, done
+        with f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                if header is None:
+                    if "archive" not in record:
+                        return None, {}
+                    header = record
+                    continue
+                name = record.get("name")
+                if isinstance(name, str):
+                    done[name] = (int(record.get("size") or 0), int(record.get("crc") or 0))
+        return header, done
+
+    def matches(self, archive_path):
+        """判断日志是否属于该压缩包（文件名、大小、mtime 均一致）。"""
+        header, _done = self.load()
+        if header is None:
+            return False
+        try:
+            identity = archive_identity(archive_path)
+        except OSError:
+            return False
+        return all(header.get(k) == v for k, v in identity.items())
+
+    def begin(self, archive_path):
+        """打开日志用于追加，返回沿用的已完成成员表；日志不属于该压缩包时清空重写并返回空表。"""
+        identity = archive_identity(archive_path)
+        header, done = self.load()
+        same = header is not None and all(header.get(k) == v for k, v in identity.items())
+        if not same:
+            done = {}
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.path, "a" if same else "w", encoding="utf-8")
+            if not same:
+                self._file.write(json.dumps(identity, ensure_ascii=False) + "\n")
+                self._file.flush()
+        return done
+
+    def record(self, name, size, crc):
+        """追加一个已完整写入的成员。"""
+        line = json.dumps({"name": name, "size": int(size), "crc": int(crc)}, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def discard(self):
+        """关闭并删除日志（导入完成）。"""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class ZipExtractor:
+    """
+    功能定位:
+    - 可配置策略的 ZIP 解压器；可在多个线程中复用。
+
+    输入输出:
+    - 输入: 日志回调与策略选项。
+    - 输出: extract 的统计结果与解压文件。
+    - 外部资源/依赖: zipfile、threading。
+
+    实现逻辑:
+    - 策略选项在构造时确定，extract 调用只传与单个压缩包相关的参数。
+    - 成员名表按压缩包缓存在实例内（加锁），多线程共享同一实例是安全的。
+
+    业务关联:
+    - 上游: 各资源管理器在构造时按自身策略创建实例。
+    - 下游: 文件系统写入。
+    """
+
+    def __init__(
+        self,
+        log_callback=None,
+        on_unsafe=ON_UNSAFE_SKIP,
+        blocked_ext=None,
+        allowed_ext=None,
+        decode_names=True,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        progress_interval=PROGRESS_INTERVAL,
+        parallel_min_bytes=PARALLEL_MIN_BYTES,
+    ):
+        """
+        功能定位:
+        - 初始化解压策略。
+
+        输入输出:
+        - 参数:
+          - log_callback: Callable[[str, str], None] | None，日志回调（message, level）。
+          - on_unsafe: str，路径穿越成员的处理方式（ON_UNSAFE_SKIP/ON_UNSAFE_RAISE）。
+          - blocked_ext: Iterable[str] | None，禁止的扩展名（小写，含点）；命中即抛出 BlockedMemberError。
+          - allowed_ext: Iterable[str] | None，允许的扩展名；设置后扩展名不在集合内的文件视为违规（无扩展名文件放行）。
+          - decode_names: bool，是否对无 UTF-8 标志的成员名做整包编码检测与还原（见 decode_zip_names）。
+          - chunk_size: int，读块大小（字节）。
+          - progress_interval: float，进度回调最小间隔（秒）。
+          - parallel_min_bytes: int，启用多线程解压的未压缩总量阈值。
+        - 返回: None
+        - 外部资源/依赖: 无
+
+        实现逻辑:
+        - 保存策略参数；扩展名集合统一转为小写。
+
+        业务关联:
+        - 上游: LibraryManager/SkinsManager/SightsManager 初始化。
+        - 下游: plan/extract。
+        """
+        self._log = log_callback or (lambda *_args, **_kwargs: None)
+        self.on_unsafe = on_unsafe
+        self.blocked_ext = {e.lower() for e in blocked_ext} if blocked_ext else None
+        self.allowed_ext = {e.lower() for e in allowed_ext} if allowed_ext else None
+        self.decode_names = bool(decode_names)
+        self.chunk_size = max(4096, int(chunk_size))
+        self.progress_interval = float(progress_interval)
+        self.parallel_min_bytes = int(parallel_min_bytes)
+        # 成员名表缓存: (路径, 大小, mtime_ns) -> (本地编码名称, list[str])
+        self._names_cache = {}
+        self._names_lock = threading.Lock()
+
+    def member_names(self, zf):
+        """
+        功能定位:
+        - 返回与 zf.infolist() 顺序一致的成员名表（按 decode_names 策略），并按压缩包缓存。
+
+        输入输出:
+        - 参数:
+          - zf: zipfile.ZipFile，已打开的句柄。
+        - 返回:
+          - list[str]，成员在目标目录中的相对名称。
+        - 外部资源/依赖: 压缩包文件 stat（缓存键）
+
+        实现逻辑:
+        - 以 (路径, 大小, mtime_ns) 为键缓存 decode_zip_names 的结果；预检、计划与解压多次打开同一压缩包时只检测一次编码。
+        - decode_names=False 时直接使用 zipfile 的解码结果。
+
+        业务关联:
+        - 上游: plan、uncompressed_sizes、LibraryManager._list_archive。
+        - 下游: 路径校验、指纹与解压目标路径。
+        """
+        return self._decoded_names(zf)[1]
+
+    def name_codepage(self, zf):
+        """返回与 member_names 检测结果一致的 7z -mcp 代码页（decode_names=False 时返回 None，由 7z 自行决定）。"""
+        if not self.decode_names:
+            return None
+        return SEVEN_ZIP_CODEPAGES.get(self._decoded_names(zf)[0])
+
+    def _decoded_names(self, zf):
+        """按 (路径, 大小, mtime_ns) 缓存 decode_zip_names 的结果 (本地编码名称, 成员名列表)。"""
+        members = zf.infolist()
+        if not self.decode_names:
+            return None, [m.filename for m in members]
+        key = None
+        if isinstance(zf.filename, (str, os.PathLike)):
+            try:
+                st = os.stat(zf.filename)
+                key = (os.path.abspath(zf.filename), st.st_size, st.st_mtime_ns)
+            except OSError:
+                key = None
+        if key is not None:
+            with self._names_lock:
+                cached = self._names_cache.get(key)
+            if cached is not None and len(cached[1]) == len(members):
+                return cached
+        result = decode_zip_names(members)
+        if key is not None:
+            with self._names_lock:
+                if len(self._names_cache) >= 32:
+                    self._names_cache.clear()
+                self._names_cache[key] = result
+        return result
+
+    def plan(self, zf, target_dir, include=None):
+        """
+        功能定位:
+        - 基于中央目录生成解压计划，并在写入前执行全部策略校验。
+
+        输入输出:
+        - 参数:
+          - zf: zipfile.ZipFile，已打开的句柄。
+          - target_dir: Path，目标目录。
+          - include: Callable[[str], bool] | None，成员筛选；返回 False 的文件成员不解压。
+        - 返回:
+          - dict，包含 files（[(ZipInfo, name, target_path)]）、dirs（目录成员路径列表）、
+            total_bytes、needs_password、skipped（被拦截的成员名）、filtered（被 include 排除的 (成员名, 大小)）。
+        - 外部资源/依赖: 无（不访问文件系统）
+
+        实现逻辑:
+        - 1) 逐成员解码名称并过滤无效项。
+        - 2) normpath(join(target_root, name)) 必须以 target_root + sep 开头；否则按 on_unsafe 记入 skipped 或抛出。
+        - 3) 对文件成员按 blocked_ext/allowed_ext 收集违规项，全部扫描完成后统一抛出 BlockedMemberError。
+        - 4) 通过校验的文件成员再经 include 筛选；被排除的成员不参与密码判断与字节统计。
+
+        业务关联:
+        - 上游: extract。
+        - 下游: 写入阶段。
+        """
+        target_root = os.path.normpath(str(Path(target_dir).resolve()))
+        root_prefix = target_root if target_root.endswith(os.sep) else target_root + os.sep
+        files = []
+        dirs = []
+        skipped = []
+        blocked = []
+        filtered = []
+        total_bytes = 0
+        needs_password = False
+
+        for member, name in zip(zf.infolist(), self.member_names(zf)):
+            if not name or is_junk_member(name):
+                continue
+
+            full_path = os.path.normpath(os.path.join(target_root, name))
+            if not full_path.startswith(root_prefix):
+                if full_path == target_root and member.is_dir():
+                    continue
+                if self.on_unsafe == ON_UNSAFE_RAISE:
+                    raise UnsafeArchiveError(f"压缩包路径不安全: {name}")
+                skipped.append(name)
+                continue
+
+            if member.is_dir():
+                dirs.append(full_path)
+                continue
+
+            ext = os.path.splitext(name)[1].lower()
+            if self.blocked_ext is not None and ext in self.blocked_ext:
+                blocked.append(name)
+                continue
+            if self.allowed_ext is not None and ext and ext not in self.allowed_ext:
+                blocked.append(name)
+                continue
+            if include is not None and not include(name):
+                filtered.append((name, int(member.file_size or 0)))
+                continue
+
+            if member.flag_bits & 0x1:
+                needs_password = True
+            files.append((member, name, Path(full_path)))
+            total_bytes += int(member.file_size or 0)
+
+        if blocked:
+            raise BlockedMemberError(blocked)
+
+        return {
+            "files": files,
+            "dirs": dirs,
+            "total_bytes": total_bytes,
+            "needs_password": needs_password,
+            "skipped": skipped,
+            "filtered": filtered,
+        }
+
+    def uncompressed_sizes(self, zip_path):
+        """返回将被解压的文件成员（跳过目录与无效项）的未压缩大小列表，只读取中央目录。"""
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            return [
+                int(m.file_size or 0)
+                for m, name in zip(zf.infolist(), self.member_names(zf))
+                if not m.is_dir() and not is_junk_member(name)
+            ]
+
+    @staticmethod
+    def encrypted_members(zf):
+        """返回 ZIP 中设置了加密标志位（bit 0）的文件成员列表。"""
+        return [m for m in zf.infolist() if m.flag_bits & 0x1 and not m.is_dir()]
+
+    def verify_password(self, zip_path, password, sample=3):
+        """
+        功能定位:
+        - 在写入任何文件之前校验 ZipCrypto 密码。
+
+        输入输出:
+        - 参数:
+          - zip_path: str | Path，ZIP 文件路径。
+          - password: str | None，待校验的密码。
+          - sample: int，最多校验的加密成员数量。
+        - 返回: None（无需密码时直接返回）
+        - 外部资源/依赖: zipfile（只读取各成员 12 字节加密头）
+
+        实现逻辑:
+        - 1) 无加密成员直接返回；有加密成员但未提供密码时抛出 ArchivePasswordRequired。
+        - 2) 对前 sample 个 ZipCrypto 成员调用 zf.open：zipfile 解密 12 字节加密头并比对校验字节
+             （CRC 高字节或带数据描述符时的修改时间高字节），不匹配即抛出 ArchivePasswordIncorrect。
+             单个校验字节有 1/256 的误判概率，多个成员叠加校验后可忽略。
+        - 3) AES 成员（compress_type 99）zipfile 无法校验，跳过，由调用方的解压器判定。
+
+        业务关联:
+        - 上游: LibraryManager 将加密 ZIP 交给 7z 解压之前调用。
+        - 下游: 密码错误时不产生任何半成品文件。
+        """
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            encrypted = self.encrypted_members(zf)
+            if not encrypted:
+                return
+            if not password:
+                raise ArchivePasswordRequired("ZIP 需要密码")
+            pwd = password.encode("utf-8")
+            checked = 0
+            for member in encrypted:
+                if member.compress_type == 99:
+                    continue
+                try:
+                    with zf.open(member, pwd=pwd):
+                        pass
+                except RuntimeError as e:
+                    if "password" in str(e).lower():
+                        raise ArchivePasswordIncorrect("ZIP 密码错误")
+                    raise
+                checked += 1
+                if checked >= sample:
+                    return
+
+    def extract(self, zip_path, target_dir, progress_callback=None, base_progress=0, share_progress=100, password=None, threads=None, resume=False, include=None):
+        """
+        功能定位:
+        - 将 ZIP 解压到目标目录，并提供进度回调与路径边界校验；大压缩包可按成员拆分到多个线程并行解压。
+
+        输入输出:
+        - 参数:
+          - zip_path: str | Path，ZIP 文件路径。
+          - target_dir: str | Path，目标解压目录（需已存在或可创建）。
+          - progress_callback: Callable[[int, str], None] | None，进度回调。
+          - base_progress/share_progress: float|int，该 ZIP 在总体进度中的起点与占比。
+          - password: str | None，ZIP 密码（若需要）。
+          - threads: int | None，解压线程数；None 时按 CPU 核数自动选择，小压缩包始终单线程。
+          - resume: bool，是否在目标目录写入逐成员断点日志（ExtractJournal），并沿用同一压缩包已有日志中的已完成成员。
+          - include: Callable[[str], bool] | None，成员筛选（见 plan）。
+        - 返回:
+          - dict，包含 files（写入文件数）、bytes（写入字节数）、skipped（被拦截的成员名）、resumed（续传时校验通过而跳过的文件数）、
+            filtered（被 include 排除的 (成员名, 大小)）。
+        - 外部资源/依赖: 文件系统、zipfile
+
+        实现逻辑:
+        - 1) plan 生成计划（被跳过的穿越成员写 WARN 日志）；存在加密成员但未提供密码时，在写入任何文件前抛出 ArchivePasswordRequired。
+        - 2) 预先创建所有目录（有 include 筛选时只创建保留文件的父目录），写入阶段不再逐成员 mkdir。
+        - 3) 单线程：按原顺序逐成员写入。多线程：成员按未压缩大小降序排入队列，各线程独立打开 ZipFile 取任务；
+             任一线程出错时其余线程尽快停止，并优先抛出密码类异常。
+        - 4) resume=True：日志中记录的成员若名称、大小、CRC 与中央目录一致，且磁盘文件大小与 CRC32 校验通过则跳过，
+             其余成员（含写了一半的）重新写入；每个成员写完后追加日志。日志由调用方在导入全部完成后删除。
+
+        业务关联:
+        - 上游: 各资源管理器的导入流程。
+        - 下游: 目标目录中的解压文件。
+        """
+        zip_path = Path(zip_path)
+        target_dir = Path(target_dir)
+        if progress_callback:
+            try:
+                progress_callback(int(base_progress), f"开始解压: {zip_path.name}")
+            except Exception:
+                pass
+
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            plan = self.plan(zf, target_dir, include)
+        files = plan["files"]
+        total_bytes = plan["total_bytes"]
+        for name in plan["skipped"]:
+            self._log(f"[WARN] 拦截恶意路径穿越文件: {name}", "WARN")
+
+        if plan["needs_password"] and not password:
+            raise ArchivePasswordRequired("ZIP 需要密码")
+        pwd = password.encode("utf-8") if password else None
+
+        # 有筛选时只创建保留文件所在目录，被排除内容的空目录不落盘
+        dirs = set(plan["dirs"]) if include is None else set()
+        dirs.update(str(p.parent) for _, _, p in files)
+        for d in sorted(dirs):
+            os.makedirs(d, exist_ok=True)
+
+        journal = None
+        resumed = 0
+        resumed_bytes = 0
+        if resume:
+            journal = ExtractJournal(target_dir)
+            done = journal.begin(zip_path)
+            if done:
+                if progress_callback:
+                    try:
+                        progress_callback(int(base_progress), "校验已解压文件...")
+                    except Exception:
+                        pass
+                remaining = []
+                for item in files:
+                    member = item[0]
+                    if done.get(item[1]) == (int(member.file_size or 0), member.CRC) and self._is_written(member, item[2]):
+                        resumed += 1
+                        resumed_bytes += int(member.file_size or 0)
+                    else:
+                        remaining.append(item)
+                files = remaining
+                self._log(f"[RESUME] 已校验 {resumed} 个已解压文件，从断点继续: {zip_path.name}", "INFO")
+
+        threads = self._thread_count(threads, total_bytes, len(files))
+        state, _on_progress = self._progress_tracker(
+            progress_callback, base_progress, share_progress, total_bytes, len(files) + resumed,
+            done_bytes=resumed_bytes, done_files=resumed,
+        )
+
+        try:
+            self._write_files(zip_path, files, threads, pwd, password, _on_progress, journal)
+        finally:
+            if journal is not None:
+                journal.close()
+
+        if progress_callback:
+            try:
+                progress_callback(int(base_progress + share_progress), "解压完成")
+            except Exception:
+                pass
+        return {
+            "files": state["done"] - resumed,
+            "bytes": state["bytes"] - resumed_bytes,
+            "skipped": plan["skipped"],
+            "resumed": resumed,
+            "filtered": plan["filtered"],
+        }
+
+    def extract_to(self, zip_path, targets, progress_callback=None, base_progress=0, share_progress=100, password=None, threads=None, label="写入"):
+        """
+        功能定位:
+        - 将选定成员直接写到调用方指定的路径（不还原压缩包内的目录结构），用于从压缩包直接安装等扁平化写入场景。
+
+        输入输出:
+        - 参数:
+          - zip_path: str | Path，ZIP 文件路径。
+          - targets: dict[str, str | Path]，成员名（member_names 的结果）-> 写入路径；不在表中的成员不读取。
+          - progress_callback/base_progress/share_progress: 同 extract。
+          - password: str | None，ZIP 密码（若需要）。
+          - threads: int | None，写入线程数（规则同 extract）。
+          - label: str，进度提示前缀。
+        - 返回:
+          - dict，包含 files（写入文件数）、bytes（写入字节数）、missing（表中存在但压缩包中找不到的成员名）。
+        - 外部资源/依赖: 文件系统、zipfile
+
+        实现逻辑:
+        - 1) 按 member_names 匹配成员；写入路径由调用方决定，这里不做路径穿越校验。
+        - 2) 选中成员存在加密且未提供密码时，在写入任何文件前抛出 ArchivePasswordRequired。
+        - 3) 创建父目录后复用 extract 的写入与进度逻辑（成员流式写入目标路径，无中间目录）。
+
+        业务关联:
+        - 上游: core_logic.CoreService.install_from_archive。
+        - 下游: 游戏 sound/mod 中的文件。
+        """
+        zip_path = Path(zip_path)
+        wanted = {name: Path(path) for name, path in targets.items()}
+        files = []
+        total_bytes = 0
+        needs_password = False
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            for member, name in zip(zf.infolist(), self.member_names(zf)):
+                target_path = wanted.pop(name, None)
+                if target_path is None or member.is_dir():
+                    continue
+                if member.flag_bits & 0x1:
+                    needs_password = True
+                files.append((member, name, target_path))
+                total_bytes += int(member.file_size or 0)
+        if needs_password and not password:
+            raise ArchivePasswordRequired("ZIP 需要密码")
+        pwd = password.encode("utf-8") if password else None
+
+        for parent in sorted({str(p.parent) for _, _, p in files}):
+            os.makedirs(parent, exist_ok=True)
+        threads = self._thread_count(threads, total_bytes, len(files))
+        state, on_progress = self._progress_tracker(
+            progress_callback, base_progress, share_progress, total_bytes, len(files), label=label,
+        )
+        self._write_files(zip_path, files, threads, pwd, password, on_progress)
+        return {"files": state["done"], "bytes": state["bytes"], "missing": sorted(wanted)}
+
+    def _thread_count(self, threads, total_bytes, file_count):
+        """确定写入线程数：None 时按 CPU 核数（最多 4）；总量低于 parallel_min_bytes 或文件少于 2 个时单线程。"""
+        if threads is None:
+            threads = min(4, os.cpu_count() or 1)
+        if total_bytes < self.parallel_min_bytes or file_count < 2:
+            threads = 1
+        return max(1, min(int(threads), file_count or 1))
+
+    def _progress_tracker(self, progress_callback, base_progress, share_progress, total_bytes, total_files, done_bytes=0, done_files=0, label="解压中"):
+        """
+        返回 (state, on_progress)：on_progress(nbytes, filename, finished=False) 线程安全地累计已写入字节与文件数，
+        并按 progress_interval 节流调用 progress_callback（按字节比例，总字节为 0 时按文件数比例）。
+        """
+        progress_lock = threading.Lock()
+        state = {"bytes": done_bytes, "done": done_files, "last": 0.0}
+        interval = self.progress_interval
+
+        def _on_progress(nbytes, filename, finished=False):
+            with progress_lock:
+                state["bytes"] += nbytes
+                if finished:
+                    state["done"] += 1
+                if not progress_callback:
+                    return
+                now = time.monotonic()
+                if (now - state["last"]) < interval:
+                    return
+                state["last"] = now
+                if total_bytes > 0:
+                    ratio = state["bytes"] / total_bytes
+                else:
+                    ratio = state["done"] / max(1, total_files)
+            fname = filename
+            if len(fname) > 25:
+                fname = "..." + fname[-25:]
+            try:
+                progress_callback(int(base_progress + min(1.0, ratio) * share_progress), f"{label}: {fname}")
+            except Exception:
+                pass
+
+        return state, _on_progress
+
+    def verify_written(self, zip_path, target_dir, include=None):
+        """
+        功能定位:
+        - 断点续传的外部解压器路径（加密 ZIP 交给 7z）：校验目标目录中已完整写入的成员，并补记到断点日志。
+
+        输入输出:
+        - 参数:
+          - zip_path: str | Path，压缩包路径。
+          - target_dir: str | Path，目标目录（已由调用方写入断点日志头部）。
+          - include: Callable[[str], bool] | None，与 extract 相同的成员筛选。
+        - 返回:
+          - list[str]，已完整写入的成员名（与 member_names 一致）。
+        - 外部资源/依赖: ExtractJournal、磁盘文件 CRC32
+
+        实现逻辑:
+        - 7z 解压过程中无法逐成员写日志，因此在续传前与解压失败后按中央目录的大小与 CRC32 校验磁盘文件（同 extract 的续传校验），
+          通过的成员记入日志：失败后目录因日志非空而保留，下次续传时这些成员被排除在 7z 解压之外。
+
+        业务关联:
+        - 上游: LibraryManager._extract_zip_safely（7z 分支）。
+        - 下游: 7z -x@ 排除列表；LibraryManager._discard_failed_import。
+        """
+        target_dir = Path(target_dir)
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            files = self.plan(zf, target_dir, include)["files"]
+        journal = ExtractJournal(target_dir)
+        done = journal.begin(zip_path)
+        written = []
+        try:
+            for member, name, path in files:
+                if not os.path.isfile(path) or not self._is_written(member, path):
+                    continue
+                written.append(name)
+                entry = (int(member.file_size or 0), member.CRC)
+                if done.get(name) != entry:
+                    journal.record(name, *entry)
+        finally:
+            journal.close()
+        return written
+
+    @staticmethod
+    def _is_written(member, target_path):
+        """续传校验：磁盘文件大小与 CRC32 均与中央目录一致时视为已完整写入。"""
+        try:
+            if os.path.getsize(target_path) != int(member.file_size or 0):
+                return False
+            return file_crc32(target_path) == member.CRC
+        except OSError:
+            return False
+
+    def _write_files(self, zip_path, files, threads, pwd, password, on_progress, journal=None):
+        """按线程数写入成员文件：单线程按原顺序写入；多线程按未压缩大小降序分发，出错时其余线程尽快停止。"""
+        if threads == 1:
+            with zipfile.ZipFile(zip_path, "r") as zf:
+                for member, name, target_path in files:
+                    self._write_member(zf, member, name, target_path, pwd, password, on_progress, journal=journal)
+        else:
+            queue = sorted(files, key=lambda item: int(item[0].file_size or 0), reverse=True)
+            queue.reverse()
+            queue_lock = threading.Lock()
+            stop = threading.Event()
+            errors = []
+
+            def _worker():
+                try:
+                    with zipfile.ZipFile(zip_path, "r") as zf:
+                        while not stop.is_set():
+                            with queue_lock:
+                                if not queue:
+                                    return
+                                member, name, target_path = queue.pop()
+                            self._write_member(zf, member, name, target_path, pwd, password, on_progress, stop, journal)
+                except Exception as e:
+                    with queue_lock:
+                        errors.append(e)
+                    stop.set()
+
+            workers = [threading.Thread(target=_worker, daemon=True) for _ in range(threads)]
+            for t in workers:
+                t.start()
+            for t in workers:
+                t.join()
+            if errors:
+                for e in errors:
+                    if isinstance(e, (ArchivePasswordRequired, ArchivePasswordIncorrect)):
+                        raise e
+                raise errors[0]
+
+    def _write_member(self, zf, member, name, target_path, pwd, password, on_progress, stop=None, journal=None):
+        """
+        功能定位:
+        - 将单个 ZIP 成员按块写入目标路径，并把 zipfile 的密码错误转换为统一的异常类型。
+
+        输入输出:
+        - 参数:
+          - zf: zipfile.ZipFile，当前线程持有的句柄。
+          - member: zipfile.ZipInfo，成员信息。
+          - name: str，成员名（用于进度展示）。
+          - target_path: Path，写入路径（已通过边界校验，父目录已创建）。
+          - pwd/password: bytes|None / str|None，密码。
+          - on_progress: Callable[[int, str, bool], None]，已写入字节数回调。
+          - stop: threading.Event | None，多线程模式下的停止信号。
+          - journal: ExtractJournal | None，断点日志；成员完整写入并关闭后追加记录。
+        - 返回: None
+        - 外部资源/依赖: 文件系统写入
+
+        实现逻辑:
+        - 打开成员（RuntimeError 中含 password 时转换为 ArchivePasswordRequired/Incorrect），按 chunk_size 复制并回调进度。
+
+        业务关联:
+        - 上游: extract。
+        - 下游: 目标目录中的文件。
+        """
+        try:
+            source_file = zf.open(member, pwd=pwd)
+        except RuntimeError as e:
+            if "password" in str(e).lower():
+                if password:
+                    raise ArchivePasswordIncorrect("ZIP 密码错误")
+                raise ArchivePasswordRequired("ZIP 需要密码")
+            raise
+        chunk_size = self.chunk_size
+        with source_file as source, open(target_path, "wb") as target:
+            read = source.read
+            write = target.write
+            while True:
+                if stop is not None and stop.is_set():
+                    return
+                chunk = read(chunk_size)
+                if not chunk:
+                    break
+                write(chunk)
+                on_progress(len(chunk), name)
+        if journal is not None:
+            journal.record(name, member.file_size, member.CRC)
+        on_progress(0, name, True)